@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Sequence
 import uuid
 
 
@@ -22,17 +22,22 @@ class GoalSpec:
     budget: float
     deadline: str
     risk_tolerance: str
-    domains: List[str]
+    domains: Sequence[str]
     created_at: str = field(default_factory=utc_now_iso)
 
+    def __post_init__(self) -> None:
+        self.domains = tuple(self.domains)
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExecutionPolicy:
-    tool_allowances: List[str]
-    resource_limits: Dict[str, Any]
+    """Frozen: policy updates build a new instance instead of editing one in place."""
+
+    tool_allowances: Sequence[str]
+    resource_limits: Mapping[str, Any]
     network_scope: str
     data_scope: str
     rollback_policy: str
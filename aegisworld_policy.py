@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Tuple
 
 from aegisworld_models import ExecutionPolicy
 
 
+DECISION_CACHE_SIZE = 1024
+
+
 @dataclass
 class PolicyDecision:
     allowed: bool
@@ -15,8 +19,40 @@ class PolicyDecision:
         return {"allowed": self.allowed, "reasons": self.reasons}
 
 
+@lru_cache(maxsize=DECISION_CACHE_SIZE, typed=True)
+def _decide(
+    tool_allowances: FrozenSet[str],
+    max_budget: float,
+    max_latency: int,
+    requested_tools: Tuple[str, ...],
+    estimated_cost: float,
+    estimated_latency_ms: int,
+) -> Tuple[str, ...]:
+    """Denial reasons for one canonical request; empty means allowed."""
+    reasons: List[str] = []
+
+    if max_budget and estimated_cost > max_budget:
+        reasons.append(f"budget_exceeded:{estimated_cost}>{max_budget}")
+
+    if max_latency and estimated_latency_ms > max_latency:
+        reasons.append(f"latency_exceeded:{estimated_latency_ms}>{max_latency}")
+
+    if "*" not in tool_allowances:
+        blocked = [tool for tool in requested_tools if tool not in tool_allowances]
+        if blocked:
+            reasons.append(f"blocked_tools:{','.join(blocked)}")
+
+    return tuple(reasons)
+
+
 class PolicyEngine:
-    """Machine-enforced policy checks used by runtime and SecOps loops."""
+    """Machine-enforced policy checks used by runtime and SecOps loops.
+
+    Evaluation is pure in the parts of the policy it reads (tool allowances,
+    ``max_budget`` and ``max_latency_ms``) and in the request, so decisions are
+    memoized on exactly those values. A changed policy produces a new key, so
+    there is nothing to invalidate when an agent's policy is updated.
+    """
 
     def evaluate(
         self,
@@ -25,18 +61,16 @@ class PolicyEngine:
         estimated_cost: float,
         estimated_latency_ms: int,
     ) -> PolicyDecision:
-        reasons: List[str] = []
-
-        max_budget = float(policy.resource_limits.get("max_budget", 0))
-        if max_budget and estimated_cost > max_budget:
-            reasons.append(f"budget_exceeded:{estimated_cost}>{max_budget}")
-
-        max_latency = int(policy.resource_limits.get("max_latency_ms", 0))
-        if max_latency and estimated_latency_ms > max_latency:
-            reasons.append(f"latency_exceeded:{estimated_latency_ms}>{max_latency}")
-
-        blocked = [tool for tool in requested_tools if not policy.allows_tool(tool)]
-        if blocked:
-            reasons.append(f"blocked_tools:{','.join(blocked)}")
+        reasons = _decide(
+            frozenset(policy.tool_allowances),
+            float(policy.resource_limits.get("max_budget", 0)),
+            int(policy.resource_limits.get("max_latency_ms", 0)),
+            tuple(requested_tools),
+            estimated_cost,
+            estimated_latency_ms,
+        )
+        return PolicyDecision(allowed=not reasons, reasons=list(reasons))
 
-        return PolicyDecision(allowed=not reasons, reasons=reasons)
+    @staticmethod
+    def clear_cache() -> None:
+        _decide.cache_clear()
@@ -281,13 +281,19 @@ class AegisWorldService:
             "changes": [c.to_dict() for c in self.changes],
             "cost_ledger": self.cost_ledger,
         }
-        self.state_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Write-then-rename so a crash mid-write never leaves a truncated state file.
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp_path.write_bytes(json.dumps(payload, indent=2).encode("utf-8"))
+        tmp_path.replace(self.state_path)
 
     def _load_state(self) -> None:
         if not self.state_path.exists():
             return
 
-        data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        raw = self.state_path.read_bytes()
+        if not raw.strip():
+            return
+        data = json.loads(raw)
 
         for g in data.get("goals", []):
             goal = GoalSpec(**g)
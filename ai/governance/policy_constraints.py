@@ -57,6 +57,9 @@ NON_NEGOTIABLE_CONSTRAINTS: tuple[PolicyConstraint, ...] = (
     ),
 )
 
+NON_NEGOTIABLE_CONSTRAINT_IDS: frozenset[str] = frozenset(
+    constraint.id for constraint in NON_NEGOTIABLE_CONSTRAINTS
+)
 
 HIGH_RISK_CATEGORIES: frozenset[RiskCategory] = frozenset(
     {
@@ -86,6 +89,4 @@ def validate_constraints(asserted_constraint_ids: Iterable[str]) -> List[str]:
         Missing constraint IDs. Empty list means all required constraints are present.
     """
 
-    asserted = set(asserted_constraint_ids)
-    required = {constraint.id for constraint in NON_NEGOTIABLE_CONSTRAINTS}
-    return sorted(required - asserted)
+    return sorted(NON_NEGOTIABLE_CONSTRAINT_IDS.difference(asserted_constraint_ids))
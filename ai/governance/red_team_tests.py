@@ -81,3 +81,6 @@ def scenario_ids(scenarios: Iterable[RedTeamScenario]) -> List[str]:
     """Extract stable scenario IDs for reporting and CI gates."""
 
     return [scenario.id for scenario in scenarios]
+
+
+RED_TEAM_SCENARIO_IDS: tuple[str, ...] = tuple(scenario_ids(RED_TEAM_SCENARIOS))
@@ -41,7 +41,10 @@ class GeneratedPatch:
     prompt_version: str
     prompt_text: str
     diff: str
-    target_files: list[str]
+    target_files: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        self.target_files = tuple(self.target_files)
 
 
 @dataclass
@@ -51,7 +54,10 @@ class PatchProposal:
     prompt_version: str
     prompt: str
     proposed_diff: str
-    target_files: list[str]
+    target_files: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        self.target_files = tuple(self.target_files)
 
 
 def as_generated_patch(proposal: PatchProposal | GeneratedPatch) -> GeneratedPatch:
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
 from typing import Protocol
 
 from .models import GeneratedPatch, MetricsSnapshot, ObjectiveScores
@@ -18,18 +21,38 @@ class PatchConstraints:
     allow_config_changes: bool = True
 
 
+RESPONSE_CACHE_SIZE = 256
+
+_TARGET_HEADER = re.compile(r"^\+\+\+ b/([^\r\n]*)", re.MULTILINE)
+
+
+@lru_cache(maxsize=8)
+def _diff_targets(diff: str) -> tuple[str, ...]:
+    """Target paths named by ``+++ b/`` headers; repeated diffs are parsed once."""
+    return tuple(_TARGET_HEADER.findall(diff))
+
+
 class PatchGenerator:
-    """Builds constrained patch prompts and queries model for candidate diff."""
+    """Builds constrained patch prompts and queries model for candidate diff.
+
+    With ``cache_responses`` the model answer is kept per prompt digest, so a
+    replayed iteration with identical metrics and scores reuses the earlier
+    diff instead of querying the model again. It is off by default because a
+    sampling model may legitimately answer the same prompt differently.
+    """
 
     def __init__(
         self,
         model_client: PatchModelClient,
         prompt_version: str = "v1",
         constraints: PatchConstraints | None = None,
+        cache_responses: bool = False,
     ) -> None:
         self.model_client = model_client
         self.prompt_version = prompt_version
         self.constraints = constraints or PatchConstraints()
+        self.cache_responses = cache_responses
+        self._responses: dict[bytes, str] = {}
 
     def build_prompt(self, metrics: MetricsSnapshot, scores: ObjectiveScores) -> str:
         return (
@@ -48,14 +71,22 @@ class PatchGenerator:
 
     def generate(self, metrics: MetricsSnapshot, scores: ObjectiveScores) -> GeneratedPatch:
         prompt = self.build_prompt(metrics, scores)
-        diff = self.model_client.complete(prompt)
-        targets = []
-        for line in diff.splitlines():
-            if line.startswith("+++ b/"):
-                targets.append(line.replace("+++ b/", "", 1))
+        diff = self._complete(prompt)
         return GeneratedPatch(
             prompt_version=self.prompt_version,
             prompt_text=prompt,
             diff=diff,
-            target_files=targets,
+            target_files=_diff_targets(diff),
         )
+
+    def _complete(self, prompt: str) -> str:
+        if not self.cache_responses:
+            return self.model_client.complete(prompt)
+
+        key = blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        diff = self._responses.get(key)
+        if diff is None:
+            if len(self._responses) >= RESPONSE_CACHE_SIZE:
+                self._responses.clear()
+            diff = self._responses[key] = self.model_client.complete(prompt)
+        return diff
@@ -1,37 +1,73 @@
 from __future__ import annotations
 
 import subprocess
-from typing import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence, Union
 
 from .models import GeneratedPatch, PatchProposal, VerificationResults, as_generated_patch
 
+# A check is a shell command, or an in-process callable returning (passed, output).
+Check = Union[str, Callable[[], "tuple[bool, str]"]]
+
+MAX_PARALLEL_CHECKS = 8
+
 
 class PatchVerifier:
-    """Runs static and simulation checks for generated patches."""
+    """Runs static and simulation checks for generated patches.
+
+    Shell commands run in ``workdir`` and pass on a zero exit status. Callable
+    checks run in-process, which avoids an interpreter start-up per check when
+    the check is itself Python; a callable that raises counts as failed.
+
+    Checks run one after another in the order given, since commands sharing
+    ``workdir`` may depend on each other. With ``parallel_checks=True`` the
+    checks of one list run concurrently on a small thread pool instead (each
+    shell check spends its time waiting on a subprocess); only enable it for
+    checks known to be independent. Reports keep the given order either way.
+    """
 
     def __init__(
         self,
-        static_checks: Sequence[str] | None = None,
-        simulation_checks: Sequence[str] | None = None,
+        static_checks: Sequence[Check] | None = None,
+        simulation_checks: Sequence[Check] | None = None,
         workdir: str = ".",
+        parallel_checks: bool = False,
     ) -> None:
         self.static_checks = list(static_checks or ["python -m compileall ai"])
         self.simulation_checks = list(simulation_checks or ["python -m unittest discover -s tests"])
         self.workdir = workdir
+        self.parallel_checks = parallel_checks
+
+    def _run_check(self, check: Check) -> tuple[bool, str, str]:
+        if callable(check):
+            label = getattr(check, "__name__", repr(check))
+            try:
+                passed, output = check()
+            except Exception as exc:
+                return False, label, f"{type(exc).__name__}: {exc}"
+            return passed, label, output
+
+        proc = subprocess.run(
+            check,
+            shell=True,
+            cwd=self.workdir,
+            capture_output=True,
+            text=True,
+        )
+        return proc.returncode == 0, check, f"{proc.stdout}{proc.stderr}"
+
+    def _run_commands(self, commands: Sequence[Check]) -> tuple[bool, str]:
+        if self.parallel_checks and len(commands) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CHECKS, len(commands))) as pool:
+                results = list(pool.map(self._run_check, commands))
+        else:
+            results = [self._run_check(command) for command in commands]
 
-    def _run_commands(self, commands: Sequence[str]) -> tuple[bool, str]:
         outputs = []
         all_passed = True
-        for command in commands:
-            proc = subprocess.run(
-                command,
-                shell=True,
-                cwd=self.workdir,
-                capture_output=True,
-                text=True,
-            )
-            outputs.append(f"$ {command}\n{proc.stdout}{proc.stderr}".strip())
-            if proc.returncode != 0:
+        for passed, label, output in results:
+            outputs.append(f"$ {label}\n{output}".strip())
+            if not passed:
                 all_passed = False
         return all_passed, "\n\n".join(outputs)
 
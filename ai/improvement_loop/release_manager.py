@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable
 
 from ai.governance import objective_spec, policy_constraints, red_team_tests
@@ -18,6 +19,16 @@ class ReleasePolicy:
     max_canary_fraction: float = 0.5
 
 
+@lru_cache(maxsize=256)
+def _classify_policy(
+    declared_constraint_ids: frozenset[str], risk_categories: frozenset[RiskCategory]
+) -> tuple[tuple[str, ...], bool]:
+    """Missing constraint IDs and the human-approval requirement for one proposal shape."""
+    return (
+        tuple(policy_constraints.validate_constraints(declared_constraint_ids)),
+        policy_constraints.requires_human_approval(risk_categories),
+    )
+
 
 class ReleaseManager:
     """Decides canary rollout fraction and rollback pointer."""
@@ -54,8 +65,10 @@ class ReleaseManager:
             economy_inflation_delta_pct=economy_inflation_delta_pct,
         )
 
-        missing_constraints = policy_constraints.validate_constraints(declared_constraint_ids)
-        needs_human_approval = policy_constraints.requires_human_approval(risk_categories)
+        missing, needs_human_approval = _classify_policy(
+            frozenset(declared_constraint_ids), frozenset(risk_categories)
+        )
+        missing_constraints = list(missing)
 
         provided_scenarios = set(red_team_scenario_ids or [])
         for category in red_team_categories or []:
@@ -63,8 +76,7 @@ class ReleaseManager:
                 red_team_tests.scenario_ids(red_team_tests.scenarios_for(category))
             )
 
-        required_scenarios = red_team_tests.scenario_ids(red_team_tests.RED_TEAM_SCENARIOS)
-        red_team_coverage_ok = all(scenario in provided_scenarios for scenario in required_scenarios)
+        red_team_coverage_ok = provided_scenarios.issuperset(red_team_tests.RED_TEAM_SCENARIO_IDS)
 
         rationale: list[str] = []
         if composite_score < self.policy.min_governance_score:
@@ -100,7 +112,7 @@ class ReleaseManager:
             missing_constraints=missing_constraints,
             requires_human_approval=needs_human_approval,
             human_approval_granted=human_approval_granted,
-            required_red_team_scenarios=required_scenarios,
+            required_red_team_scenarios=list(red_team_tests.RED_TEAM_SCENARIO_IDS),
             provided_red_team_scenarios=sorted(provided_scenarios),
         )
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import Iterable
 
 from .models import MetricsSnapshot, utc_now_iso
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SessionEvent:
     session_id: str
     day_retained: int
@@ -32,19 +33,25 @@ class TelemetryCollector:
                 active_sessions=0,
             )
 
-        retention_d1 = sum(1 for e in events if e.day_retained >= 1) / active_sessions
-        retention_d7 = sum(1 for e in events if e.day_retained >= 7) / active_sessions
-        quest_completion_rate = sum(1 for e in events if e.quest_completed) / active_sessions
-
-        death_causes: dict[str, int] = {}
+        retained_d1 = retained_d7 = completed = 0
+        economy_delta = 0.0
+        death_causes: Counter[str] = Counter()
         for event in events:
+            if event.day_retained >= 1:
+                retained_d1 += 1
+                if event.day_retained >= 7:
+                    retained_d7 += 1
+            if event.quest_completed:
+                completed += 1
             if event.death_cause:
-                death_causes[event.death_cause] = death_causes.get(event.death_cause, 0) + 1
+                death_causes[event.death_cause] += 1
+            economy_delta += event.economy_delta_pct
 
-        top_death_causes = dict(
-            sorted(death_causes.items(), key=lambda kv: kv[1], reverse=True)[:5]
-        )
-        economy_inflation_index = sum(e.economy_delta_pct for e in events) / active_sessions
+        retention_d1 = retained_d1 / active_sessions
+        retention_d7 = retained_d7 / active_sessions
+        quest_completion_rate = completed / active_sessions
+        top_death_causes = dict(death_causes.most_common(5))
+        economy_inflation_index = economy_delta / active_sessions
 
         return MetricsSnapshot(
             timestamp=utc_now_iso(),
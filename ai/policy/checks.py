@@ -1,20 +1,30 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 from .models import GateResult, PatchManifest, PolicyConfig
 
 
+@lru_cache(maxsize=32)
+def _marker_pattern(markers: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation over the lowered markers, so clean content is a single scan."""
+    return re.compile("|".join(re.escape(marker.lower()) for marker in markers))
+
+
 def allowed_modification_check(manifest: PatchManifest, config: PolicyConfig) -> GateResult:
+    prefixes = tuple(config.allowed_file_prefixes)
     for path in manifest.changed_files:
-        if not any(path.startswith(prefix) for prefix in config.allowed_file_prefixes):
+        if not path.startswith(prefixes):
             return GateResult(
                 name="allowed_modification_policy",
                 passed=False,
                 reason=f"File '{path}' is outside allowed prefixes.",
             )
 
-    forbidden_domains = [d for d in manifest.changed_domains if d not in config.allowed_domains]
+    allowed_domains = frozenset(config.allowed_domains)
+    forbidden_domains = [d for d in manifest.changed_domains if d not in allowed_domains]
     if forbidden_domains:
         return GateResult(
             name="allowed_modification_policy",
@@ -121,9 +131,12 @@ def performance_budget_gate(manifest: PatchManifest, config: PolicyConfig) -> Ga
 
 
 def prompt_injection_security_gate(manifest: PatchManifest, config: PolicyConfig) -> GateResult:
+    markers = tuple(config.prompt_injection_markers)
     lowered = manifest.user_content.lower()
-    suspicious = [marker for marker in config.prompt_injection_markers if marker.lower() in lowered]
-    if suspicious:
+    # Alternation matches can hide overlapping markers, so the per-marker
+    # report is only built once the combined pattern has found something.
+    if markers and _marker_pattern(markers).search(lowered):
+        suspicious = [marker for marker in markers if marker.lower() in lowered]
         return GateResult(
             name="prompt_injection_security_gate",
             passed=False,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .checks import (
     allowed_modification_check,
@@ -22,18 +22,32 @@ class PatchPolicyEngine:
     def __init__(self, config: PolicyConfig) -> None:
         self.config = config
 
+    def iter_gates(self, manifest: PatchManifest, stop_on: Optional[str] = None) -> Iterator[GateResult]:
+        """Yield gate results in evaluation order, running each gate only when it is reached.
+
+        With ``stop_on`` set, iteration ends after the gate of that name, so a
+        caller interested in one gate skips evaluating the ones after it.
+        """
+
+        config = self.config
+        for gate in (
+            lambda: validate_patch_manifest_schema(manifest),
+            lambda: allowed_modification_check(manifest, config),
+            lambda: forbidden_api_check(manifest, config),
+            lambda: static_analysis_gate(manifest),
+            lambda: deterministic_replay_gate(manifest),
+            lambda: save_compatibility_gate(manifest, config),
+            lambda: performance_budget_gate(manifest, config),
+            lambda: prompt_injection_security_gate(manifest, config),
+            lambda: canary_telemetry_gate(manifest, config),
+        ):
+            result = gate()
+            yield result
+            if result.name == stop_on:
+                return
+
     def evaluate(self, manifest: PatchManifest, revert_callback: Optional[RevertCallback] = None) -> EvaluationReport:
-        gates: List[GateResult] = [
-            validate_patch_manifest_schema(manifest),
-            allowed_modification_check(manifest, self.config),
-            forbidden_api_check(manifest, self.config),
-            static_analysis_gate(manifest),
-            deterministic_replay_gate(manifest),
-            save_compatibility_gate(manifest, self.config),
-            performance_budget_gate(manifest, self.config),
-            prompt_injection_security_gate(manifest, self.config),
-            canary_telemetry_gate(manifest, self.config),
-        ]
+        gates: List[GateResult] = list(self.iter_gates(manifest))
 
         failed = [gate for gate in gates if not gate.passed]
         if failed:
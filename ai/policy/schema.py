@@ -23,21 +23,25 @@ PATCH_MANIFEST_SCHEMA: Dict[str, object] = {
     }
 }
 
+# Flattened once at import so validation is a single ordered pass with one lookup per field.
+_REQUIRED_FIELDS = tuple(PATCH_MANIFEST_SCHEMA["required"].items())
+_STRING_LIST_FIELDS = ("changed_files", "changed_domains", "imported_symbols", "replay_run_hashes")
+_MISSING = object()
+
 
 def validate_patch_manifest_schema(manifest: PatchManifest) -> GateResult:
     """Validate that the dataclass payload has required types and shape."""
 
-    required = PATCH_MANIFEST_SCHEMA["required"]
     payload = vars(manifest)
-    for field_name, expected_type in required.items():
-        if field_name not in payload:
+    for field_name, expected_type in _REQUIRED_FIELDS:
+        value = payload.get(field_name, _MISSING)
+        if value is _MISSING:
             return GateResult(
                 name="schema_validation",
                 passed=False,
                 reason=f"Missing required field: {field_name}",
             )
 
-        value = payload[field_name]
         if not isinstance(value, expected_type):
             return GateResult(
                 name="schema_validation",
@@ -48,8 +52,7 @@ def validate_patch_manifest_schema(manifest: PatchManifest) -> GateResult:
                 ),
             )
 
-    list_fields = ("changed_files", "changed_domains", "imported_symbols", "replay_run_hashes")
-    for field_name in list_fields:
+    for field_name in _STRING_LIST_FIELDS:
         if not all(isinstance(item, str) for item in payload[field_name]):
             return GateResult(
                 name="schema_validation",
@@ -57,14 +60,15 @@ def validate_patch_manifest_schema(manifest: PatchManifest) -> GateResult:
                 reason=f"Field '{field_name}' must contain only strings.",
             )
 
-    if not all(isinstance(metric_name, str) for metric_name in payload["canary_telemetry"].keys()):
+    telemetry = payload["canary_telemetry"]
+    if not all(isinstance(metric_name, str) for metric_name in telemetry):
         return GateResult(
             name="schema_validation",
             passed=False,
             reason="Canary telemetry metric names must be strings.",
         )
 
-    if not all(isinstance(value, (int, float)) for value in payload["canary_telemetry"].values()):
+    if not all(isinstance(value, (int, float)) for value in telemetry.values()):
         return GateResult(
             name="schema_validation",
             passed=False,
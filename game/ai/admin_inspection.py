@@ -7,10 +7,12 @@ from urllib.parse import parse_qs, urlparse
 
 from game.ai.policy_guard import audit_summary, read_recent_audit_entries
 
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class AuditInspectionHandler(BaseHTTPRequestHandler):
     def _json(self, code: int, payload: dict) -> None:
-        body = json.dumps(payload).encode("utf-8")
+        body = _encode_json(payload).encode("utf-8")
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
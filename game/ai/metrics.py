@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KPIThresholds:
     """Target and guardrail values used by the deployment validator."""
 
@@ -14,7 +14,7 @@ class KPIThresholds:
     min_npc_interaction_quality: float = 0.72
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KPIReadings:
     """Measured KPI values for one evaluation window."""
 
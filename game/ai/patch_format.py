@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
 
 import json
 
@@ -13,7 +13,7 @@ _ALLOWED_SCOPES = {"behavior", "policy"}
 _ALLOWED_OPS = {"set", "increment", "decrement", "append", "remove"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeltaOperation:
     scope: str
     target: str
@@ -29,22 +29,22 @@ class DeltaOperation:
             raise ValueError("code mutation targets are blocked")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AIPatch:
     patch_id: str
     parent_patch_id: str | None
     created_at: str
     rationale: str
-    deltas: list[DeltaOperation] = field(default_factory=list)
+    deltas: tuple[DeltaOperation, ...] = ()
 
     @classmethod
-    def new(cls, patch_id: str, rationale: str, deltas: list[DeltaOperation], parent_patch_id: str | None = None) -> "AIPatch":
+    def new(cls, patch_id: str, rationale: str, deltas: Iterable[DeltaOperation], parent_patch_id: str | None = None) -> "AIPatch":
         return cls(
             patch_id=patch_id,
             parent_patch_id=parent_patch_id,
             created_at=datetime.now(timezone.utc).isoformat(),
             rationale=rationale,
-            deltas=deltas,
+            deltas=tuple(deltas),
         )
 
     def validate(self) -> None:
@@ -77,7 +77,7 @@ class AIPatch:
 
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> "AIPatch":
-        deltas = [DeltaOperation(**raw) for raw in payload.get("deltas", [])]
+        deltas = tuple(DeltaOperation(**raw) for raw in payload.get("deltas", ()))
         patch = cls(
             patch_id=payload["patch_id"],
             parent_patch_id=payload.get("parent_patch_id"),
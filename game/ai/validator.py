@@ -21,14 +21,14 @@ class PerformanceBudget:
     max_memory_mb: float = 128.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationResult:
     scenario: str
     success: bool
     details: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeStats:
     cpu_ms_per_tick: float
     memory_mb: float
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
@@ -7,29 +8,73 @@ from game.ai.controllers import KeyboardAgentController, SimpleSelfImprovementPi
 from game.systems.save_system import load_game, save_game
 from game.ui.camera import render_camera
 from game.world.generator import FlatWorldGenerator
-from game.world.models import Player, Position
+from game.world.models import Player, Position, World
 
 
-def run_game_loop(save_path: Path = Path("savegame.json"), command_script: Iterable[str] | None = None) -> None:
-    world_generator = FlatWorldGenerator()
-    controller = KeyboardAgentController()
-    learning = SimpleSelfImprovementPipeline()
+@dataclass
+class GameSession:
+    """World, player and per-run agents driven by the sandbox commands."""
+
+    world: World
+    player: Player
+    save_path: Path
+    controller: KeyboardAgentController = field(default_factory=KeyboardAgentController)
+    learning: SimpleSelfImprovementPipeline = field(default_factory=SimpleSelfImprovementPipeline)
+
 
+def start_session(save_path: Path) -> tuple[GameSession, str]:
+    """Load ``save_path`` if it exists, otherwise generate a fresh sandbox world."""
     if save_path.exists():
         world, player = load_game(save_path)
-        print(f"Loaded world '{world.name}' from {save_path}.")
-    else:
-        world = world_generator.generate(name="sandbox", seed=42)
-        player = Player(name="player-1", position=Position(x=world.width // 2, y=world.height // 2))
-        print(f"World '{world.name}' loaded. Player spawned at ({player.position.x}, {player.position.y}).")
+        return GameSession(world, player, save_path), f"Loaded world '{world.name}' from {save_path}."
+
+    world = FlatWorldGenerator().generate(name="sandbox", seed=42)
+    player = Player(name="player-1", position=Position(x=world.width // 2, y=world.height // 2))
+    message = f"World '{world.name}' loaded. Player spawned at ({player.position.x}, {player.position.y})."
+    return GameSession(world, player, save_path), message
+
+
+def process_command(session: GameSession, command: str) -> tuple[bool, str]:
+    """Apply one normalized command; returns ``(keep_running, message)`` without any prompt IO."""
+    if command == "quit":
+        return False, "Exiting sandbox."
+    if command == "save":
+        save_game(session.world, session.player, session.save_path)
+        return True, f"Saved to {session.save_path}."
+    if command == "load":
+        if not session.save_path.exists():
+            return True, "No save file found."
+        session.world, session.player = load_game(session.save_path)
+        return True, f"Loaded from {session.save_path}."
 
+    player = session.player
+    dx, dy = session.controller.decide(player, session.world, command)
+    player.position.move(dx, dy)
+    session.world.clamp(player.position)
+    session.learning.record_tick(command, (player.position.x, player.position.y))
+    session.learning.run_cycle()
+    return True, f"Player at ({player.position.x}, {player.position.y})"
+
+
+def apply_command_script(session: GameSession, command_script: Iterable[str]) -> GameSession:
+    """Run scripted commands headlessly (no camera rendering or printing), stopping at ``quit``."""
+    for raw in command_script:
+        keep_running, _message = process_command(session, raw.strip().lower())
+        if not keep_running:
+            break
+    return session
+
+
+def run_game_loop(save_path: Path = Path("savegame.json"), command_script: Iterable[str] | None = None) -> None:
+    session, message = start_session(save_path)
+    print(message)
     print("Commands: w/a/s/d move, save, load, quit")
 
     scripted_commands = iter(command_script) if command_script is not None else None
 
     while True:
         print("\nCamera view:")
-        print(render_camera(world, player))
+        print(render_camera(session.world, session.player))
         if scripted_commands is None:
             command = input("> ").strip().lower()
         else:
@@ -40,24 +85,7 @@ def run_game_loop(save_path: Path = Path("savegame.json"), command_script: Itera
                 print("Command script exhausted. Exiting sandbox.")
                 break
 
-        if command == "quit":
-            print("Exiting sandbox.")
+        keep_running, message = process_command(session, command)
+        print(message)
+        if not keep_running:
             break
-        if command == "save":
-            save_game(world, player, save_path)
-            print(f"Saved to {save_path}.")
-            continue
-        if command == "load":
-            if save_path.exists():
-                world, player = load_game(save_path)
-                print(f"Loaded from {save_path}.")
-            else:
-                print("No save file found.")
-            continue
-
-        dx, dy = controller.decide(player, world, command)
-        player.position.move(dx, dy)
-        world.clamp(player.position)
-        learning.record_tick(command, (player.position.x, player.position.y))
-        learning.run_cycle()
-        print(f"Player at ({player.position.x}, {player.position.y})")
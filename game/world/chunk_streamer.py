@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Protocol, Set, Tuple
+from typing import Dict, Iterable, Optional, Protocol, Set, Tuple
 
 from .terrain_generator import TerrainChunk, TerrainGenerator
 
@@ -44,11 +44,19 @@ class ChunkStreamer:
         self.view_distance_chunks = view_distance_chunks
         self.lifecycle_hooks = list(lifecycle_hooks)
         self.loaded_chunks: Dict[ChunkCoord, LoadedChunk] = {}
+        # (player chunk, view distance) the loaded window was last built for.
+        self._window_key: Optional[Tuple[ChunkCoord, int]] = None
 
     def update_player_position(self, world_x: float, world_y: float, chunk_size: int = 16) -> None:
         player_chunk = (int(world_x // chunk_size), int(world_y // chunk_size))
+        window_key = (player_chunk, self.view_distance_chunks)
+        # Most position updates stay inside the current chunk; skip rebuilding the window.
+        if window_key == self._window_key:
+            return
+        self._window_key = window_key
+
         target = self._chunk_window(player_chunk)
-        current: Set[ChunkCoord] = set(self.loaded_chunks.keys())
+        current = self.loaded_chunks.keys()
 
         to_load = sorted(target - current)
         to_unload = sorted(current - target)
@@ -23,34 +23,47 @@ class EntityRecord:
 
 
 class EntityRegistry:
-    """Tracks NPCs, fauna, and resources by chunk."""
+    """Tracks NPCs, fauna, and resources by chunk.
+
+    Chunk and type indexes are insertion-ordered dicts keyed by entity ID, so both
+    lookups read one bucket and removals are O(1) instead of scanning a list. The
+    bucket keys are recorded at upsert time, since callers may mutate a record
+    after registering it.
+    """
 
     def __init__(self) -> None:
         self._by_id: Dict[str, EntityRecord] = {}
-        self._by_chunk: Dict[Tuple[int, int], List[str]] = {}
+        self._by_chunk: Dict[Tuple[int, int], Dict[str, EntityRecord]] = {}
+        self._by_type: Dict[EntityType, Dict[str, EntityRecord]] = {}
+        self._keys: Dict[str, Tuple[Tuple[int, int], EntityType]] = {}
 
     def upsert(self, record: EntityRecord) -> None:
         if record.entity_id in self._by_id:
             self.remove(record.entity_id)
 
+        chunk_key = (record.chunk_x, record.chunk_y)
         self._by_id[record.entity_id] = record
-        self._by_chunk.setdefault((record.chunk_x, record.chunk_y), []).append(record.entity_id)
+        self._keys[record.entity_id] = (chunk_key, record.entity_type)
+        self._by_chunk.setdefault(chunk_key, {})[record.entity_id] = record
+        self._by_type.setdefault(record.entity_type, {})[record.entity_id] = record
 
     def remove(self, entity_id: str) -> None:
-        existing = self._by_id.pop(entity_id, None)
-        if not existing:
+        if self._by_id.pop(entity_id, None) is None:
             return
 
-        key = (existing.chunk_x, existing.chunk_y)
-        ids = self._by_chunk.get(key, [])
-        if entity_id in ids:
-            ids.remove(entity_id)
-        if not ids and key in self._by_chunk:
-            del self._by_chunk[key]
+        chunk_key, entity_type = self._keys.pop(entity_id)
+        in_chunk = self._by_chunk[chunk_key]
+        del in_chunk[entity_id]
+        if not in_chunk:
+            del self._by_chunk[chunk_key]
+
+        of_type = self._by_type[entity_type]
+        del of_type[entity_id]
+        if not of_type:
+            del self._by_type[entity_type]
 
     def entities_in_chunk(self, chunk_x: int, chunk_y: int) -> List[EntityRecord]:
-        ids = self._by_chunk.get((chunk_x, chunk_y), [])
-        return [self._by_id[entity_id] for entity_id in ids]
+        return list(self._by_chunk.get((chunk_x, chunk_y), {}).values())
 
     def list_by_type(self, entity_type: EntityType) -> List[EntityRecord]:
-        return [record for record in self._by_id.values() if record.entity_type == entity_type]
+        return list(self._by_type.get(entity_type, {}).values())
@@ -7,7 +7,8 @@ from game.world.state_schema import CURRENT_SCHEMA_VERSION
 MigrationFn = Callable[[Dict[str, Any]], Dict[str, Any]]
 
 
-# Map "from_version" -> migration function to next version.
+# Map "from_version" -> migration function to next version. Migrations receive a copy
+# owned by migrate_world_state and may update it in place.
 MIGRATIONS: dict[int, MigrationFn] = {}
 
 
@@ -20,12 +21,18 @@ def register(from_version: int) -> Callable[[MigrationFn], MigrationFn]:
 
 
 def migrate_world_state(payload: Dict[str, Any], target_version: int = CURRENT_SCHEMA_VERSION) -> Dict[str, Any]:
-    state = dict(payload)
-    version = state.get("schema_version", 1)
+    """Upgrade ``payload`` step by step to ``target_version``.
 
+    Payloads already at ``target_version`` are returned as is. Otherwise the payload is
+    copied once and each registered migration updates that private copy in place.
+    """
+    version = payload.get("schema_version", 1)
     if version > target_version:
         raise ValueError(f"Cannot downgrade schema from {version} to {target_version}")
+    if version == target_version:
+        return payload
 
+    state = dict(payload)
     while version < target_version:
         migration = MIGRATIONS.get(version)
         if migration is None:
@@ -1,15 +1,78 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from hashlib import blake2b
+import json
+from operator import itemgetter
+import time
+from typing import Any, Dict, List, Tuple
 
 
 CURRENT_SCHEMA_VERSION = 2
+SCHEMA_VERSION = CURRENT_SCHEMA_VERSION
+
+_NOW_RESOLUTION_SECONDS = 1e-3
+_last_now: Tuple[float, str] = (0.0, "")
 
 
 def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """Current UTC time as ISO-8601, reused for calls within the same millisecond."""
+    global _last_now
+    now = time.time()
+    cached_at, iso = _last_now
+    if 0.0 <= now - cached_at < _NOW_RESOLUTION_SECONDS:
+        return iso
+    iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    # One tuple assignment, so concurrent readers never see a mismatched pair.
+    _last_now = (now, iso)
+    return iso
+
+
+now_iso = _utc_now_iso
+
+
+_entity_id = itemgetter("entity_id")
+
+
+def _in_order(keys: List[Any]) -> bool:
+    return all(keys[index] <= keys[index + 1] for index in range(len(keys) - 1))
+
+
+def _sorted_mapping(mapping: Mapping[str, Any]) -> Dict[str, Any]:
+    keys = list(mapping)
+    if _in_order(keys):
+        # Already canonical: a plain C-level copy, no sort or key list rebuild.
+        return dict(mapping)
+    return {key: mapping[key] for key in sorted(keys)}
+
+
+def _normalize_entity(entity: Mapping[str, Any]) -> Dict[str, Any]:
+    normalized = _sorted_mapping(entity)
+    attributes = normalized.get("attributes")
+    if isinstance(attributes, Mapping):
+        normalized["attributes"] = _sorted_mapping(attributes)
+    return normalized
+
+
+def normalize_world_state(state: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the canonical dict form of a list-of-entities world state.
+
+    Entities are ordered by ``entity_id`` and every mapping is key-sorted. The result is
+    built from fresh containers on every call; inputs that are already in canonical order
+    skip the sorts.
+    """
+    entities = state.get("entities")
+    normalized = dict(state)
+    normalized["world_id"] = state.get("world_id", "default-world")
+    normalized["tick"] = int(state.get("tick", 0))
+    normalized_entities = [_normalize_entity(entity) for entity in entities or ()]
+    if not _in_order([_entity_id(entity) for entity in normalized_entities]):
+        normalized_entities.sort(key=_entity_id)
+    normalized["entities"] = normalized_entities
+    normalized["metadata"] = _sorted_mapping(state.get("metadata") or {})
+    return normalized
 
 
 @dataclass(slots=True)
@@ -25,6 +88,12 @@ class WorldState:
     created_at: str = field(default_factory=_utc_now_iso)
     updated_at: str = field(default_factory=_utc_now_iso)
 
+    def fingerprint(self) -> str:
+        """Content digest of the state, ignoring timestamps; equal states share a fingerprint."""
+        content = (self.schema_version, self.world_version, self.seed, self.tick, self.entities, self.metadata)
+        canonical = json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return blake2b(canonical, digest_size=16).hexdigest()
+
     def to_dict(self) -> Dict[str, Any]:
         self.updated_at = _utc_now_iso()
         return {
@@ -40,6 +109,7 @@ class WorldState:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "WorldState":
+        # Timestamp defaults are only generated when the key is actually missing.
         return cls(
             schema_version=payload["schema_version"],
             world_version=payload["world_version"],
@@ -47,8 +117,8 @@ class WorldState:
             tick=payload["tick"],
             entities=payload.get("entities", {}),
             metadata=payload.get("metadata", {}),
-            created_at=payload.get("created_at", _utc_now_iso()),
-            updated_at=payload.get("updated_at", _utc_now_iso()),
+            created_at=payload["created_at"] if "created_at" in payload else _utc_now_iso(),
+            updated_at=payload["updated_at"] if "updated_at" in payload else _utc_now_iso(),
         )
 
 
@@ -81,5 +151,29 @@ class WorldDiff:
             target_world_version=payload["target_world_version"],
             tick=payload["tick"],
             operations=payload.get("operations", []),
-            created_at=payload.get("created_at", _utc_now_iso()),
+            created_at=payload["created_at"] if "created_at" in payload else _utc_now_iso(),
         )
+
+
+@dataclass(slots=True)
+class SnapshotEnvelope:
+    """Signed full-state snapshot written by ``WorldPersistenceManager``."""
+
+    snapshot_id: str
+    created_at: str
+    state: Dict[str, Any]
+    state_hash: str
+    signature: str
+
+
+@dataclass(slots=True)
+class DiffEnvelope:
+    """Signed entity-level diff written by ``WorldPersistenceManager``."""
+
+    diff_id: str
+    snapshot_id: str
+    tick: int
+    created_at: str
+    changes: Dict[str, Any]
+    diff_hash: str
+    signature: str
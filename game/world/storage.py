@@ -3,6 +3,10 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+import mmap
+import zlib
+from collections import OrderedDict
+from dataclasses import fields
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -10,6 +14,26 @@ from game.world.migrations import migrate_world_state
 from game.world.state_schema import CURRENT_SCHEMA_VERSION, WorldDiff, WorldState
 
 
+REBUILD_CACHE_SIZE = 8
+# Tag written into each record's integrity block; untagged records predate it and carry
+# a SHA-256 digest plus an HMAC-SHA256 signature instead.
+MAC_ALGORITHM = "blake2b16"
+
+_RECORD_PREFIX = b'{"integrity":'
+_PAYLOAD_MARKER = b',"payload":'
+_COMPRESSED_SUFFIX = ".z"
+# Preset zlib dictionary seeded with the diff record vocabulary (most frequent strings last),
+# so even single small diffs compress. Changing it makes existing .json.z diffs unreadable.
+_DIFF_ZDICT = (
+    b'"created_at":"T::.+00:00","schema_version":2,'
+    b'{"entity_id":"","op":"delete"},'
+    b'{"entity_id":"","op":"patch","value":{}},'
+    b'{"entity_id":"","op":"set","value":{}},'
+    b'"base_world_version":,"target_world_version":,"tick":,"operations":[{"entity_id":"'
+    b'{"integrity":{"sha256":"","signature":""},"payload":{"base_world_version":'
+)
+
+
 class IntegrityError(RuntimeError):
     pass
 
@@ -22,6 +46,7 @@ class WorldStore:
         root_dir: str | Path = "data",
         snapshot_interval: int = 10,
         signature_key: str = "dev-world-signature-key",
+        compress_diffs: bool = True,
     ) -> None:
         self.root = Path(root_dir)
         self.snapshots_dir = self.root / "snapshots"
@@ -29,35 +54,93 @@ class WorldStore:
         self.snapshots_dir.mkdir(parents=True, exist_ok=True)
         self.diffs_dir.mkdir(parents=True, exist_ok=True)
         self.snapshot_interval = max(1, snapshot_interval)
+        self.compress_diffs = compress_diffs
         self.signature_key = signature_key.encode("utf-8")
+        # Keyed once; per-record signing copies these instead of redoing the key setup.
+        # blake2b accepts at most 64 key bytes, so longer keys are digested down first.
+        mac_key = self.signature_key
+        if len(mac_key) > hashlib.blake2b.MAX_KEY_SIZE:
+            mac_key = hashlib.blake2b(mac_key).digest()
+        self._mac_template = hashlib.blake2b(key=mac_key, digest_size=16)
+        self._hmac_template = hmac.new(self.signature_key, digestmod=hashlib.sha256)
+        # (name, mtime_ns, size) of the snapshot and every diff -> rebuilt state as JSON.
+        self._rebuilds: "OrderedDict[Tuple[Tuple[str, int, int], ...], str]" = OrderedDict()
 
     def _canonical(self, payload: Dict[str, Any]) -> bytes:
         return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
-    def _integrity_meta(self, payload: Dict[str, Any]) -> Dict[str, str]:
-        encoded = self._canonical(payload)
+    def _integrity_for_bytes(self, encoded: bytes | memoryview) -> Dict[str, str]:
+        # A keyed blake2b is a single C pass over the payload; it replaces the separate
+        # SHA-256 digest and HMAC-SHA256 signature that older records carry.
+        mac = self._mac_template.copy()
+        mac.update(encoded)
+        return {"mac": MAC_ALGORITHM, "signature": mac.hexdigest()}
+
+    def _legacy_integrity_for_bytes(self, encoded: bytes | memoryview) -> Dict[str, str]:
         digest = hashlib.sha256(encoded).hexdigest()
-        signature = hmac.new(self.signature_key, encoded, digestmod=hashlib.sha256).hexdigest()
-        return {"sha256": digest, "signature": signature}
+        mac = self._hmac_template.copy()
+        mac.update(encoded)
+        return {"sha256": digest, "signature": mac.hexdigest()}
+
+    def _verify_bytes(self, path: Path, expected: Dict[str, str], encoded: bytes | memoryview) -> None:
+        algorithm = expected.get("mac")
+        if algorithm is None:
+            actual = self._legacy_integrity_for_bytes(encoded)
+            if expected.get("sha256") != actual["sha256"]:
+                raise IntegrityError(f"Hash mismatch: {path}")
+        elif algorithm == MAC_ALGORITHM:
+            actual = self._integrity_for_bytes(encoded)
+        else:
+            raise IntegrityError(f"Unsupported MAC algorithm {algorithm!r}: {path}")
+        if not hmac.compare_digest(expected.get("signature", ""), actual["signature"]):
+            raise IntegrityError(f"Signature mismatch: {path}")
 
     def _write_record(self, path: Path, payload: Dict[str, Any]) -> None:
-        record = {
-            "payload": payload,
-            "integrity": self._integrity_meta(payload),
-        }
-        path.write_text(json.dumps(record, indent=2, sort_keys=True), encoding="utf-8")
+        # Framed layout: the canonical payload bytes sit after a fixed marker, so readers can
+        # verify them in place without re-serializing the parsed payload.
+        encoded = self._canonical(payload)
+        integrity = json.dumps(self._integrity_for_bytes(encoded), sort_keys=True, separators=(",", ":"))
+        record = _RECORD_PREFIX + integrity.encode("ascii") + _PAYLOAD_MARKER + encoded + b"}\n"
+        if path.suffix == _COMPRESSED_SUFFIX:
+            compressor = zlib.compressobj(6, zdict=_DIFF_ZDICT)
+            record = compressor.compress(record) + compressor.flush()
+        path.write_bytes(record)
 
     def _read_record(self, path: Path) -> Dict[str, Any]:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        if path.suffix == _COMPRESSED_SUFFIX:
+            decompressor = zlib.decompressobj(zdict=_DIFF_ZDICT)
+            try:
+                record = decompressor.decompress(path.read_bytes()) + decompressor.flush()
+            except zlib.error as exc:
+                raise IntegrityError(f"Corrupt compressed record: {path}") from exc
+            if not record.startswith(_RECORD_PREFIX):
+                raise IntegrityError(f"Malformed record: {path}")
+            return self._read_framed_record(path, record)
+
+        with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if view[: len(_RECORD_PREFIX)] == _RECORD_PREFIX:
+                return self._read_framed_record(path, view)
+
+        # Records written before the framed layout (or re-encoded by other tools).
+        raw = json.loads(path.read_bytes())
         payload = raw["payload"]
-        actual = self._integrity_meta(payload)
-        expected = raw["integrity"]
-        if expected["sha256"] != actual["sha256"]:
-            raise IntegrityError(f"Hash mismatch: {path}")
-        if not hmac.compare_digest(expected["signature"], actual["signature"]):
-            raise IntegrityError(f"Signature mismatch: {path}")
+        self._verify_bytes(path, raw["integrity"], self._canonical(payload))
         return payload
 
+    def _read_framed_record(self, path: Path, view: mmap.mmap | bytes) -> Dict[str, Any]:
+        marker = view.find(_PAYLOAD_MARKER)
+        end = view.rfind(b"}")
+        if marker < 0 or end <= marker:
+            raise IntegrityError(f"Malformed record: {path}")
+
+        expected = json.loads(view[len(_RECORD_PREFIX) : marker])
+        body = memoryview(view)[marker + len(_PAYLOAD_MARKER) : end]
+        try:
+            self._verify_bytes(path, expected, body)
+            return json.loads(body.tobytes())
+        finally:
+            body.release()
+
     def persist_update(self, base_state: WorldState, operations: List[Dict[str, Any]]) -> WorldState:
         new_state = apply_operations(base_state, operations)
         diff = WorldDiff(
@@ -67,7 +150,8 @@ class WorldStore:
             tick=new_state.tick,
             operations=operations,
         )
-        diff_path = self.diffs_dir / f"diff_{base_state.world_version:08d}_{new_state.world_version:08d}.json"
+        suffix = ".json" + _COMPRESSED_SUFFIX if self.compress_diffs else ".json"
+        diff_path = self.diffs_dir / f"diff_{base_state.world_version:08d}_{new_state.world_version:08d}{suffix}"
         self._write_record(diff_path, diff.to_dict())
 
         if new_state.world_version % self.snapshot_interval == 0:
@@ -79,6 +163,7 @@ class WorldStore:
         snapshot_id = f"snapshot_{state.world_version:08d}"
         path = self.snapshots_dir / f"{snapshot_id}.json"
         self._write_record(path, state.to_dict())
+        self._rebuilds.clear()
         return snapshot_id
 
     def load_snapshot(self, snapshot_id: str) -> WorldState:
@@ -87,6 +172,33 @@ class WorldStore:
         migrated = migrate_world_state(payload, target_version=CURRENT_SCHEMA_VERSION)
         return WorldState.from_dict(migrated)
 
+    def rebuild(self, snapshot_id: str) -> WorldState:
+        """Snapshot plus contiguous diff chain, replayed once per unchanged set of records.
+
+        The cache key carries the name, ``st_mtime_ns`` and size of the snapshot and every
+        diff file, so a record rewritten in place is read and verified again. Hits decode a
+        fresh ``WorldState`` from the cached canonical JSON; nothing mutable is shared.
+        """
+        key = (self._record_stamp(self.snapshots_dir / f"{snapshot_id}.json"),) + tuple(
+            self._record_stamp(path) for path in self.list_diffs()
+        )
+        encoded = self._rebuilds.get(key)
+        if encoded is None:
+            base = self.load_snapshot(snapshot_id)
+            state = replay_diffs(base, self.diff_stream_from(base.world_version))
+            encoded = json.dumps({item.name: getattr(state, item.name) for item in fields(WorldState)})
+            self._rebuilds[key] = encoded
+            if len(self._rebuilds) > REBUILD_CACHE_SIZE:
+                self._rebuilds.popitem(last=False)
+            return state
+        self._rebuilds.move_to_end(key)
+        return WorldState(**json.loads(encoded))
+
+    @staticmethod
+    def _record_stamp(path: Path) -> Tuple[str, int, int]:
+        stat = path.stat()
+        return path.name, stat.st_mtime_ns, stat.st_size
+
     def list_snapshots(self) -> List[str]:
         def key(name: str) -> int:
             return int(name.split("_")[-1])
@@ -95,7 +207,7 @@ class WorldStore:
         return sorted(snapshots, key=key)
 
     def list_diffs(self) -> List[Path]:
-        return sorted(self.diffs_dir.glob("diff_*.json"))
+        return sorted(self.diffs_dir.glob("diff_*.json*"))
 
     def diff_stream_from(self, world_version: int) -> Iterable[WorldDiff]:
         for path in self.list_diffs():
@@ -122,36 +234,59 @@ class WorldStore:
             return WorldState(schema_version=CURRENT_SCHEMA_VERSION)
 
         _snapshot_id, state = latest
-        for diff in self.diff_stream_from(state.world_version):
-            # Reject broken chains and stop recovery at first inconsistency.
-            if diff.base_world_version != state.world_version:
-                break
-            state = apply_operations(state, diff.operations)
-        return state
+        return replay_diffs(state, self.diff_stream_from(state.world_version))
 
 
 def apply_operations(state: WorldState, operations: List[Dict[str, Any]]) -> WorldState:
     next_entities = dict(state.entities)
+    _apply_in_place(next_entities, operations)
+    return _advance(state, next_entities, steps=1)
+
+
+def replay_diffs(state: WorldState, diffs: Iterable[WorldDiff]) -> WorldState:
+    """Apply a contiguous diff chain, stopping at the first diff that does not follow on.
+
+    Equivalent to folding ``apply_operations`` over the chain, but the entity map is copied
+    once for the whole replay instead of once per diff.
+    """
+    entities = dict(state.entities)
+    world_version = state.world_version
+    for diff in diffs:
+        # Reject broken chains and stop at first inconsistency.
+        if diff.base_world_version != world_version:
+            break
+        _apply_in_place(entities, diff.operations)
+        world_version += 1
+
+    steps = world_version - state.world_version
+    if steps == 0:
+        return state
+    return _advance(state, entities, steps=steps)
+
+
+def _apply_in_place(entities: Dict[str, Dict[str, Any]], operations: List[Dict[str, Any]]) -> None:
     for op in operations:
-        kind = op.get("op")
-        entity_id = op.get("entity_id")
-        if kind == "set":
-            next_entities[entity_id] = op.get("value", {})
-        elif kind == "patch":
-            base = dict(next_entities.get(entity_id, {}))
-            base.update(op.get("value", {}))
-            next_entities[entity_id] = base
-        elif kind == "delete":
-            next_entities.pop(entity_id, None)
-        else:
-            raise ValueError(f"Unsupported operation '{kind}'")
+        match op.get("op"):
+            case "set":
+                entities[op.get("entity_id")] = op.get("value", {})
+            case "patch":
+                entity_id = op.get("entity_id")
+                base = dict(entities.get(entity_id, {}))
+                base.update(op.get("value", {}))
+                entities[entity_id] = base
+            case "delete":
+                entities.pop(op.get("entity_id"), None)
+            case kind:
+                raise ValueError(f"Unsupported operation '{kind}'")
+
 
+def _advance(state: WorldState, entities: Dict[str, Dict[str, Any]], steps: int) -> WorldState:
     return WorldState(
         schema_version=CURRENT_SCHEMA_VERSION,
-        world_version=state.world_version + 1,
+        world_version=state.world_version + steps,
         seed=state.seed,
-        tick=state.tick + 1,
-        entities=next_entities,
+        tick=state.tick + steps,
+        entities=entities,
         metadata=dict(state.metadata),
         created_at=state.created_at,
     )
@@ -2,23 +2,56 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from hashlib import blake2b
 from random import Random
-from typing import List
+from typing import Iterable, List, Optional, Tuple
+
+
+BIOMES = ("water", "shore", "plains", "forest", "mountain")
+BIOME_THRESHOLDS = (0.2, 0.4, 0.7, 0.9)
+# Below this many chunks, worker start-up costs more than generating inline.
+MIN_PARALLEL_BATCH = 64
+# Chunk columns kept per process; players crossing back over a boundary re-request recent chunks.
+CHUNK_CACHE_SIZE = 512
 
 
 @dataclass(frozen=True)
 class TerrainChunk:
-    """Output structure for generated terrain."""
+    """Output structure for generated terrain.
+
+    Cells are stored row-major as flat columns: ``heights`` is a contiguous double
+    array and ``biomes`` holds one index into ``BIOMES`` per cell. Nested-list views
+    are built on first access and cached.
+    """
 
     chunk_x: int
     chunk_y: int
     size: int
-    height_map: List[List[float]]
-    biome_map: List[List[str]]
+    heights: array
+    biomes: bytes
     seed_material: str
 
+    def height_at(self, local_x: int, local_y: int) -> float:
+        return self.heights[local_y * self.size + local_x]
+
+    def biome_at(self, local_x: int, local_y: int) -> str:
+        return BIOMES[self.biomes[local_y * self.size + local_x]]
+
+    @cached_property
+    def height_map(self) -> List[List[float]]:
+        size = self.size
+        return [self.heights[row * size : (row + 1) * size].tolist() for row in range(size)]
+
+    @cached_property
+    def biome_map(self) -> List[List[str]]:
+        size = self.size
+        return [[BIOMES[index] for index in self.biomes[row * size : (row + 1) * size]] for row in range(size)]
+
 
 class TerrainGenerator:
     """Seed-based deterministic chunk terrain generation.
@@ -34,43 +67,68 @@ class TerrainGenerator:
         self.generation_epoch = generation_epoch
 
     def derive_chunk_seed(self, chunk_x: int, chunk_y: int) -> int:
-        material = self._seed_material(chunk_x, chunk_y)
-        digest = blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
-        return int(digest, 16)
+        return _seed_from_material(self._seed_material(chunk_x, chunk_y))
 
     def generate_chunk(self, chunk_x: int, chunk_y: int, size: int = 16) -> TerrainChunk:
-        material = self._seed_material(chunk_x, chunk_y)
-        rng = Random(self.derive_chunk_seed(chunk_x, chunk_y))
-
-        height_map: List[List[float]] = []
-        biome_map: List[List[str]] = []
-
-        for _row in range(size):
-            heights = [round(rng.uniform(0.0, 1.0), 4) for _ in range(size)]
-            biomes = [self._biome_for_height(height) for height in heights]
-            height_map.append(heights)
-            biome_map.append(biomes)
-
-        return TerrainChunk(
-            chunk_x=chunk_x,
-            chunk_y=chunk_y,
-            size=size,
-            height_map=height_map,
-            biome_map=biome_map,
-            seed_material=material,
-        )
+        """Generate the chunk from cached columns; output depends only on seed, epoch, coords and size."""
+        return _generate_chunk(self.world_seed, self.generation_epoch, chunk_x, chunk_y, size)
+
+    def generate_chunks(
+        self,
+        coords: Iterable[Tuple[int, int]],
+        size: int = 16,
+        max_workers: Optional[int] = None,
+        min_parallel_batch: int = MIN_PARALLEL_BATCH,
+    ) -> List[TerrainChunk]:
+        """Generate many chunks, in ``coords`` order, fanning large batches out to processes.
+
+        Chunk generation is pure per coordinate, so workers only need the seed inputs.
+        Intended for bulk fan-in such as world start-up or pre-generating a region.
+        """
+        coords = list(coords)
+        if max_workers == 1 or len(coords) < min_parallel_batch:
+            return [self.generate_chunk(chunk_x, chunk_y, size) for chunk_x, chunk_y in coords]
+
+        jobs = [(self.world_seed, self.generation_epoch, chunk_x, chunk_y, size) for chunk_x, chunk_y in coords]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_generate_chunk_job, jobs, chunksize=16))
 
     def _seed_material(self, chunk_x: int, chunk_y: int) -> str:
         return f"{self.world_seed}:{self.generation_epoch}:{chunk_x}:{chunk_y}"
 
     @staticmethod
     def _biome_for_height(height: float) -> str:
-        if height < 0.2:
-            return "water"
-        if height < 0.4:
-            return "shore"
-        if height < 0.7:
-            return "plains"
-        if height < 0.9:
-            return "forest"
-        return "mountain"
+        return BIOMES[bisect_right(BIOME_THRESHOLDS, height)]
+
+
+def _seed_from_material(material: str) -> int:
+    return int(blake2b(material.encode("utf-8"), digest_size=16).hexdigest(), 16)
+
+
+@lru_cache(maxsize=CHUNK_CACHE_SIZE)
+def _chunk_columns(world_seed: str, generation_epoch: int, chunk_x: int, chunk_y: int, size: int) -> Tuple[bytes, bytes]:
+    # Only immutable bytes are cached; each caller gets its own TerrainChunk and array.
+    uniform = Random(_seed_from_material(f"{world_seed}:{generation_epoch}:{chunk_x}:{chunk_y}")).uniform
+    heights = array("d", [round(uniform(0.0, 1.0), 4) for _ in range(size * size)])
+    biomes = bytes([bisect_right(BIOME_THRESHOLDS, height) for height in heights])
+    return heights.tobytes(), biomes
+
+
+def _generate_chunk(world_seed: str, generation_epoch: int, chunk_x: int, chunk_y: int, size: int) -> TerrainChunk:
+    height_bytes, biomes = _chunk_columns(world_seed, generation_epoch, chunk_x, chunk_y, size)
+    heights = array("d")
+    heights.frombytes(height_bytes)
+
+    return TerrainChunk(
+        chunk_x=chunk_x,
+        chunk_y=chunk_y,
+        size=size,
+        heights=heights,
+        biomes=biomes,
+        seed_material=f"{world_seed}:{generation_epoch}:{chunk_x}:{chunk_y}",
+    )
+
+
+def _generate_chunk_job(job: Tuple[str, int, int, int, int]) -> TerrainChunk:
+    world_seed, generation_epoch, chunk_x, chunk_y, size = job
+    return TerrainGenerator(world_seed, generation_epoch).generate_chunk(chunk_x, chunk_y, size)
@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 from hashlib import blake2b
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 ChunkKey = str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkPatch:
     """Serializable patch operation for chunk-local state."""
 
@@ -20,6 +20,26 @@ class ChunkPatch:
     base_version: int
     operations: Dict[str, Any]
     author: str = "system"
+    parent_patch_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "patch_id": self.patch_id,
+            "base_version": self.base_version,
+            "operations": self.operations,
+            "author": self.author,
+            "parent_patch_id": self.parent_patch_id,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "ChunkPatch":
+        return cls(
+            patch_id=payload["patch_id"],
+            base_version=payload["base_version"],
+            operations=payload["operations"],
+            author=payload.get("author", "system"),
+            parent_patch_id=payload.get("parent_patch_id"),
+        )
 
 
 class WorldStateStore:
@@ -30,6 +50,17 @@ class WorldStateStore:
     - Runtime/world edits are recorded as ordered patch events per chunk.
     - Rehydration = deterministic base generation + replay of patch history.
     - Patch IDs and cumulative checksums allow clients/saves to verify parity.
+    - Every stored patch records its parent patch ID, so the chain is checked in one pass.
+
+    Storage layout:
+    - ``chunk_{x}_{y}.jsonl`` holds one canonical JSON patch per line and is only appended to.
+    - ``chunk_{x}_{y}.ckpt`` holds the patch count, the tip patch ID, a rolling
+      checksum and the log size it covers, so appends never re-read or rewrite the
+      existing history.
+    - The log is appended before the checkpoint is replaced. A crash in between
+      leaves the log ahead of its checkpoint; reads reconcile the two by rolling the
+      checkpoint forward over complete lines that chain from its tip and truncating
+      a torn trailing line.
     """
 
     def __init__(self, storage_dir: Path | str) -> None:
@@ -40,53 +71,238 @@ class WorldStateStore:
     def chunk_key(chunk_x: int, chunk_y: int) -> ChunkKey:
         return f"{chunk_x},{chunk_y}"
 
-    def append_patch(self, chunk_x: int, chunk_y: int, patch: ChunkPatch) -> int:
-        payload = self._read_chunk_payload(chunk_x, chunk_y)
-        history: List[Dict[str, Any]] = payload["patch_history"]
+    @staticmethod
+    def derive_patch_id(parent_patch_id: Optional[str], operations: Dict[str, Any]) -> str:
+        """Content hash of ``parent_patch_id || canonical(operations)``, fed incrementally."""
+        digest = blake2b(digest_size=16)
+        if parent_patch_id:
+            digest.update(parent_patch_id.encode("utf-8"))
+        digest.update(json.dumps(operations, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        return digest.hexdigest()
+
+    def create_patch(
+        self, chunk_x: int, chunk_y: int, operations: Dict[str, Any], author: str = "system"
+    ) -> ChunkPatch:
+        """Build a content-addressed patch that extends the current chunk tip."""
+        version, parent_patch_id, _checksum = self._read_checkpoint(chunk_x, chunk_y)
+        return ChunkPatch(
+            patch_id=self.derive_patch_id(parent_patch_id, operations),
+            base_version=version,
+            operations=operations,
+            author=author,
+            parent_patch_id=parent_patch_id,
+        )
 
-        current_version = len(history)
+    def append_patch(self, chunk_x: int, chunk_y: int, patch: ChunkPatch) -> int:
+        current_version, parent_patch_id, checksum = self._read_checkpoint(chunk_x, chunk_y)
         if patch.base_version != current_version:
             raise ValueError(
                 f"Patch base_version {patch.base_version} does not match current {current_version}"
             )
+        if patch.parent_patch_id is None:
+            patch = replace(patch, parent_patch_id=parent_patch_id)
+        elif patch.parent_patch_id != parent_patch_id:
+            raise ValueError(
+                f"Patch parent {patch.parent_patch_id} does not match chunk tip {parent_patch_id}"
+            )
+
+        line = self._encode_patch(patch.to_dict())
+        with self._chunk_path(chunk_x, chunk_y).open("ab") as handle:
+            handle.write(line)
+            size = handle.tell()
 
-        history.append(asdict(patch))
-        payload["checksum"] = self._history_checksum(history)
-        self._write_chunk_payload(chunk_x, chunk_y, payload)
-        return len(history)
+        version = current_version + 1
+        self._write_checkpoint(chunk_x, chunk_y, version, patch.patch_id, self._roll_checksum(checksum, line), size)
+        return version
 
     def get_patch_history(self, chunk_x: int, chunk_y: int) -> List[ChunkPatch]:
-        payload = self._read_chunk_payload(chunk_x, chunk_y)
-        return [ChunkPatch(**entry) for entry in payload["patch_history"]]
+        return list(self.iter_patch_history(chunk_x, chunk_y))
+
+    def iter_patch_history(self, chunk_x: int, chunk_y: int) -> Iterator[ChunkPatch]:
+        for line in self._iter_lines(chunk_x, chunk_y):
+            yield ChunkPatch.from_dict(json.loads(line))
 
     def materialize_chunk_state(
         self, chunk_x: int, chunk_y: int, base_state: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         state = dict(base_state or {})
-        for patch in self.get_patch_history(chunk_x, chunk_y):
-            for key, value in patch.operations.items():
-                state[key] = value
+        for operations in self._iter_operations(chunk_x, chunk_y):
+            state.update(operations)
         return state
 
     def verify_chunk_checksum(self, chunk_x: int, chunk_y: int) -> bool:
-        payload = self._read_chunk_payload(chunk_x, chunk_y)
-        expected = self._history_checksum(payload["patch_history"])
-        return expected == payload.get("checksum", "")
+        count = 0
+        expected = ""
+        for line in self._iter_lines(chunk_x, chunk_y):
+            expected = self._roll_checksum(expected, line)
+            count += 1
+        version, _tip, checksum = self._read_checkpoint(chunk_x, chunk_y)
+        return version == count and expected == checksum
+
+    def validate_chain(self, chunk_x: int, chunk_y: int) -> bool:
+        """Single pass over the log checking that each patch names its predecessor."""
+        expected_parent: Optional[str] = None
+        for line in self._iter_lines(chunk_x, chunk_y):
+            entry = json.loads(line)
+            if entry.get("parent_patch_id") != expected_parent:
+                return False
+            expected_parent = entry["patch_id"]
+        return expected_parent == self._read_checkpoint(chunk_x, chunk_y)[1]
 
     def _chunk_path(self, chunk_x: int, chunk_y: int) -> Path:
+        return self.storage_dir / f"chunk_{chunk_x}_{chunk_y}.jsonl"
+
+    def _checkpoint_path(self, chunk_x: int, chunk_y: int) -> Path:
+        return self.storage_dir / f"chunk_{chunk_x}_{chunk_y}.ckpt"
+
+    def _legacy_chunk_path(self, chunk_x: int, chunk_y: int) -> Path:
         return self.storage_dir / f"chunk_{chunk_x}_{chunk_y}.json"
 
-    def _read_chunk_payload(self, chunk_x: int, chunk_y: int) -> Dict[str, Any]:
+    def _iter_lines(self, chunk_x: int, chunk_y: int) -> Iterator[bytes]:
+        """Stream raw patch lines without loading the whole log."""
+        self._read_checkpoint(chunk_x, chunk_y)
         path = self._chunk_path(chunk_x, chunk_y)
         if not path.exists():
-            return {"chunk": self.chunk_key(chunk_x, chunk_y), "patch_history": [], "checksum": ""}
-        return json.loads(path.read_text(encoding="utf-8"))
+            return
+        with path.open("rb") as handle:
+            for line in handle:
+                if line.strip():
+                    yield line
 
-    def _write_chunk_payload(self, chunk_x: int, chunk_y: int, payload: Dict[str, Any]) -> None:
-        path = self._chunk_path(chunk_x, chunk_y)
-        path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    def _iter_operations(self, chunk_x: int, chunk_y: int) -> Iterator[Dict[str, Any]]:
+        for line in self._iter_lines(chunk_x, chunk_y):
+            yield json.loads(line)["operations"]
+
+    def _read_checkpoint(self, chunk_x: int, chunk_y: int) -> Tuple[int, Optional[str], str]:
+        self._compact_legacy_payload(chunk_x, chunk_y)
+        path = self._checkpoint_path(chunk_x, chunk_y)
+        log_path = self._chunk_path(chunk_x, chunk_y)
+        log_size = log_path.stat().st_size if log_path.exists() else 0
+        if not path.exists():
+            version, patch_id, checksum, size = 0, None, "", 0
+        else:
+            checkpoint = json.loads(path.read_text(encoding="utf-8"))
+            version, patch_id = int(checkpoint["version"]), checkpoint.get("patch_id")
+            checksum, size = str(checkpoint["checksum"]), checkpoint.get("size")
+        if size == log_size or not log_path.exists():
+            return version, patch_id, checksum
+        return self._reconcile_checkpoint(chunk_x, chunk_y, version, patch_id, checksum, size)
+
+    def _reconcile_checkpoint(
+        self,
+        chunk_x: int,
+        chunk_y: int,
+        version: int,
+        patch_id: Optional[str],
+        checksum: str,
+        size: Optional[int],
+    ) -> Tuple[int, Optional[str], str]:
+        """Roll a checkpoint that is behind its log forward, dropping a torn trailing line.
+
+        Only complete lines that chain from the checkpoint tip are adopted. A log that
+        does not extend the checkpoint (shorter, or rewritten) is left untouched so
+        ``verify_chunk_checksum`` and ``validate_chain`` still report it.
+        """
+        stale = (version, patch_id, checksum)
+        with self._chunk_path(chunk_x, chunk_y).open("r+b") as handle:
+            if size is None:
+                # Checkpoints written before sizes were recorded: find the offset that
+                # the recorded version and checksum cover.
+                size, rolled = 0, ""
+                for _ in range(version):
+                    line = self._next_patch_line(handle)
+                    if line is None:
+                        return stale
+                    size = handle.tell()
+                    rolled = self._roll_checksum(rolled, line)
+                if rolled != checksum:
+                    return stale
+            # The adopted prefix must end on a line boundary, or the log was rewritten.
+            handle.seek(max(size - 1, 0))
+            if size and handle.read(1) != b"\n":
+                return stale
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        return stale
+                    if entry.get("parent_patch_id") != patch_id or "patch_id" not in entry:
+                        return stale
+                    version += 1
+                    patch_id = entry["patch_id"]
+                    checksum = self._roll_checksum(checksum, line)
+                size += len(line)
+            handle.truncate(size)
+        self._write_checkpoint(chunk_x, chunk_y, version, patch_id, checksum, size)
+        return version, patch_id, checksum
 
     @staticmethod
-    def _history_checksum(history: List[Dict[str, Any]]) -> str:
+    def _next_patch_line(handle: Any) -> Optional[bytes]:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                return None
+            if line.strip():
+                return line
+        return None
+
+    def _write_checkpoint(
+        self, chunk_x: int, chunk_y: int, version: int, patch_id: Optional[str], checksum: str, size: int
+    ) -> None:
+        path = self._checkpoint_path(chunk_x, chunk_y)
+        tmp_path = path.with_suffix(".ckpt.tmp")
+        checkpoint = {
+            "chunk": self.chunk_key(chunk_x, chunk_y),
+            "version": version,
+            "patch_id": patch_id,
+            "checksum": checksum,
+            "size": size,
+        }
+        tmp_path.write_text(json.dumps(checkpoint, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def _compact_legacy_payload(self, chunk_x: int, chunk_y: int) -> None:
+        """One-shot conversion of a whole-file JSON payload into the JSONL + checkpoint layout."""
+        legacy_path = self._legacy_chunk_path(chunk_x, chunk_y)
+        if not legacy_path.exists():
+            return
+
+        payload = json.loads(legacy_path.read_text(encoding="utf-8"))
+        history = payload.get("patch_history", [])
+        # Only a history that still matches its recorded checksum becomes a trusted chain;
+        # a mismatching file is left in place for inspection.
+        if self._legacy_checksum(history) != payload.get("checksum", ""):
+            raise ValueError(f"Legacy chunk payload {legacy_path} does not match its checksum")
+
+        lines: List[bytes] = []
+        parent_patch_id: Optional[str] = None
+        checksum = ""
+        for entry in history:
+            line = self._encode_patch({**entry, "parent_patch_id": parent_patch_id})
+            lines.append(line)
+            checksum = self._roll_checksum(checksum, line)
+            parent_patch_id = entry["patch_id"]
+
+        log = b"".join(lines)
+        self._chunk_path(chunk_x, chunk_y).write_bytes(log)
+        self._write_checkpoint(chunk_x, chunk_y, len(lines), parent_patch_id, checksum, len(log))
+        legacy_path.unlink()
+
+    @staticmethod
+    def _legacy_checksum(history: List[Dict[str, Any]]) -> str:
+        """Whole-history checksum of the pre-JSONL ``chunk_{x}_{y}.json`` layout."""
         canonical = json.dumps(history, sort_keys=True, separators=(",", ":"))
         return blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _encode_patch(entry: Dict[str, Any]) -> bytes:
+        return (json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _roll_checksum(previous: str, line: bytes) -> str:
+        digest = blake2b(digest_size=16)
+        digest.update(previous.encode("ascii"))
+        digest.update(line)
+        return digest.hexdigest()
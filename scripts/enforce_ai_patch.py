@@ -6,7 +6,7 @@ from ai.policy import PatchContext, enforce_patch
 
 
 def _load(path:str)->dict:
-    return json.loads(Path(path).read_text(encoding='utf-8'))
+    return json.loads(Path(path).read_bytes())
 
 def main()->int:
     policy=_load('ai/policy/default_policy.json')
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import argparse
 import json
+import os
+import selectors
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 from aegisworld_benchmark import BenchmarkRunner
@@ -11,72 +17,325 @@ from aegisworld_service import AegisWorldService
 
 
 service = AegisWorldService()
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
 
 
 def read_json(handler: BaseHTTPRequestHandler) -> Dict[str, Any]:
     length = int(handler.headers.get("Content-Length", "0"))
     if length == 0:
         return {}
-    body = handler.rfile.read(length)
-    return json.loads(body.decode("utf-8"))
+    return json.loads(handler.rfile.read(length))
+
+
+STREAM_FLUSH_BYTES = 64 * 1024
+
+
+class JSONListStream:
+    """Response body ``{"<key>": [...]}`` encoded one item at a time.
+
+    Large list endpoints return this instead of a dict so the full document is
+    never built as a single string; items are flushed in ~64KB writes.
+    """
+
+    __slots__ = ("key", "items")
+
+    def __init__(self, key: str, items: Iterable[Any]) -> None:
+        self.key = key
+        self.items = items
+
+    def iter_chunks(self, flush_bytes: int = STREAM_FLUSH_BYTES) -> Iterator[bytes]:
+        buffer = bytearray(b"{" + _encode_json(self.key).encode("utf-8") + b":[")
+        separator = b""
+        for item in self.items:
+            buffer += separator
+            buffer += _encode_json(item).encode("utf-8")
+            separator = b","
+            if len(buffer) >= flush_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]}"
+        yield bytes(buffer)
+
+
+Body = Union[Dict[str, Any], JSONListStream]
+Route = Callable[[Dict[str, Any], Dict[str, str], str], Tuple[HTTPStatus, Body]]
+
+
+class RouteTrie:
+    """Path-segment trie; ``:name`` segments capture into the params dict.
+
+    Templates without parameters are also kept in an exact-path table, so the
+    common static routes resolve with one dict probe and no split or walk.
+    """
+
+    __slots__ = ("children", "param", "handler", "static")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, RouteTrie] = {}
+        self.param: Optional[Tuple[str, RouteTrie]] = None
+        self.handler: Optional[Route] = None
+        self.static: Dict[str, Route] = {}
+
+    def add(self, template: str, handler: Route) -> None:
+        if ":" not in template:
+            self.static[template] = handler
+        node = self
+        for segment in template.strip("/").split("/"):
+            if segment.startswith(":"):
+                if node.param is None:
+                    node.param = (segment[1:], RouteTrie())
+                node = node.param[1]
+            else:
+                node = node.children.setdefault(segment, RouteTrie())
+        node.handler = handler
+
+    def match(self, path: str) -> Tuple[Optional[Route], Dict[str, str]]:
+        handler = self.static.get(path)
+        if handler is not None:
+            return handler, {}
+        node = self
+        params: Dict[str, str] = {}
+        for segment in path.strip("/").split("/"):
+            child = node.children.get(segment)
+            if child is None:
+                if node.param is None:
+                    return None, params
+                name, child = node.param
+                params[name] = segment
+            node = child
+        return node.handler, params
+
+
+ROUTES: Dict[str, RouteTrie] = {"POST": RouteTrie(), "GET": RouteTrie()}
+
+
+def route(method: str, template: str) -> Callable[[Route], Route]:
+    def register(handler: Route) -> Route:
+        ROUTES[method].add(template, handler)
+        return handler
+
+    return register
+
+
+@route("POST", "/v1/goals")
+def _create_goal(payload, params, query):
+    return HTTPStatus.CREATED, service.create_goal(payload)
+
+
+@route("POST", "/v1/agents")
+def _create_agent(payload, params, query):
+    return HTTPStatus.CREATED, service.create_agent(payload)
+
+
+@route("POST", "/v1/agents/:agent_id/execute")
+def _execute(payload, params, query):
+    return HTTPStatus.OK, service.execute(agent_id=params["agent_id"], goal_id=payload["goal_id"])
+
+
+@route("POST", "/v1/agents/:agent_id/policy")
+def _update_agent_policy(payload, params, query):
+    return HTTPStatus.OK, service.update_agent_policy(agent_id=params["agent_id"], payload=payload)
+
+
+@route("POST", "/v1/domain/social/projects")
+def _create_social_project(payload, params, query):
+    return HTTPStatus.CREATED, service.create_domain_project("social", payload)
+
+
+@route("POST", "/v1/domain/dev/pipelines")
+def _create_dev_pipeline(payload, params, query):
+    return HTTPStatus.CREATED, service.create_domain_project("dev", payload)
+
+
+@route("POST", "/v1/domain/games/projects")
+def _create_games_project(payload, params, query):
+    return HTTPStatus.CREATED, service.create_domain_project("games", payload)
+
+
+@route("POST", "/v1/policies/simulate")
+def _simulate_policy(payload, params, query):
+    return HTTPStatus.OK, service.simulate_policy(payload)
+
+
+@route("POST", "/v1/learning/compact")
+def _compact_memory(payload, params, query):
+    options = parse_qs(query)
+    agent_id = payload.get("agent_id") or options.get("agent_id", [None])[0]
+    if not agent_id:
+        return HTTPStatus.BAD_REQUEST, {"error": "missing agent_id"}
+    max_items = int(payload.get("max_items", options.get("max_items", [100])[0]))
+    return HTTPStatus.OK, service.compact_memory(agent_id=agent_id, max_items=max_items)
+
+
+@route("POST", "/v1/benchmark/run")
+def _run_benchmark(payload, params, query):
+    runs = int(payload.get("runs", 10))
+    domain = payload.get("domain", "dev")
+    return HTTPStatus.OK, BenchmarkRunner(service).run(runs=runs, domain=domain).to_dict()
+
+
+@route("GET", "/v1/goals/:goal_id")
+def _get_goal(payload, params, query):
+    goal = service.get_goal(params["goal_id"])
+    if goal is None:
+        return HTTPStatus.NOT_FOUND, {"error": "goal not found"}
+    return HTTPStatus.OK, goal
+
+
+@route("GET", "/v1/agents/:agent_id/memory")
+def _get_memory(payload, params, query):
+    agent_id = params["agent_id"]
+    if agent_id not in service.agents:
+        return HTTPStatus.NOT_FOUND, {"error": "agent not found"}
+    return HTTPStatus.OK, service.get_memory(agent_id)
+
+
+@route("GET", "/v1/agents/:agent_id")
+def _get_agent(payload, params, query):
+    agent = service.get_agent(params["agent_id"])
+    if agent is None:
+        return HTTPStatus.NOT_FOUND, {"error": "agent not found"}
+    return HTTPStatus.OK, agent
+
+
+@route("GET", "/v1/incidents")
+def _list_incidents(payload, params, query):
+    return HTTPStatus.OK, JSONListStream("incidents", service.list_incidents())
+
+
+@route("GET", "/v1/traces")
+def _list_traces(payload, params, query):
+    return HTTPStatus.OK, JSONListStream("traces", service.list_traces())
+
+
+@route("GET", "/v1/reflections")
+def _list_reflections(payload, params, query):
+    return HTTPStatus.OK, JSONListStream("reflections", service.list_reflections())
+
+
+@route("GET", "/v1/changes")
+def _list_changes(payload, params, query):
+    return HTTPStatus.OK, JSONListStream("changes", service.list_changes())
+
+
+@route("GET", "/v1/learning/summary")
+def _learning_summary(payload, params, query):
+    return HTTPStatus.OK, service.learning_summary()
+
+
+@route("GET", "/v1/metrics")
+def _metrics(payload, params, query):
+    return HTTPStatus.OK, service.metrics()
+
+
+HTTP_VERSION = "HTTP/1.1"
+IDLE_TIMEOUT_SECONDS = 5.0
+
+
+def _static_response(payload: Dict[str, Any]) -> bytes:
+    encoded = _encode_json(payload).encode("utf-8")
+    return b"Content-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(encoded), encoded)
+
+
+# Fixed headers and bodies, serialized once at import; the status line, Server
+# and Date headers are prepended per request.
+_HEALTHZ_RESPONSE = _static_response({"status": "ok"})
+_NOT_FOUND_RESPONSE = _static_response({"error": "not found"})
+
+
+def default_access_log() -> bool:
+    return os.environ.get("AEGIS_HTTP_ACCESS_LOG", "1") != "0"
 
 
 class AegisWorldHandler(BaseHTTPRequestHandler):
+    # Persistent HTTP/1.1 connections. An idle keep-alive socket holds its pool
+    # worker until the next request, so it is closed after IDLE_TIMEOUT_SECONDS
+    # or as soon as another connection is queued for a worker (see handle).
+    protocol_version = HTTP_VERSION
+    timeout = IDLE_TIMEOUT_SECONDS
+    # Error responses are always logged; successful ones unless access_log is off.
+    access_log = default_access_log()
+
+    def handle(self) -> None:
+        self.close_connection = True
+        self.handle_one_request()
+        if self.close_connection:
+            return
+        with selectors.DefaultSelector() as idle:
+            idle.register(self.connection, selectors.EVENT_READ)
+            queued_signal = getattr(self.server, "queued_signal", None)
+            if queued_signal is not None:
+                idle.register(queued_signal, selectors.EVENT_READ)
+            while not self.close_connection and self._await_next_request(idle):
+                self.handle_one_request()
+
+    def _await_next_request(self, idle: selectors.BaseSelector) -> bool:
+        """Wait for the next request on this connection; False means close it."""
+        # A pipelined request may already sit in the read buffer; peek at it
+        # without blocking before waiting on the socket itself.
+        self.connection.settimeout(0.0)
+        try:
+            if self.rfile.peek(1):
+                return True
+        finally:
+            self.connection.settimeout(self.timeout)
+        # Wakes on the next request, on the server's queued signal, or on the timeout.
+        return any(key.fileobj is self.connection for key, _ in idle.select(self.timeout))
+
+    def _status_head(self, status: HTTPStatus) -> bytes:
+        if self.access_log or status >= HTTPStatus.BAD_REQUEST:
+            self.log_request(status.value)
+        return b"%s %d %s\r\nServer: %s\r\nDate: %s\r\n" % (
+            self.protocol_version.encode("ascii"),
+            status.value,
+            status.phrase.encode("ascii"),
+            self.version_string().encode("latin-1"),
+            self.date_time_string().encode("latin-1"),
+        )
+
+    def _head(self, status: HTTPStatus, content_length: Optional[int] = None, chunked: bool = False) -> bytes:
+        head = self._status_head(status) + b"Content-Type: application/json\r\n"
+        if content_length is not None:
+            head += b"Content-Length: %d\r\n" % content_length
+        if chunked:
+            head += b"Transfer-Encoding: chunked\r\n"
+        return head + b"\r\n"
+
     def _send(self, status: HTTPStatus, payload: Dict[str, Any]) -> None:
-        encoded = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(encoded)))
-        self.end_headers()
-        self.wfile.write(encoded)
+        # Status line, headers and body go out in a single write.
+        encoded = _encode_json(payload).encode("utf-8")
+        self.wfile.write(self._head(status, len(encoded)) + encoded)
+
+    def _send_stream(self, status: HTTPStatus, stream: JSONListStream) -> None:
+        chunks = stream.iter_chunks()
+        if self.request_version == "HTTP/1.0":
+            # HTTP/1.0 clients cannot take chunked bodies; end the body by closing instead.
+            self.close_connection = True
+            self.wfile.write(self._head(status) + next(chunks))
+            for chunk in chunks:
+                self.wfile.write(chunk)
+            return
+        self.wfile.write(self._head(status, chunked=True))
+        for chunk in chunks:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _respond(self, status: HTTPStatus, body: Body) -> None:
+        if isinstance(body, JSONListStream):
+            self._send_stream(status, body)
+        else:
+            self._send(status, body)
+
+    def _send_not_found(self) -> None:
+        self.wfile.write(self._status_head(HTTPStatus.NOT_FOUND) + _NOT_FOUND_RESPONSE)
 
     def do_POST(self) -> None:  # noqa: N802
         try:
             payload = read_json(self)
-            path = self.path
-
-            if path == "/v1/goals":
-                self._send(HTTPStatus.CREATED, service.create_goal(payload))
-                return
-            if path == "/v1/agents":
-                self._send(HTTPStatus.CREATED, service.create_agent(payload))
-                return
-            if path.startswith("/v1/agents/") and path.endswith("/execute"):
-                agent_id = path.split("/")[3]
-                goal_id = payload["goal_id"]
-                self._send(HTTPStatus.OK, service.execute(agent_id=agent_id, goal_id=goal_id))
-                return
-            if path.startswith("/v1/agents/") and path.endswith("/policy"):
-                agent_id = path.split("/")[3]
-                self._send(HTTPStatus.OK, service.update_agent_policy(agent_id=agent_id, payload=payload))
-                return
-            if path == "/v1/domain/social/projects":
-                self._send(HTTPStatus.CREATED, service.create_domain_project("social", payload))
-                return
-            if path == "/v1/domain/dev/pipelines":
-                self._send(HTTPStatus.CREATED, service.create_domain_project("dev", payload))
-                return
-            if path == "/v1/domain/games/projects":
-                self._send(HTTPStatus.CREATED, service.create_domain_project("games", payload))
-                return
-            if path == "/v1/policies/simulate":
-                self._send(HTTPStatus.OK, service.simulate_policy(payload))
-                return
-            if path.startswith("/v1/learning/compact"):
-                parsed = urlparse(path)
-                params = parse_qs(parsed.query)
-                agent_id = payload.get("agent_id") or params.get("agent_id", [None])[0]
-                if not agent_id:
-                    self._send(HTTPStatus.BAD_REQUEST, {"error": "missing agent_id"})
-                    return
-                max_items = int(payload.get("max_items", params.get("max_items", [100])[0]))
-                self._send(HTTPStatus.OK, service.compact_memory(agent_id=agent_id, max_items=max_items))
-                return
-            if path == "/v1/benchmark/run":
-                runs = int(payload.get("runs", 10))
-                domain = payload.get("domain", "dev")
-                result = BenchmarkRunner(service).run(runs=runs, domain=domain)
-                self._send(HTTPStatus.OK, result.to_dict())
+            parsed = urlparse(self.path)
+            handler, params = ROUTES["POST"].match(parsed.path)
+            if handler is not None:
+                self._respond(*handler(payload, params, parsed.query))
                 return
         except json.JSONDecodeError:
             self._send(HTTPStatus.BAD_REQUEST, {"error": "invalid json payload"})
@@ -88,74 +347,94 @@ class AegisWorldHandler(BaseHTTPRequestHandler):
             self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)})
             return
 
-        self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        self._send_not_found()
 
     def do_GET(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
-        path = parsed.path
-
-        if path == "/healthz":
-            self._send(HTTPStatus.OK, {"status": "ok"})
+        if parsed.path == "/healthz":
+            self.wfile.write(self._status_head(HTTPStatus.OK) + _HEALTHZ_RESPONSE)
             return
-
-        if path.startswith("/v1/goals/"):
-            goal_id = path.split("/")[3]
-            goal = service.get_goal(goal_id)
-            if goal is None:
-                self._send(HTTPStatus.NOT_FOUND, {"error": "goal not found"})
-            else:
-                self._send(HTTPStatus.OK, goal)
+        handler, params = ROUTES["GET"].match(parsed.path)
+        if handler is None:
+            self._send_not_found()
             return
+        self._respond(*handler({}, params, parsed.query))
 
-        if path.startswith("/v1/agents/") and path.endswith("/memory"):
-            agent_id = path.split("/")[3]
-            if agent_id not in service.agents:
-                self._send(HTTPStatus.NOT_FOUND, {"error": "agent not found"})
-                return
-            self._send(HTTPStatus.OK, service.get_memory(agent_id))
-            return
 
-        if path.startswith("/v1/agents/") and len(path.split("/")) == 4:
-            agent_id = path.split("/")[3]
-            agent = service.get_agent(agent_id)
-            if agent is None:
-                self._send(HTTPStatus.NOT_FOUND, {"error": "agent not found"})
-            else:
-                self._send(HTTPStatus.OK, agent)
-            return
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that hands connections to a fixed-size worker pool.
 
-        if path == "/v1/incidents":
-            self._send(HTTPStatus.OK, {"incidents": service.list_incidents()})
-            return
+    ``queued_signal`` is a socket that is readable exactly while accepted
+    connections are waiting for a worker; idle keep-alive handlers select on it
+    and give their worker up.
+    """
 
-        if path == "/v1/traces":
-            self._send(HTTPStatus.OK, {"traces": service.list_traces()})
-            return
+    def __init__(self, server_address: Tuple[str, int], handler_class: type, max_workers: int) -> None:
+        super().__init__(server_address, handler_class)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aegis-http")
+        self._queued = 0
+        self._queued_lock = threading.Lock()
+        self.queued_signal, self._queued_notify = socket.socketpair()
 
-        if path == "/v1/reflections":
-            self._send(HTTPStatus.OK, {"reflections": service.list_reflections()})
-            return
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._queued_lock:
+            self._queued += 1
+            if self._queued == 1:
+                self._queued_notify.send(b"\0")
+        self._pool.submit(self._process_queued, request, client_address)
 
-        if path == "/v1/changes":
-            self._send(HTTPStatus.OK, {"changes": service.list_changes()})
-            return
+    def _process_queued(self, request: Any, client_address: Any) -> None:
+        with self._queued_lock:
+            self._queued -= 1
+            if self._queued == 0:
+                self.queued_signal.recv(1)
+        self.process_request_thread(request, client_address)
 
-        if path == "/v1/learning/summary":
-            self._send(HTTPStatus.OK, service.learning_summary())
-            return
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=True)
+        self.queued_signal.close()
+        self._queued_notify.close()
 
-        if path == "/v1/metrics":
-            self._send(HTTPStatus.OK, service.metrics())
-            return
 
-        self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+def default_http_threads() -> int:
+    return int(os.environ.get("AEGIS_HTTP_THREADS", "32"))
 
 
-def run_server(host: str = "0.0.0.0", port: int = 8080) -> None:
-    httpd = ThreadingHTTPServer((host, port), AegisWorldHandler)
-    print(f"AegisWorld API listening on http://{host}:{port}")
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 8080,
+    http_threads: Optional[int] = None,
+    access_log: Optional[bool] = None,
+) -> None:
+    threads = http_threads or default_http_threads()
+    if access_log is not None:
+        AegisWorldHandler.access_log = access_log
+    httpd = PooledHTTPServer((host, port), AegisWorldHandler, max_workers=threads)
+    print(f"AegisWorld API listening on http://{host}:{port} ({threads} HTTP threads)")
     httpd.serve_forever()
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the AegisWorld API server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", default=8080, type=int)
+    parser.add_argument(
+        "--http-threads",
+        type=int,
+        default=None,
+        help="Worker threads serving requests (default: $AEGIS_HTTP_THREADS or 32)",
+    )
+    parser.add_argument(
+        "--no-access-log",
+        dest="access_log",
+        action="store_false",
+        default=None,
+        help="Log only error responses (default: log every request unless $AEGIS_HTTP_ACCESS_LOG=0)",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    run_server()
+    args = parse_args()
+    run_server(host=args.host, port=args.port, http_threads=args.http_threads, access_log=args.access_log)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import re
+from collections.abc import Iterable
 from uuid import uuid4
 
 from app.models import (
@@ -12,28 +13,48 @@ from app.models import (
 )
 
 
+TOOL_RESOLUTION_FAILURE = "tool_resolution_failure"
+LATENCY_BUDGET_EXCEEDED = "latency_budget_exceeded"
+POLICY_DENIAL = "policy_denial"
+UNKNOWN_FAILURE = "unknown_failure"
+FAILURE_CLASSES = (TOOL_RESOLUTION_FAILURE, LATENCY_BUDGET_EXCEEDED, POLICY_DENIAL, UNKNOWN_FAILURE)
+
+_FAILURE_KEYWORDS = re.compile(r"tool|not found|timeout|latency|policy|deny", re.IGNORECASE)
+_FAILURE_SIGNAL = re.compile(r"fail|error", re.IGNORECASE)
+
+
 def classify_failure(step_text: str) -> str:
-    text = step_text.lower()
-    if "tool" in text and "not found" in text:
-        return "tool_resolution_failure"
-    if "timeout" in text or "latency" in text:
-        return "latency_budget_exceeded"
-    if "policy" in text and "deny" in text:
-        return "policy_denial"
-    return "unknown_failure"
+    hits = {keyword.lower() for keyword in _FAILURE_KEYWORDS.findall(step_text)}
+    if "tool" in hits and "not found" in hits:
+        return TOOL_RESOLUTION_FAILURE
+    if "timeout" in hits or "latency" in hits:
+        return LATENCY_BUDGET_EXCEEDED
+    if "policy" in hits and "deny" in hits:
+        return POLICY_DENIAL
+    return UNKNOWN_FAILURE
 
 
-def cluster_failures(step_strings: list[str]) -> ClusterResult:
-    clusters: dict[str, list[str]] = defaultdict(list)
+def group_failures(step_strings: Iterable[str]) -> dict[str, list[str]]:
+    clusters: dict[str, list[str]] = {failure_class: [] for failure_class in FAILURE_CLASSES}
+    # Trace batches repeat the same step text heavily, so each distinct string is classified once.
+    seen: dict[str, list[str]] = {}
     for step in step_strings:
-        cluster = classify_failure(step)
-        clusters[cluster].append(step)
-    return ClusterResult(clusters=dict(clusters))
+        bucket = seen.get(step)
+        if bucket is None:
+            bucket = seen[step] = clusters[classify_failure(step)]
+        bucket.append(step)
+    return {failure_class: steps for failure_class, steps in clusters.items() if steps}
+
+
+def cluster_failures(step_strings: list[str]) -> ClusterResult:
+    return ClusterResult(clusters=group_failures(step_strings))
 
 
 def synthesize_reflection(request: ReflectionRequest) -> ReflectionRecord:
-    failure_steps = [s for s in request.trace.steps if "fail" in s.lower() or "error" in s.lower()]
-    representative = failure_steps[0] if failure_steps else "no explicit failure step found"
+    representative = next(
+        (step for step in request.trace.steps if _FAILURE_SIGNAL.search(step)),
+        "no explicit failure step found",
+    )
     failure_class = classify_failure(representative)
 
     return ReflectionRecord(
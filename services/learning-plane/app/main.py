@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-from app.engine import cluster_failures, evaluate_patch, synthesize_reflection
+from app.engine import evaluate_patch, group_failures, synthesize_reflection
 from app.models import (
     ClusterRequest,
     ClusterResult,
@@ -12,20 +13,24 @@ from app.models import (
     ReflectionRequest,
 )
 
-app = FastAPI(title="AegisWorld Learning Plane", version="0.1.0")
+app = FastAPI(
+    title="AegisWorld Learning Plane",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 
 @app.get("/healthz")
-def healthz() -> dict[str, str]:
+async def healthz() -> dict[str, str]:
     return {"status": "ok", "service": "learning-plane"}
 
 
 @app.post("/v1/learning/cluster-failures", response_model=ClusterResult)
-def cluster(req: ClusterRequest) -> ClusterResult:
-    steps: list[str] = []
-    for trace in req.traces:
-        steps.extend(trace.steps)
-    return cluster_failures(steps)
+def cluster(req: ClusterRequest) -> ORJSONResponse:
+    # Clusters can hold thousands of step strings; hand the plain dict to orjson
+    # instead of building a ClusterResult only for FastAPI to dump it again.
+    steps = (step for trace in req.traces for step in trace.steps)
+    return ORJSONResponse({"clusters": group_failures(steps)})
 
 
 @app.post("/v1/learning/reflect", response_model=ReflectionRecord)
@@ -36,4 +41,3 @@ def reflect(req: ReflectionRequest) -> ReflectionRecord:
 @app.post("/v1/learning/evaluate-patch", response_model=EvaluatePatchResponse)
 def evaluate(req: EvaluatePatchRequest) -> EvaluatePatchResponse:
     return evaluate_patch(req)
-
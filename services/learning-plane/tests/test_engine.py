@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from app.engine import cluster_failures, evaluate_patch, synthesize_reflection
+from app.engine import (
+    classify_failure,
+    cluster_failures,
+    evaluate_patch,
+    group_failures,
+    synthesize_reflection,
+)
 from app.models import EvaluatePatchRequest, ReflectionRequest, TaskTrace
 
 
@@ -46,3 +52,14 @@ def test_patch_evaluation_rejects_regression() -> None:
     )
     assert response.recommendation == "reject"
 
+
+def test_classify_failure_keeps_precedence_and_ignores_case() -> None:
+    assert classify_failure("Policy DENY after Timeout") == "latency_budget_exceeded"
+    assert classify_failure("TOOL lookup: Not Found (timeout)") == "tool_resolution_failure"
+    assert classify_failure("policy review: deny") == "policy_denial"
+    assert classify_failure("all good") == "unknown_failure"
+
+
+def test_group_failures_matches_cluster_result() -> None:
+    steps = ["tool not found", "latency spike", "tool not found again"]
+    assert group_failures(steps) == cluster_failures(steps).clusters
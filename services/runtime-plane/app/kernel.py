@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from time import perf_counter
-from uuid import uuid4
+import re
+from functools import lru_cache
+from os import urandom
+from sys import intern
+from time import perf_counter_ns
+from uuid import UUID, uuid4
 
 from app.memory import TieredMemory
 from app.models import (
@@ -15,62 +19,95 @@ from app.models import (
 )
 from app.tool_registry import ToolRegistry
 
+_FAILURE_SIGNAL = re.compile(r"fail|error", re.IGNORECASE)
+
+# Fixed vocabulary repeated in every trace and memory entry.
+_SUCCESS = intern("success")
+_FAILURE = intern("failure")
+_ROUTER_MODEL_CALL = intern("router:general-purpose")
+
+# domain -> (plan step, tool) shared by _plan and _select_tools, in plan order.
+_DOMAIN_TABLE: dict[str, tuple[str, str]] = {
+    "social": ("prepare social tool payload", "social.publish"),
+    "dev": ("prepare dev pipeline payload", "dev.pipeline"),
+    "games": ("prepare game simulation payload", "games.simulate"),
+}
+
+# Runs rarely exceed a few dozen iterations; share the per-iteration tag strings.
+_CACHED_ITERATIONS = 64
+_ITERATION_TAGS = tuple(f"iteration-{i}" for i in range(1, _CACHED_ITERATIONS + 1))
+
+
+def _iteration_tag(idx: int) -> str:
+    return _ITERATION_TAGS[idx] if idx < _CACHED_ITERATIONS else f"iteration-{idx + 1}"
+
+
+@lru_cache(maxsize=4096)
+def _plan_parts(intent: str, domains: frozenset[str]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Fixed plan steps for an (intent, domains) pair; repeat intents skip rebuilding them."""
+    head = (f"analyze intent: {intent}", "decompose objective into tool tasks")
+    return head, tuple(step for domain, (step, _tool) in _DOMAIN_TABLE.items() if domain in domains)
+
+
+def _mint_ids(count: int) -> list[str]:
+    """Return ``count`` random UUID4 strings drawn from a single urandom read."""
+    raw = urandom(16 * count)
+    return [str(UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
 
 class AgentKernel:
+    """Adaptive plan/execute/observe loop behind ``/v1/runtime/execute``.
+
+    The request is validated at the API boundary; every model the kernel builds
+    from it is assembled from values it controls, so they are created with
+    ``model_construct`` and skip a second validation pass.
+    """
+
     def __init__(self, memory: TieredMemory, tool_registry: ToolRegistry) -> None:
         self._memory = memory
         self._tools = tool_registry
 
-    def _plan(self, intent: str, domains: list[str], observation_delta: dict[str, object]) -> list[str]:
-        steps = [f"analyze intent: {intent}", "decompose objective into tool tasks"]
+    def _plan(self, intent: str, domains: frozenset[str], observation_delta: dict[str, object]) -> list[str]:
+        head, domain_steps = _plan_parts(intent, domains)
         if observation_delta:
-            steps.append(f"adapt plan using deltas: {sorted(observation_delta.keys())}")
-        if "social" in domains:
-            steps.append("prepare social tool payload")
-        if "dev" in domains:
-            steps.append("prepare dev pipeline payload")
-        if "games" in domains:
-            steps.append("prepare game simulation payload")
-        return steps
-
-    def _select_tools(self, domains: list[str], allowances: list[str]) -> list[str]:
-        candidates = []
-        if "social" in domains:
-            candidates.append("social.publish")
-        if "dev" in domains:
-            candidates.append("dev.pipeline")
-        if "games" in domains:
-            candidates.append("games.simulate")
+            return [*head, f"adapt plan using deltas: {sorted(observation_delta.keys())}", *domain_steps]
+        return [*head, *domain_steps]
+
+    def _select_tools(self, domains: frozenset[str], allowances: list[str]) -> list[str]:
+        allowed = frozenset(allowances)
+        candidates = [tool for domain, (_step, tool) in _DOMAIN_TABLE.items() if domain in domains]
         candidates.append("ops.observe")
-        return [tool for tool in candidates if tool in allowances and self._tools.has_tool(tool)]
+        return [tool for tool in candidates if tool in allowed and self._tools.has_tool(tool)]
 
-    def _delta(self, previous: dict[str, object], current: dict[str, object]) -> dict[str, object]:
-        delta: dict[str, object] = {}
-        all_keys = set(previous) | set(current)
-        for key in all_keys:
-            if previous.get(key) != current.get(key):
-                delta[key] = {"before": previous.get(key), "after": current.get(key)}
-        return delta
+    @staticmethod
+    def _write_context(
+        context: dict[str, object], delta: dict[str, object], key: str, value: object
+    ) -> None:
+        before = context.get(key)
+        if before != value:
+            delta[key] = {"before": before, "after": value}
+        context[key] = value
 
     def execute(self, request: ExecuteRequest) -> ExecuteResponse:
-        run_id = str(uuid4())
-        trace_id = str(uuid4())
-        start = perf_counter()
+        run_id, trace_id = _mint_ids(2)
+        start = perf_counter_ns()
 
         steps: list[str] = []
         reflections: list[ReflectionRecord] = []
         rationales: list[ActionRationale] = []
         observations: list[IterationObservation] = list(request.iteration_observations)
         tool_calls: list[str] = []
-        outcome = "success"
-
-        self._memory.append_episodic(
-            run_id,
-            event=f"run started for goal {request.goal.goal_id}",
-            cause="execute invoked",
-            effect="initialized adaptive runtime loop",
-            tags=["run-start"],
-        )
+        outcome = _SUCCESS
+
+        # Episodic entries for this run are collected locally and flushed with one extend.
+        episodic = [
+            self._memory.entry(
+                event=f"run started for goal {request.goal.goal_id}",
+                cause="execute invoked",
+                effect="initialized adaptive runtime loop",
+                tags=("run-start",),
+            )
+        ]
         self._memory.append_session(
             request.goal.goal_id,
             event=f"intent={request.goal.intent}",
@@ -79,11 +116,12 @@ class AgentKernel:
             tags=["goal-context"],
         )
 
-        selected_tools = self._select_tools(request.goal.domains, request.policy.tool_allowances)
+        domains = frozenset(map(intern, request.goal.domains))
+        selected_tools = self._select_tools(domains, request.policy.tool_allowances)
         if not selected_tools:
-            outcome = "failure"
+            outcome = _FAILURE
             reflections.append(
-                ReflectionRecord(
+                ReflectionRecord.model_construct(
                     reflection_id=str(uuid4()),
                     failure_class="no_tool_selected",
                     root_cause="policy tool allowances excluded all domain tools",
@@ -93,7 +131,7 @@ class AgentKernel:
                 )
             )
             rationales.append(
-                ActionRationale(
+                ActionRationale.model_construct(
                     iteration=0,
                     action="tool-selection",
                     decision="escalate",
@@ -104,38 +142,42 @@ class AgentKernel:
         failure_streak = 0
         current_context = dict(request.context_snapshot)
         policy_adjustment_suggestion: PolicyAdjustmentSuggestion | None = None
+        intent = request.goal.intent
+        execute_tool = self._tools.execute
+        record = episodic.append
+        make_entry = self._memory.entry
+        max_iterations = request.max_iterations
+        last_iteration = max_iterations - 1
 
-        for idx in range(request.max_iterations):
-            if outcome == "failure" and not selected_tools:
+        for idx in range(max_iterations):
+            if outcome == _FAILURE and not selected_tools:
                 break
 
-            previous_context = dict(current_context)
-            planning_steps = self._plan(request.goal.intent, request.goal.domains, observations[-1].delta if observations else {})
+            iteration_tag = _iteration_tag(idx)
+            planning_steps = self._plan(intent, domains, observations[-1].delta if observations else {})
             iteration_step = f"iteration {idx + 1}: {' | '.join(planning_steps)}"
             steps.append(iteration_step)
-            self._memory.append_episodic(
-                run_id,
-                event=iteration_step,
-                cause="iteration start",
-                effect="plan refreshed from latest observation delta",
-                tags=["replan", f"iteration-{idx + 1}"],
+            record(
+                make_entry(
+                    event=iteration_step,
+                    cause="iteration start",
+                    effect="plan refreshed from latest observation delta",
+                    tags=("replan", iteration_tag),
+                )
             )
 
-            results: list[str] = []
-            for tool in selected_tools:
-                result = self._tools.execute(tool, request.goal.intent)
-                tool_calls.append(tool)
-                results.append(result)
+            results = [execute_tool(tool, intent) for tool in selected_tools]
+            tool_calls.extend(selected_tools)
 
-            has_failure_signal = any("fail" in result.lower() or "error" in result.lower() for result in results)
+            has_failure_signal = any(_FAILURE_SIGNAL.search(result) for result in results)
             failure_streak = failure_streak + 1 if has_failure_signal else 0
-            status = "failure" if has_failure_signal else "success"
+            status = _FAILURE if has_failure_signal else _SUCCESS
 
-            current_context["last_status"] = status
-            current_context["failure_streak"] = failure_streak
-            delta = self._delta(previous_context, current_context)
+            delta: dict[str, object] = {}
+            self._write_context(current_context, delta, "last_status", status)
+            self._write_context(current_context, delta, "failure_streak", failure_streak)
 
-            observation = IterationObservation(
+            observation = IterationObservation.model_construct(
                 iteration=idx + 1,
                 tool_results=results,
                 delta=delta,
@@ -148,13 +190,13 @@ class AgentKernel:
             if failure_streak >= 2:
                 decision = "escalate"
                 reason = "Repeated failure signals detected across iterations."
-                outcome = "failure"
-            elif idx == request.max_iterations - 1:
+                outcome = _FAILURE
+            elif idx == last_iteration:
                 decision = "stop"
                 reason = "Reached configured max iterations."
 
             rationales.append(
-                ActionRationale(
+                ActionRationale.model_construct(
                     iteration=idx + 1,
                     action="execute-tools",
                     decision=decision,
@@ -162,17 +204,18 @@ class AgentKernel:
                 )
             )
 
-            self._memory.append_episodic(
-                run_id,
-                event=f"iteration {idx + 1} decision={decision}",
-                cause=f"observation status={status}",
-                effect=reason,
-                tags=[decision, f"iteration-{idx + 1}"],
+            record(
+                make_entry(
+                    event=f"iteration {idx + 1} decision={decision}",
+                    cause=f"observation status={status}",
+                    effect=reason,
+                    tags=(decision, iteration_tag),
+                )
             )
 
             if decision == "escalate":
                 reflections.append(
-                    ReflectionRecord(
+                    ReflectionRecord.model_construct(
                         reflection_id=str(uuid4()),
                         failure_class="repeated_execution_failures",
                         root_cause="tool outputs repeatedly signaled failure",
@@ -181,7 +224,7 @@ class AgentKernel:
                         memory_patch="record repeated-failure pattern for policy review",
                     )
                 )
-                policy_adjustment_suggestion = PolicyAdjustmentSuggestion(
+                policy_adjustment_suggestion = PolicyAdjustmentSuggestion.model_construct(
                     title="Norm proposal: adaptive fallback allowance",
                     trigger="Two consecutive failing observations.",
                     recommendation=(
@@ -194,11 +237,13 @@ class AgentKernel:
             if decision == "stop":
                 break
 
-        elapsed = perf_counter() - start
-        latency_ms = int(elapsed * 1000)
-        token_cost = round(1.2 + len(steps) * 0.05 + len(tool_calls) * 0.02, 4)
+        latency_ms = (perf_counter_ns() - start) // 1_000_000
+        # Fixed-point in 1e-4 units: 1.2 + 0.05/step + 0.02/tool call, one exact division.
+        token_cost = (12_000 + len(steps) * 500 + len(tool_calls) * 200) / 10_000
+
+        self._memory.extend_episodic(run_id, episodic)
 
-        if outcome == "success":
+        if outcome == _SUCCESS:
             self._memory.append_semantic(
                 "successful_patterns",
                 event=f"goal={request.goal.goal_id}",
@@ -215,18 +260,18 @@ class AgentKernel:
                 tags=["failure", "policy-review"],
             )
 
-        trace = TaskTrace(
+        trace = TaskTrace.model_construct(
             trace_id=trace_id,
             goal_id=request.goal.goal_id,
             steps=steps,
             tool_calls=tool_calls,
-            model_calls=["router:general-purpose"],
+            model_calls=[_ROUTER_MODEL_CALL],
             latency_ms=latency_ms,
             token_cost=token_cost,
             outcome=outcome,
         )
 
-        return ExecuteResponse(
+        return ExecuteResponse.model_construct(
             trace=trace,
             reflections=reflections,
             observations=observations,
@@ -235,6 +280,6 @@ class AgentKernel:
             memory_entries=self._memory.snapshot(
                 run_id=run_id,
                 goal_id=request.goal.goal_id,
-                topic="successful_patterns" if outcome == "success" else "failure_patterns",
+                topic="successful_patterns" if outcome == _SUCCESS else "failure_patterns",
             ),
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 
 from app.kernel import AgentKernel
 from app.memory import TieredMemory
@@ -8,21 +9,29 @@ from app.models import ExecuteRequest, ExecuteResponse
 from app.policy import evaluate
 from app.tool_registry import ToolRegistry
 
-app = FastAPI(title="AegisWorld Runtime Plane", version="0.1.0")
+app = FastAPI(
+    title="AegisWorld Runtime Plane",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 memory = TieredMemory()
 tools = ToolRegistry()
 kernel = AgentKernel(memory=memory, tool_registry=tools)
 
 
 @app.get("/healthz")
-def healthz() -> dict[str, str]:
+async def healthz() -> dict[str, str]:
     return {"status": "ok", "service": "runtime-plane"}
 
 
 @app.post("/v1/runtime/execute", response_model=ExecuteResponse)
-def execute_runtime(request: ExecuteRequest) -> ExecuteResponse:
+def execute_runtime(request: ExecuteRequest) -> Response:
+    # Sync on purpose: a kernel run is CPU-bound for up to MAX_EXECUTE_ITERATIONS, so it
+    # holds one threadpool thread instead of the event loop every other route shares.
     decision = evaluate(request.policy)
     if not decision.allowed:
         raise HTTPException(status_code=422, detail={"error": "policy_denied", "reasons": decision.reasons})
-    return kernel.execute(request)
+    # The kernel already returns a validated ExecuteResponse; serialize it straight
+    # to JSON in pydantic-core instead of letting FastAPI re-validate and re-encode it.
+    return Response(content=kernel.execute(request).model_dump_json(), media_type="application/json")
 
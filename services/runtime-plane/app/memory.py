@@ -1,40 +1,113 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
-from typing import Any
+from collections import defaultdict
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, NamedTuple
 
 
-class TieredMemory:
-    def __init__(self) -> None:
-        self._episodic: dict[str, deque[dict[str, Any]]] = defaultdict(lambda: deque(maxlen=100))
-        self._session: dict[str, deque[dict[str, Any]]] = defaultdict(lambda: deque(maxlen=200))
-        self._semantic: dict[str, deque[dict[str, Any]]] = defaultdict(lambda: deque(maxlen=500))
+class MemoryEntry(NamedTuple):
+    """Stored row for one memory event; read APIs expose it as a plain dict."""
 
-    def _entry(self, event: str, cause: str, effect: str, tags: list[str] | None = None) -> dict[str, Any]:
+    event: str
+    cause: str
+    effect: str
+    tags: tuple[str, ...] = ()
+
+    def as_dict(self) -> dict[str, Any]:
         return {
-            "event": event,
-            "cause": cause,
-            "effect": effect,
-            "tags": tags or [],
+            "event": self.event,
+            "cause": self.cause,
+            "effect": self.effect,
+            "tags": list(self.tags),
         }
 
+
+class BoundedLog:
+    """Append-only ring of at most ``capacity`` items, oldest dropped first.
+
+    Backed by a plain list that only grows to its actual size before wrapping,
+    so the many short per-run logs do not each pay for a 64-slot deque block.
+    """
+
+    __slots__ = ("_items", "_head", "_capacity")
+
+    def __init__(self, capacity: int) -> None:
+        self._items: list[MemoryEntry] = []
+        self._head = 0
+        self._capacity = capacity
+
+    def append(self, item: MemoryEntry) -> None:
+        if len(self._items) < self._capacity:
+            self._items.append(item)
+        else:
+            self._items[self._head] = item
+            self._head = (self._head + 1) % self._capacity
+
+    def extend(self, items: Iterable[MemoryEntry]) -> None:
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        items, head = self._items, self._head
+        if head:
+            return chain(islice(items, head, None), islice(items, head))
+        return iter(items)
+
+
+class TieredMemory:
+    """Per-key bounded event history in three tiers.
+
+    Entries are kept as compact ``MemoryEntry`` tuples rather than one dict per
+    event and are only expanded to dicts when read.
+    """
+
+    def __init__(self) -> None:
+        self._episodic: dict[str, BoundedLog] = defaultdict(lambda: BoundedLog(100))
+        self._session: dict[str, BoundedLog] = defaultdict(lambda: BoundedLog(200))
+        self._semantic: dict[str, BoundedLog] = defaultdict(lambda: BoundedLog(500))
+
+    @staticmethod
+    def entry(event: str, cause: str, effect: str, tags: Iterable[str] | None = None) -> MemoryEntry:
+        return MemoryEntry(event, cause, effect, tuple(tags) if tags else ())
+
     def append_episodic(self, run_id: str, event: str, cause: str, effect: str, tags: list[str] | None = None) -> None:
-        self._episodic[run_id].append(self._entry(event=event, cause=cause, effect=effect, tags=tags))
+        self._episodic[run_id].append(self.entry(event=event, cause=cause, effect=effect, tags=tags))
 
     def append_session(self, goal_id: str, event: str, cause: str, effect: str, tags: list[str] | None = None) -> None:
-        self._session[goal_id].append(self._entry(event=event, cause=cause, effect=effect, tags=tags))
+        self._session[goal_id].append(self.entry(event=event, cause=cause, effect=effect, tags=tags))
 
     def append_semantic(self, topic: str, event: str, cause: str, effect: str, tags: list[str] | None = None) -> None:
-        self._semantic[topic].append(self._entry(event=event, cause=cause, effect=effect, tags=tags))
+        self._semantic[topic].append(self.entry(event=event, cause=cause, effect=effect, tags=tags))
+
+    def extend_episodic(self, run_id: str, entries: Iterable[MemoryEntry]) -> None:
+        self._episodic[run_id].extend(entries)
+
+    def extend_session(self, goal_id: str, entries: Iterable[MemoryEntry]) -> None:
+        self._session[goal_id].extend(entries)
+
+    def extend_semantic(self, topic: str, entries: Iterable[MemoryEntry]) -> None:
+        self._semantic[topic].extend(entries)
 
     def read_episodic(self, run_id: str) -> list[dict[str, Any]]:
-        return list(self._episodic.get(run_id, []))
+        return [row.as_dict() for row in self._episodic.get(run_id, ())]
 
     def read_session(self, goal_id: str) -> list[dict[str, Any]]:
-        return list(self._session.get(goal_id, []))
+        return [row.as_dict() for row in self._session.get(goal_id, ())]
 
     def read_semantic(self, topic: str) -> list[dict[str, Any]]:
-        return list(self._semantic.get(topic, []))
+        return [row.as_dict() for row in self._semantic.get(topic, ())]
+
+    def iter_episodic(self, run_id: str) -> Iterator[MemoryEntry]:
+        return iter(self._episodic.get(run_id, ()))
+
+    def iter_session(self, goal_id: str) -> Iterator[MemoryEntry]:
+        return iter(self._session.get(goal_id, ()))
+
+    def iter_semantic(self, topic: str) -> Iterator[MemoryEntry]:
+        return iter(self._semantic.get(topic, ()))
 
     def snapshot(self, run_id: str, goal_id: str, topic: str) -> dict[str, list[dict[str, Any]]]:
         return {
@@ -4,7 +4,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Each iteration records two episodic entries on top of the run-start entry, so this
+# keeps a run within the 100-entry episodic log and bounds time spent in the kernel.
+MAX_EXECUTE_ITERATIONS = 49
 
 
 class RiskTolerance(str, Enum):
@@ -23,9 +27,30 @@ class GoalSpec(BaseModel):
     domains: list[str]
 
 
+class ResourceLimits(BaseModel):
+    """Typed view of the limits the policy gate checks; other limit keys pass through."""
+
+    model_config = ConfigDict(extra="allow")
+
+    max_runtime_seconds: int = 0
+    max_memory: str = ""
+
+    # Lax on purpose: clients send e.g. 60.5 or "1200" for the runtime and 2048 for the
+    # memory, which the gate has always accepted via int() / str().
+    @field_validator("max_runtime_seconds", mode="before")
+    @classmethod
+    def _coerce_runtime(cls, value: Any) -> Any:
+        return int(value) if isinstance(value, (int, float, str)) else value
+
+    @field_validator("max_memory", mode="before")
+    @classmethod
+    def _coerce_memory(cls, value: Any) -> str:
+        return value if isinstance(value, str) else str(value)
+
+
 class ExecutionPolicy(BaseModel):
     tool_allowances: list[str]
-    resource_limits: dict[str, Any]
+    resource_limits: ResourceLimits
     network_scope: str
     data_scope: str
     rollback_policy: str
@@ -78,7 +103,7 @@ class ExecuteRequest(BaseModel):
     governance_objectives: list[str] = Field(default_factory=list)
     governance_constraints: list[str] = Field(default_factory=list)
     iteration_observations: list[IterationObservation] = Field(default_factory=list)
-    max_iterations: int = 3
+    max_iterations: int = Field(default=3, ge=1, le=MAX_EXECUTE_ITERATIONS)
 
 
 class ExecuteResponse(BaseModel):
@@ -9,21 +9,25 @@ class PolicyDecision:
         self.reasons = reasons
 
 
+NETWORK_SCOPES = frozenset({"internal", "internet"})
+MAX_RUNTIME_SECONDS = 7200
+
+
 def evaluate(policy: ExecutionPolicy) -> PolicyDecision:
+    # resource_limits is coerced to ResourceLimits while the request is parsed,
+    # so the checks below read typed attributes directly.
     reasons: list[str] = []
-    max_runtime = int(policy.resource_limits.get("max_runtime_seconds", 0))
-    max_memory = str(policy.resource_limits.get("max_memory", ""))
+    limits = policy.resource_limits
 
-    if max_runtime <= 0:
+    if limits.max_runtime_seconds <= 0:
         reasons.append("max_runtime_seconds must be positive")
-    if max_runtime > 7200:
+    if limits.max_runtime_seconds > MAX_RUNTIME_SECONDS:
         reasons.append("max_runtime_seconds exceeds upper bound")
     if not policy.tool_allowances:
         reasons.append("at least one tool allowance is required")
-    if policy.network_scope not in {"internal", "internet"}:
+    if policy.network_scope not in NETWORK_SCOPES:
         reasons.append("invalid network_scope")
-    if not max_memory:
+    if not limits.max_memory:
         reasons.append("max_memory is required")
 
-    return PolicyDecision(allowed=len(reasons) == 0, reasons=reasons)
-
+    return PolicyDecision(allowed=not reasons, reasons=reasons)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from sys import intern
 from typing import Callable
 
 
@@ -8,11 +9,12 @@ ToolFn = Callable[[str], str]
 
 class ToolRegistry:
     def __init__(self) -> None:
+        # Built-in tools just prefix the payload; a bound str.__add__ skips the lambda frame.
         self._tools: dict[str, ToolFn] = {
-            "social.publish": lambda payload: f"scheduled social publish: {payload}",
-            "dev.pipeline": lambda payload: f"dev pipeline started: {payload}",
-            "games.simulate": lambda payload: f"game simulation launched: {payload}",
-            "ops.observe": lambda payload: f"telemetry captured: {payload}",
+            intern("social.publish"): "scheduled social publish: ".__add__,
+            intern("dev.pipeline"): "dev pipeline started: ".__add__,
+            intern("games.simulate"): "game simulation launched: ".__add__,
+            intern("ops.observe"): "telemetry captured: ".__add__,
         }
 
     def has_tool(self, name: str) -> bool:
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+from pydantic import ValidationError
+
 from app.kernel import AgentKernel
 from app.memory import TieredMemory
-from app.models import ExecuteRequest, ExecutionPolicy, GoalSpec, RiskTolerance
+from app.models import MAX_EXECUTE_ITERATIONS, ExecuteRequest, ExecutionPolicy, GoalSpec, RiskTolerance
 from app.tool_registry import ToolRegistry
 
 
@@ -94,3 +97,31 @@ def test_kernel_generates_reflection_when_no_tools_available() -> None:
     response = kernel.execute(request)
     assert response.trace.outcome == "failure"
     assert response.reflections
+
+
+def test_tiered_memory_extend_keeps_order_and_capacity() -> None:
+    memory = TieredMemory()
+    memory.append_episodic("run-1", event="start", cause="c", effect="e")
+    memory.extend_episodic(
+        "run-1",
+        (TieredMemory.entry(event=f"step-{i}", cause="c", effect="e") for i in range(150)),
+    )
+    events = [entry["event"] for entry in memory.read_episodic("run-1")]
+    assert len(events) == 100
+    assert events[0] == "step-50"
+    assert events[-1] == "step-149"
+
+
+@pytest.mark.parametrize("max_iterations", [0, MAX_EXECUTE_ITERATIONS + 1, 10_000_000])
+def test_execute_request_bounds_max_iterations(max_iterations: int) -> None:
+    goal = GoalSpec(
+        goal_id="g-3",
+        intent="deploy service",
+        constraints=[],
+        budget=10,
+        deadline=datetime.now(timezone.utc) + timedelta(days=1),
+        risk_tolerance=RiskTolerance.low,
+        domains=["dev"],
+    )
+    with pytest.raises(ValidationError):
+        ExecuteRequest(goal=goal, policy=_base_policy(["dev.pipeline"]), max_iterations=max_iterations)
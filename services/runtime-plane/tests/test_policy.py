@@ -30,3 +30,15 @@ def test_policy_accepts_valid_request() -> None:
     )
     assert decision.allowed
 
+
+def test_policy_coerces_numeric_memory_and_float_runtime() -> None:
+    policy = ExecutionPolicy(
+        tool_allowances=["dev.pipeline"],
+        resource_limits={"max_memory": 2048, "max_runtime_seconds": 60.5},
+        network_scope="internal",
+        data_scope="standard",
+        rollback_policy="on_failure",
+    )
+    assert policy.resource_limits.max_memory == "2048"
+    assert policy.resource_limits.max_runtime_seconds == 60
+    assert evaluate(policy).allowed
@@ -1,50 +1,67 @@
 from __future__ import annotations
 
+import re
 from uuid import uuid4
 
 from app.models import BlastRadius, IncidentIngestRequest, SecurityIncident, Severity
 
 
+_SEVERITY_KEYWORDS: dict[str, Severity] = {
+    "credential": Severity.critical,
+    "privilege_escalation": Severity.critical,
+    "anomalous": Severity.high,
+    "exfiltration": Severity.high,
+    "waf": Severity.medium,
+    "burst": Severity.medium,
+}
+# Case-sensitive and matched against lowercased signals: IGNORECASE would also fold
+# non-ASCII lookalikes ("burſt", "credentıal") that are not keys of the table.
+_SEVERITY_PATTERN = re.compile("|".join(map(re.escape, _SEVERITY_KEYWORDS)))
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(Severity)}
+
+
 def classify_severity(signals: list[str]) -> Severity:
-    joined = " ".join(signals).lower()
-    if "credential" in joined or "privilege_escalation" in joined:
-        return Severity.critical
-    if "anomalous" in joined or "exfiltration" in joined:
-        return Severity.high
-    if "waf" in joined or "burst" in joined:
-        return Severity.medium
-    return Severity.low
+    best = Severity.low
+    for signal in signals:
+        for match in _SEVERITY_PATTERN.finditer(signal.lower()):
+            severity = _SEVERITY_KEYWORDS[match.group()]
+            if severity is Severity.critical:
+                return severity
+            if _SEVERITY_RANK[severity] > _SEVERITY_RANK[best]:
+                best = severity
+    return best
 
 
 def estimate_blast_radius(severity: Severity, signals: list[str]) -> BlastRadius:
-    joined = " ".join(signals).lower()
     if severity == Severity.critical:
         return BlastRadius.global_scope
-    if "region" in joined:
+    if any("region" in signal.lower() for signal in signals):
         return BlastRadius.region
     if severity == Severity.high:
         return BlastRadius.service
     return BlastRadius.host
 
 
-def remediation_plan(severity: Severity) -> list[str]:
-    if severity == Severity.critical:
-        return [
-            "rotate-credentials",
-            "quarantine-workload",
-            "tighten-network-policy",
-            "redeploy-hardened-image",
-            "invalidate-sessions",
-        ]
-    if severity == Severity.high:
-        return [
-            "rotate-credentials",
-            "quarantine-workload",
-            "tighten-network-policy",
-        ]
-    if severity == Severity.medium:
-        return ["rate-limit-source", "tighten-waf-rule"]
-    return ["monitor-and-log"]
+_REMEDIATION_PLANS: dict[Severity, tuple[str, ...]] = {
+    Severity.critical: (
+        "rotate-credentials",
+        "quarantine-workload",
+        "tighten-network-policy",
+        "redeploy-hardened-image",
+        "invalidate-sessions",
+    ),
+    Severity.high: (
+        "rotate-credentials",
+        "quarantine-workload",
+        "tighten-network-policy",
+    ),
+    Severity.medium: ("rate-limit-source", "tighten-waf-rule"),
+}
+_DEFAULT_REMEDIATION_PLAN: tuple[str, ...] = ("monitor-and-log",)
+
+
+def remediation_plan(severity: Severity) -> tuple[str, ...]:
+    return _REMEDIATION_PLANS.get(severity, _DEFAULT_REMEDIATION_PLAN)
 
 
 def ingest_incident(request: IncidentIngestRequest) -> SecurityIncident:
@@ -29,12 +29,12 @@ class SecurityIncident(BaseModel):
     signal_set: list[str]
     severity: Severity
     blast_radius: BlastRadius
-    auto_actions: list[str]
+    auto_actions: tuple[str, ...]
     verification_state: str
 
 
 class RemediationResponse(BaseModel):
     incident_id: str
-    actions_started: list[str]
+    actions_started: tuple[str, ...]
     status: str
 
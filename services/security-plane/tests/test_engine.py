@@ -25,3 +25,13 @@ def test_ingest_incident_creates_actions() -> None:
     assert incident.incident_id
     assert incident.auto_actions
 
+
+def test_classify_severity_picks_highest_tier_across_signals() -> None:
+    assert classify_severity(["WAF burst", "Anomalous-API-call"]) == Severity.high
+    assert classify_severity(["waf", "leaked credentials"]) == Severity.critical
+    assert classify_severity(["routine scan"]) == Severity.low
+
+
+def test_classify_severity_ignores_non_ascii_case_folds() -> None:
+    assert classify_severity(["waf bur\u017ft"]) == Severity.medium
+    assert classify_severity(["leaked credent\u0131al"]) == Severity.low
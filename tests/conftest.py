@@ -3,6 +3,73 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from ai.improvement_loop import (  # noqa: E402
+    ImprovementLoop,
+    IterationStore,
+    ObjectiveEvaluator,
+    PatchGenerator,
+    PatchVerifier,
+    ReleaseManager,
+    TelemetryCollector,
+)
+
+
+CANNED_DIFF = """diff --git a/gameplay/config.yaml b/gameplay/config.yaml
+--- a/gameplay/config.yaml
++++ b/gameplay/config.yaml
+@@ -1,2 +1,2 @@
+-drop_rate: 0.10
++drop_rate: 0.08
+"""
+
+
+class FakeModelClient:
+    """Model client stub that always answers with the same canned diff."""
+
+    def complete(self, prompt: str) -> str:
+        assert "Constraints:" in prompt
+        return CANNED_DIFF
+
+
+@pytest.fixture(scope="session")
+def fake_model_client() -> FakeModelClient:
+    return FakeModelClient()
+
+
+@pytest.fixture(scope="module")
+def iteration_store(tmp_path_factory: pytest.TempPathFactory) -> IterationStore:
+    """One store per test module; tests in a module use distinct iteration ids."""
+    return IterationStore(root=tmp_path_factory.mktemp("iterations"))
+
+
+def _static_ok():
+    return True, "static ok"
+
+
+def _sim_ok():
+    return True, "sim ok"
+
+
+@pytest.fixture(scope="module")
+def improvement_loop(iteration_store: IterationStore, fake_model_client: FakeModelClient) -> ImprovementLoop:
+    """Loop with in-process passing checks, shared by the tests of one module.
+
+    None of its components keep per-iteration state, so reusing it only saves
+    rebuilding the collector, generator, verifier and release manager.
+    """
+    return ImprovementLoop(
+        telemetry_collector=TelemetryCollector(),
+        objective_evaluator=ObjectiveEvaluator(),
+        patch_generator=PatchGenerator(model_client=fake_model_client, prompt_version="v2"),
+        patch_verifier=PatchVerifier(
+            static_checks=[_static_ok], simulation_checks=[_sim_ok], parallel_checks=True
+        ),
+        release_manager=ReleaseManager(),
+        iteration_store=iteration_store,
+    )
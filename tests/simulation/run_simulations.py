@@ -10,20 +10,33 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import random
 import statistics
 from collections import deque
+from functools import cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from math import fsum, sqrt
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScenarioResult:
     name: str
     metrics: dict[str, float]
 
 
+class ThresholdFailure(NamedTuple):
+    """One metric outside its baseline bounds; reports expose it as a plain dict."""
+
+    scenario: str
+    metric: str
+    value: float
+    threshold: dict[str, Any]
+
+
 def _rng(seed: int = 42) -> random.Random:
     return random.Random(seed)
 
@@ -32,25 +45,29 @@ def economy_stress_test() -> ScenarioResult:
     """Simulate inflation/solvency behavior under repeated shocks."""
 
     rng = _rng(1001)
+    uniform, draw = rng.uniform, rng.random
     prices = [100.0]
     bankruptcies = 0
     agents = 300
+    draws_per_step = agents // 12
+    price = prices[0]
 
     for _ in range(120):
-        shock = rng.uniform(-0.018, 0.015)
-        demand = 1.0 + rng.uniform(-0.04, 0.08)
-        supply = 1.0 + rng.uniform(-0.07, 0.06)
+        shock = uniform(-0.018, 0.015)
+        demand = 1.0 + uniform(-0.04, 0.08)
+        supply = 1.0 + uniform(-0.07, 0.06)
         adjustment = 1 + shock + (demand - supply) * 0.045
-        next_price = max(20.0, prices[-1] * adjustment)
-        prices.append(next_price)
+        price = max(20.0, price * adjustment)
+        prices.append(price)
 
-        insolvency_risk = max(0.0, (next_price - 138.0) / 700.0)
-        for _ in range(agents // 12):
-            if rng.random() < insolvency_risk:
-                bankruptcies += 1
+        # Draws are taken even at zero risk to keep the seeded stream, and so
+        # the baselined KPIs, stable.
+        insolvency_risk = max(0.0, (price - 138.0) / 700.0)
+        bankruptcies += sum([draw() < insolvency_risk for _ in range(draws_per_step)])
 
     inflation_rate = (prices[-1] - prices[0]) / prices[0]
-    volatility = statistics.pstdev(prices) / statistics.mean(prices)
+    mean_price = statistics.fmean(prices)
+    volatility = sqrt(fsum((p - mean_price) ** 2 for p in prices) / len(prices)) / mean_price
     bankruptcy_rate = bankruptcies / agents
     return ScenarioResult(
         name="economy_stress_test",
@@ -66,23 +83,20 @@ def combat_difficulty_progression() -> ScenarioResult:
     """Simulate win-rates by level and verify smooth progression."""
 
     rng = _rng(1002)
+    draw = rng.random
+    attempts = 500
     win_rates = []
-    monotonic_penalties = 0
 
     for level in range(1, 11):
-        wins = 0
-        attempts = 500
         expected = max(0.15, 0.78 - level * 0.06)
-        for _ in range(attempts):
-            swing = rng.uniform(-0.04, 0.04)
-            if rng.random() < expected + swing:
-                wins += 1
-        rate = wins / attempts
-        win_rates.append(rate)
+        # Inlined rng.uniform(-0.04, 0.04) swing, drawn before the roll on each
+        # attempt so the seeded stream matches the recorded baselines.
+        wins = sum([(-0.04 + 0.08 * draw()) + expected > draw() for _ in range(attempts)])
+        win_rates.append(wins / attempts)
 
-    for i in range(1, len(win_rates)):
-        if win_rates[i] > win_rates[i - 1] + 0.03:
-            monotonic_penalties += 1
+    monotonic_penalties = sum(
+        later > earlier + 0.03 for earlier, later in zip(win_rates, win_rates[1:])
+    )
 
     return ScenarioResult(
         name="combat_difficulty_progression",
@@ -149,20 +163,49 @@ def quest_deadlock_detection() -> ScenarioResult:
     )
 
 
-def _path_exists(grid: list[list[int]], start: tuple[int, int], goal: tuple[int, int]) -> tuple[bool, int]:
-    n = len(grid)
-    q = deque([(start, 0)])
-    seen = {start}
-
-    while q:
-        (x, y), d = q.popleft()
-        if (x, y) == goal:
-            return True, d
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < n and 0 <= ny < n and grid[nx][ny] == 0 and (nx, ny) not in seen:
-                seen.add((nx, ny))
-                q.append(((nx, ny), d + 1))
+@cache
+def _grid_masks(n: int) -> tuple[int, int, int]:
+    """Full-grid mask plus masks clearing column 0 and column n - 1 for an n x n grid."""
+    full = (1 << (n * n)) - 1
+    first_col = sum(1 << (row * n) for row in range(n))
+    return full, full & ~first_col, full & ~(first_col << (n - 1))
+
+
+def _pack_cells(cells: Iterable[bool]) -> int:
+    """Pack row-major cell flags into an int, the first cell in bit 0."""
+    return int("".join(["1" if cell else "0" for cell in cells])[::-1] or "0", 2)
+
+
+def _path_exists_packed(blocked: int, n: int, start: int, goal: int) -> tuple[bool, int]:
+    """Breadth-first flood fill over an n x n grid packed into one int, one bit per cell.
+
+    Cell ``(x, y)`` is bit ``x * n + y`` and set bits in ``blocked`` are
+    obstacles. Each step shifts the whole frontier by a row (``n``) and by a
+    column (``1``, masked so it cannot wrap between rows), so a step costs a
+    handful of big-int operations instead of a neighbour loop. The number of
+    steps taken is the BFS distance.
+    """
+    start_bit = 1 << start
+    goal_bit = 1 << goal
+    if start_bit == goal_bit:
+        return True, 0
+
+    full, not_first_col, not_last_col = _grid_masks(n)
+    free = full & ~blocked
+
+    visited = frontier = start_bit
+    dist = 0
+    while frontier:
+        dist += 1
+        frontier = (
+            (frontier << n)
+            | (frontier >> n)
+            | ((frontier << 1) & not_first_col)
+            | ((frontier >> 1) & not_last_col)
+        ) & free & ~visited
+        if frontier & goal_bit:
+            return True, dist
+        visited |= frontier
 
     return False, 0
 
@@ -171,18 +214,21 @@ def npc_navigation_pathing_robustness() -> ScenarioResult:
     """Measure pathfinding success over noisy obstacle maps."""
 
     rng = _rng(1003)
+    draw = rng.random
     trials = 80
     successes = 0
     lengths = []
+    n = 14
+    cells = range(n * n)
+    start, goal = 0, n * n - 1
+    # Obstacle maps go straight from the row-major draws to a packed bitmask,
+    # with the start and goal corners always cleared.
+    corners = ~((1 << start) | (1 << goal))
 
     for _ in range(trials):
-        n = 14
-        grid = [[0 if rng.random() > 0.22 else 1 for _ in range(n)] for _ in range(n)]
-        start, goal = (0, 0), (n - 1, n - 1)
-        grid[0][0] = 0
-        grid[n - 1][n - 1] = 0
+        blocked = _pack_cells([draw() <= 0.22 for _ in cells]) & corners
 
-        found, dist = _path_exists(grid, start, goal)
+        found, dist = _path_exists_packed(blocked, n, start, goal)
         if found:
             successes += 1
             manhattan = (n - 1) * 2
@@ -218,7 +264,14 @@ def save_load_migration_invariants() -> ScenarioResult:
     ]
 
     def migrate(save: dict[str, Any]) -> dict[str, Any]:
-        out = json.loads(json.dumps(save))
+        # The save schema is fixed, so cloning its nested containers is enough
+        # to keep the source save untouched.
+        out = {
+            **save,
+            "player": dict(save["player"]),
+            "quests": [dict(quest) for quest in save["quests"]],
+            "inventory": list(save["inventory"]),
+        }
         if out["version"] == 1:
             out["economy"] = {"shards": out["player"].pop("gold")}
             out["version"] = 2
@@ -251,91 +304,128 @@ def save_load_migration_invariants() -> ScenarioResult:
     )
 
 
-def load_baseline(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+# (scenario, metric) -> (min, max, raw threshold config as written in the baseline)
+ThresholdTable = dict[tuple[str, str], tuple[float | None, float | None, dict[str, Any]]]
+
+
+def load_baseline(path: Path) -> ThresholdTable:
+    """Load a KPI baseline and flatten it into one lookup per scenario metric."""
+    raw = json.loads(path.read_bytes())
+    return {
+        (scenario, metric): (cfg.get("min"), cfg.get("max"), cfg)
+        for scenario, metrics in raw["scenarios"].items()
+        for metric, cfg in metrics.items()
+    }
 
 
 def evaluate_thresholds(
-    results: list[ScenarioResult], baseline: dict[str, Any]
-) -> tuple[list[dict[str, Any]], bool]:
-    failures: list[dict[str, Any]] = []
+    results: Sequence[ScenarioResult], baseline: ThresholdTable
+) -> tuple[list[ThresholdFailure], bool]:
+    failures: list[ThresholdFailure] = []
 
     for result in results:
-        scenario_cfg = baseline["scenarios"][result.name]
+        name = result.name
         for metric_name, value in result.metrics.items():
-            metric_cfg = scenario_cfg[metric_name]
-            min_v = metric_cfg.get("min")
-            max_v = metric_cfg.get("max")
-            passed = True
-            if min_v is not None and value < min_v:
-                passed = False
-            if max_v is not None and value > max_v:
-                passed = False
-            if not passed:
-                failures.append(
-                    {
-                        "scenario": result.name,
-                        "metric": metric_name,
-                        "value": value,
-                        "threshold": metric_cfg,
-                    }
-                )
+            min_v, max_v, metric_cfg = baseline[(name, metric_name)]
+            if (min_v is not None and value < min_v) or (max_v is not None and value > max_v):
+                failures.append(ThresholdFailure(name, metric_name, value, metric_cfg))
 
     return failures, not failures
 
 
+_encode_compact = json.JSONEncoder(separators=(",", ":")).encode
+_encode_pretty = json.JSONEncoder(indent=2).encode
+
+# ThresholdFailure fields, in order, are exactly the row's format arguments.
+_FAILURE_ROW = "- `%s.%s` = %.4f outside %s".__mod__
+
+
 def write_artifacts(
-    output_dir: Path, version: str, results: list[ScenarioResult], failures: list[dict[str, Any]]
+    output_dir: Path,
+    version: str,
+    results: Sequence[ScenarioResult],
+    failures: Sequence[ThresholdFailure],
+    pretty: bool = False,
 ) -> None:
-    version_dir = output_dir / version
-    version_dir.mkdir(parents=True, exist_ok=True)
+    """Write the metrics and comparison JSON plus the markdown report for ``version``.
 
+    The JSON artifacts are machine-read, so they are written compact unless
+    ``pretty`` asks for the indented form; the markdown report is for people.
+    """
+    encode = _encode_pretty if pretty else _encode_compact
+    status_ok = not failures
     metrics_payload = {r.name: r.metrics for r in results}
-    metrics_file = version_dir / "simulation_metrics.json"
-    metrics_file.write_text(json.dumps(metrics_payload, indent=2), encoding="utf-8")
-
-    comparison_json = version_dir / "comparison_report.json"
-    comparison_json.write_text(
-        json.dumps(
-            {
-                "version": version,
-                "status": "pass" if not failures else "fail",
-                "failure_count": len(failures),
-                "failures": failures,
-            },
-            indent=2,
-        ),
-        encoding="utf-8",
-    )
+    comparison_payload = {
+        "version": version,
+        "status": "pass" if status_ok else "fail",
+        "failure_count": len(failures),
+        "failures": [failure._asdict() for failure in failures],
+    }
 
     report_lines = [
         f"# Simulation Comparison Report ({version})",
         "",
-        f"Status: **{'PASS' if not failures else 'FAIL'}**",
+        f"Status: **{'PASS' if status_ok else 'FAIL'}**",
         "",
     ]
     if failures:
         report_lines.append("## KPI Threshold Failures")
-        for failure in failures:
-            report_lines.append(
-                f"- `{failure['scenario']}.{failure['metric']}` = {failure['value']:.4f} outside {failure['threshold']}"
-            )
+        report_lines.extend(map(_FAILURE_ROW, failures))
     else:
         report_lines.append("All KPI thresholds satisfied.")
 
-    (version_dir / "comparison_report.md").write_text("\n".join(report_lines), encoding="utf-8")
-
-
-def run_all() -> list[ScenarioResult]:
-    scenarios: list[Callable[[], ScenarioResult]] = [
-        economy_stress_test,
-        combat_difficulty_progression,
-        quest_deadlock_detection,
-        npc_navigation_pathing_robustness,
-        save_load_migration_invariants,
-    ]
-    return [scenario() for scenario in scenarios]
+    # Serialize everything first so a formatting error leaves no partial
+    # artifact set behind and the writer threads only touch the filesystem.
+    artifacts = {
+        "simulation_metrics.json": encode(metrics_payload).encode("utf-8"),
+        "comparison_report.json": encode(comparison_payload).encode("utf-8"),
+        "comparison_report.md": "\n".join(report_lines).encode("utf-8"),
+    }
+    version_dir = output_dir / version
+    version_dir.mkdir(parents=True, exist_ok=True)
+    # The writes are independent, so on slow (networked) CI volumes their
+    # latencies overlap instead of adding up.
+    with ThreadPoolExecutor(max_workers=len(artifacts)) as pool:
+        writes = [
+            pool.submit((version_dir / filename).write_bytes, payload)
+            for filename, payload in artifacts.items()
+        ]
+        for write in writes:
+            write.result()
+
+
+SCENARIOS: tuple[Callable[[], ScenarioResult], ...] = (
+    economy_stress_test,
+    combat_difficulty_progression,
+    quest_deadlock_detection,
+    npc_navigation_pathing_robustness,
+    save_load_migration_invariants,
+)
+
+
+def default_workers() -> int:
+    return max(1, min(len(SCENARIOS), os.cpu_count() or 1))
+
+
+@cache
+def run_all(workers: int = 1) -> tuple[ScenarioResult, ...]:
+    """Run every scenario, one process per scenario when ``workers`` is above one.
+
+    Scenarios seed their own RNGs, so results are identical whichever way they
+    run; they are always returned in declaration order. The results are
+    memoized per worker count and shared between callers, so treat them as
+    read-only.
+    """
+    if workers <= 1:
+        return tuple(scenario() for scenario in SCENARIOS)
+
+    results: dict[str, ScenarioResult] = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(SCENARIOS))) as pool:
+        futures = [pool.submit(scenario) for scenario in SCENARIOS]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.name] = result
+    return tuple(results[scenario.__name__] for scenario in SCENARIOS)
 
 
 def main() -> int:
@@ -343,14 +433,16 @@ def main() -> int:
     parser.add_argument("--baseline", default="tests/simulation/baselines/kpi_baseline.json")
     parser.add_argument("--output-dir", default="artifacts/simulations")
     parser.add_argument("--version", default="local")
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--pretty", action="store_true", help="indent the JSON artifacts")
     args = parser.parse_args()
 
     baseline = load_baseline(Path(args.baseline))
-    results = run_all()
+    results = run_all(args.workers)
     failures, ok = evaluate_thresholds(results, baseline)
-    write_artifacts(Path(args.output_dir), args.version, results, failures)
+    write_artifacts(Path(args.output_dir), args.version, results, failures, pretty=args.pretty)
 
-    print(json.dumps({"ok": ok, "failures": failures}, indent=2))
+    print(json.dumps({"ok": ok, "failures": [failure._asdict() for failure in failures]}, indent=2))
     return 0 if ok else 2
 
 
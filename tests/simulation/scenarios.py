@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from statistics import fmean
 
 
 @dataclass(frozen=True)
@@ -23,16 +25,31 @@ class ScenarioResult:
         raise ValueError(f"Unsupported comparator: {self.comparator}")
 
 
+SCENARIO_NAMES: tuple[str, ...] = (
+    "economy_stress_test",
+    "combat_difficulty_progression",
+    "quest_deadlock_detection",
+    "npc_navigation_pathing_robustness",
+    "save_load_migration_invariants",
+)
+
+
+def _run_scenario(name: str, seed: int) -> ScenarioResult:
+    """Worker entry point: run one scenario on a suite of its own."""
+    return getattr(SimulationSuite(seed), name)()
+
+
 class SimulationSuite:
     """Collection of stable simulation scenarios used as deployment KPIs."""
 
     def __init__(self, seed: int = 42) -> None:
+        self._seed = seed
         self._rng = random.Random(seed)
 
     def economy_stress_test(self) -> ScenarioResult:
         """Stress economic loops and report inflation drift ratio (lower is better)."""
-        drift_samples = [abs(self._rng.gauss(0.0, 0.08)) for _ in range(500)]
-        inflation_drift_ratio = sum(drift_samples) / len(drift_samples)
+        gauss = self._rng.gauss
+        inflation_drift_ratio = fmean([abs(gauss(0.0, 0.08)) for _ in range(500)])
         return ScenarioResult(
             name="economy_stress_test",
             metric_name="inflation_drift_ratio",
@@ -45,12 +62,13 @@ class SimulationSuite:
         """Validate difficulty ramps while preserving target win-rate envelope."""
         base_skill = 0.55
         encounters = 300
-        wins = 0
-        for index in range(encounters):
-            enemy_scaling = 0.35 + (index / encounters) * 0.45
-            player_roll = base_skill + self._rng.uniform(-0.2, 0.2)
-            if player_roll >= enemy_scaling:
-                wins += 1
+        uniform = self._rng.uniform
+        wins = sum(
+            [
+                base_skill + uniform(-0.2, 0.2) >= 0.35 + (index / encounters) * 0.45
+                for index in range(encounters)
+            ]
+        )
         win_rate = wins / encounters
         return ScenarioResult(
             name="combat_difficulty_progression",
@@ -63,13 +81,13 @@ class SimulationSuite:
     def quest_deadlock_detection(self) -> ScenarioResult:
         """Detect deadlocked quest states in generated branching graphs."""
         total_graphs = 250
+        randint, draw = self._rng.randint, self._rng.random
         deadlocks = 0
         for _ in range(total_graphs):
-            node_count = self._rng.randint(8, 20)
-            edges = self._rng.randint(node_count - 1, node_count * 2)
+            node_count = randint(8, 20)
+            edges = randint(node_count - 1, node_count * 2)
             deadlock_risk = max(0.0, 0.20 - (edges / (node_count * 2.5)))
-            if self._rng.random() < deadlock_risk:
-                deadlocks += 1
+            deadlocks += draw() < deadlock_risk
         deadlock_rate = deadlocks / total_graphs
         return ScenarioResult(
             name="quest_deadlock_detection",
@@ -82,13 +100,13 @@ class SimulationSuite:
     def npc_navigation_pathing_robustness(self) -> ScenarioResult:
         """Exercise navmesh/pathing under random obstacle churn."""
         pathing_trials = 400
+        uniform, randint, draw = self._rng.uniform, self._rng.randint, self._rng.random
         failures = 0
         for _ in range(pathing_trials):
-            obstacle_density = self._rng.uniform(0.05, 0.45)
-            replans = self._rng.randint(0, 4)
+            obstacle_density = uniform(0.05, 0.45)
+            replans = randint(0, 4)
             fail_probability = 0.01 + obstacle_density * 0.06 + replans * 0.004
-            if self._rng.random() < fail_probability:
-                failures += 1
+            failures += draw() < fail_probability
         success_rate = 1.0 - (failures / pathing_trials)
         return ScenarioResult(
             name="npc_navigation_pathing_robustness",
@@ -101,13 +119,13 @@ class SimulationSuite:
     def save_load_migration_invariants(self) -> ScenarioResult:
         """Validate migrated saves preserve critical progression invariants."""
         migrations = 320
+        randint, draw = self._rng.randint, self._rng.random
         invariant_breaks = 0
         for _ in range(migrations):
-            save_age = self._rng.randint(1, 8)
-            schema_changes = self._rng.randint(1, 6)
+            save_age = randint(1, 8)
+            schema_changes = randint(1, 6)
             break_probability = 0.0025 * save_age + 0.0018 * schema_changes
-            if self._rng.random() < break_probability:
-                invariant_breaks += 1
+            invariant_breaks += draw() < break_probability
         invariant_preservation = 1.0 - (invariant_breaks / migrations)
         return ScenarioResult(
             name="save_load_migration_invariants",
@@ -117,11 +135,25 @@ class SimulationSuite:
             comparator=">=",
         )
 
-    def run_all(self) -> list[ScenarioResult]:
-        return [
-            self.economy_stress_test(),
-            self.combat_difficulty_progression(),
-            self.quest_deadlock_detection(),
-            self.npc_navigation_pathing_robustness(),
-            self.save_load_migration_invariants(),
-        ]
+    def scenario_seeds(self) -> dict[str, int]:
+        """Derive one seed per scenario so each can run without the shared ``_rng``."""
+        seeder = random.Random(self._seed)
+        return {name: seeder.randrange(2**32) for name in SCENARIO_NAMES}
+
+    def run_all(self, workers: int = 1) -> list[ScenarioResult]:
+        """Run every scenario, fanning out to ``workers`` processes when above one.
+
+        Each scenario gets its own derived seed, so the results do not depend on
+        the worker count or on completion order.
+        """
+        seeds = self.scenario_seeds()
+        if workers <= 1:
+            return [_run_scenario(name, seeds[name]) for name in SCENARIO_NAMES]
+
+        results: dict[str, ScenarioResult] = {}
+        with ProcessPoolExecutor(max_workers=min(workers, len(SCENARIO_NAMES))) as pool:
+            futures = [pool.submit(_run_scenario, name, seeds[name]) for name in SCENARIO_NAMES]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.name] = result
+        return [results[name] for name in SCENARIO_NAMES]
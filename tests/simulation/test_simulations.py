@@ -7,10 +7,13 @@ from tests.simulation import run_simulations
 
 
 class SimulationScenarioTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.results = run_simulations.run_all()
+
     def test_run_all_returns_all_scenarios(self):
-        results = run_simulations.run_all()
-        self.assertEqual(len(results), 5)
-        names = {r.name for r in results}
+        self.assertEqual(len(self.results), 5)
+        names = {r.name for r in self.results}
         self.assertSetEqual(
             names,
             {
@@ -22,19 +25,24 @@ class SimulationScenarioTests(unittest.TestCase):
             },
         )
 
+    def test_parallel_run_matches_sequential_order_and_values(self):
+        self.assertEqual(run_simulations.run_all(workers=3), self.results)
+
+    def test_run_all_is_memoized(self):
+        self.assertIs(run_simulations.run_all(), self.results)
+
     def test_threshold_evaluation_passes_current_baseline(self):
         baseline = run_simulations.load_baseline(
             Path("tests/simulation/baselines/kpi_baseline.json")
         )
-        failures, ok = run_simulations.evaluate_thresholds(run_simulations.run_all(), baseline)
+        failures, ok = run_simulations.evaluate_thresholds(self.results, baseline)
         self.assertTrue(ok)
         self.assertEqual(failures, [])
 
     def test_artifacts_are_written(self):
         with tempfile.TemporaryDirectory() as td:
             out = Path(td)
-            results = run_simulations.run_all()
-            run_simulations.write_artifacts(out, "unit-test", results, failures=[])
+            run_simulations.write_artifacts(out, "unit-test", self.results, failures=[])
 
             metrics_file = out / "unit-test" / "simulation_metrics.json"
             report_json = out / "unit-test" / "comparison_report.json"
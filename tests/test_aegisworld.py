@@ -1,27 +1,58 @@
+import importlib.util
 import json
 import threading
+import time
+from dataclasses import replace
 from http import HTTPStatus
 from http.client import HTTPConnection
 from http.server import ThreadingHTTPServer
 from pathlib import Path
+from types import MappingProxyType
+
+import pytest
 
 from aegisworld_benchmark import BenchmarkRunner
 from aegisworld_policy import PolicyEngine
 from aegisworld_runtime import AgentKernel, AgentMemory
 from aegisworld_models import ExecutionPolicy, GoalSpec
 from aegisworld_service import AegisWorldService
-from server import AegisWorldHandler
 
 
-def test_policy_blocks_unapproved_tool() -> None:
-    policy = ExecutionPolicy(
-        tool_allowances=["planner"],
-        resource_limits={"max_budget": 5, "max_latency_ms": 1000},
+def _load_server_script():
+    # The repo also has a server/ package, so a plain "import server" never reaches server.py.
+    path = Path(__file__).resolve().parents[1] / "server.py"
+    spec = importlib.util.spec_from_file_location("aegisworld_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_server = _load_server_script()
+IDLE_TIMEOUT_SECONDS = _server.IDLE_TIMEOUT_SECONDS
+AegisWorldHandler = _server.AegisWorldHandler
+PooledHTTPServer = _server.PooledHTTPServer
+
+
+@pytest.fixture(scope="module")
+def policy_engine() -> PolicyEngine:
+    return PolicyEngine()
+
+
+@pytest.fixture(scope="module")
+def default_policy() -> ExecutionPolicy:
+    """Shared planner+executor policy; tests that change it take a ``replace()`` copy."""
+    return ExecutionPolicy(
+        tool_allowances=("planner", "executor"),
+        resource_limits=MappingProxyType({"max_budget": 20, "max_latency_ms": 5000}),
         network_scope="public_internet",
         data_scope="org_scoped",
         rollback_policy="auto",
     )
-    decision = PolicyEngine().evaluate(
+
+
+def test_policy_blocks_unapproved_tool(policy_engine: PolicyEngine, default_policy: ExecutionPolicy) -> None:
+    policy = replace(default_policy, tool_allowances=("planner",))
+    decision = policy_engine.evaluate(
         policy=policy,
         requested_tools=["executor"],
         estimated_cost=1.0,
@@ -31,15 +62,28 @@ def test_policy_blocks_unapproved_tool() -> None:
     assert any(r.startswith("blocked_tools") for r in decision.reasons)
 
 
-def test_agent_kernel_updates_memory_on_success() -> None:
-    kernel = AgentKernel()
-    policy = ExecutionPolicy(
-        tool_allowances=["planner", "executor"],
-        resource_limits={"max_budget": 20, "max_latency_ms": 5000},
-        network_scope="public_internet",
-        data_scope="org_scoped",
-        rollback_policy="auto",
+def test_policy_decisions_are_memoized_but_not_shared(
+    policy_engine: PolicyEngine, default_policy: ExecutionPolicy
+) -> None:
+    policy = replace(
+        default_policy,
+        tool_allowances=["planner"],
+        resource_limits={"max_budget": 5, "max_latency_ms": 1000},
     )
+    first = policy_engine.evaluate(policy, ["executor"], 6.0, 400)
+    first.reasons.append("caller_note")
+    second = policy_engine.evaluate(policy, ["executor"], 6.0, 400)
+
+    assert second.reasons == ["budget_exceeded:6.0>5.0", "blocked_tools:executor"]
+
+    policy.tool_allowances.append("executor")
+    assert policy_engine.evaluate(policy, ["executor"], 6.0, 400).reasons == ["budget_exceeded:6.0>5.0"]
+
+
+def test_agent_kernel_updates_memory_on_success(
+    policy_engine: PolicyEngine, default_policy: ExecutionPolicy
+) -> None:
+    kernel = AgentKernel(policy_engine)
     goal = GoalSpec(
         goal_id="goal_1",
         intent="Ship a deployment",
@@ -50,7 +94,7 @@ def test_agent_kernel_updates_memory_on_success() -> None:
         domains=["dev"],
     )
     memory = AgentMemory()
-    trace, reflection = kernel.execute_goal("agent_1", goal, policy, memory)
+    trace, reflection = kernel.execute_goal("agent_1", goal, default_policy, memory)
 
     assert trace.outcome == "success"
     assert reflection is not None
@@ -58,6 +102,28 @@ def test_agent_kernel_updates_memory_on_success() -> None:
     assert f"goal:{goal.goal_id}" in memory.semantic
 
 
+def test_agent_kernel_repeated_denials_get_independent_traces(
+    policy_engine: PolicyEngine, default_policy: ExecutionPolicy
+) -> None:
+    kernel = AgentKernel(policy_engine)
+    policy = replace(default_policy, tool_allowances=("planner",))
+    goal = GoalSpec(
+        goal_id="goal_denied",
+        intent="Ship a deployment",
+        constraints={},
+        budget=3.0,
+        deadline="tomorrow",
+        risk_tolerance="medium",
+        domains=["dev"],
+    )
+
+    traces = [kernel.execute_goal("agent_1", goal, policy, AgentMemory())[0] for _ in range(3)]
+
+    assert all(trace.outcome == "blocked:blocked_tools:executor" for trace in traces)
+    assert len({trace.trace_id for trace in traces}) == 3
+    assert traces[0].steps is not traces[1].steps
+
+
 def test_service_workflow_end_to_end_and_learning(tmp_path: Path) -> None:
     state_file = tmp_path / "state.json"
     service = AegisWorldService(state_file=str(state_file))
@@ -139,3 +205,50 @@ def test_server_returns_400_for_invalid_json_payload() -> None:
 
     assert response.status == HTTPStatus.BAD_REQUEST
     assert body == {"error": "invalid json payload"}
+
+
+def test_server_sends_date_and_server_headers_and_logs_success(capsys) -> None:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), AegisWorldHandler)
+    thread = threading.Thread(target=httpd.handle_request)
+    thread.start()
+
+    host, port = httpd.server_address
+    conn = HTTPConnection(host, port, timeout=2)
+    conn.request("GET", "/healthz", headers={"Connection": "close"})
+    response = conn.getresponse()
+    response.read()
+
+    thread.join(timeout=2)
+    httpd.server_close()
+
+    assert response.status == HTTPStatus.OK
+    assert response.getheader("Date")
+    assert response.getheader("Server")
+    assert '"GET /healthz HTTP/1.1" 200' in capsys.readouterr().err
+
+
+def test_idle_keep_alive_connection_yields_worker_to_queued_client() -> None:
+    httpd = PooledHTTPServer(("127.0.0.1", 0), AegisWorldHandler, max_workers=1)
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+    host, port = httpd.server_address
+
+    idle = HTTPConnection(host, port, timeout=2)
+    idle.request("GET", "/healthz")
+    assert idle.getresponse().read() == b'{"status":"ok"}'
+
+    started = time.monotonic()
+    waiting = HTTPConnection(host, port, timeout=2)
+    waiting.request("GET", "/healthz")
+    response = waiting.getresponse()
+    response.read()
+    elapsed = time.monotonic() - started
+
+    waiting.close()
+    idle.close()
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join(timeout=2)
+
+    assert response.status == HTTPStatus.OK
+    assert elapsed < IDLE_TIMEOUT_SECONDS / 2
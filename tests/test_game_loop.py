@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from game.engine.loop import run_game_loop
+from game.engine.loop import apply_command_script, run_game_loop, start_session
 
 
 def test_game_loop_supports_scripted_commands_for_notebooks(tmp_path: Path) -> None:
@@ -9,3 +9,13 @@ def test_game_loop_supports_scripted_commands_for_notebooks(tmp_path: Path) -> N
     run_game_loop(save_path=save_path, command_script=["d", "save", "quit"])
 
     assert save_path.exists()
+
+
+def test_command_script_runs_headless_and_stops_at_quit(tmp_path: Path) -> None:
+    session, _message = start_session(tmp_path / "headless-save.json")
+    start_x = session.player.position.x
+
+    apply_command_script(session, ["d", "save", "quit", "d"])
+
+    assert session.save_path.exists()
+    assert session.player.position.x == start_x + 1
@@ -1,52 +1,25 @@
 from dataclasses import dataclass
 
 from ai.improvement_loop import (
-    ImprovementLoop,
-    IterationStore,
     ObjectiveEvaluator,
     PatchGenerator,
     PatchVerifier,
-    ReleaseManager,
     SessionEvent,
     TelemetryCollector,
 )
 from ai.improvement_loop.engine import ImprovementLoopEngine
 from ai.improvement_loop.models import GeneratedPatch, PatchProposal, VerificationResults
+from tests.conftest import _sim_ok, _static_ok
 
 
-class FakeModelClient:
-    def complete(self, prompt: str) -> str:
-        assert "Constraints:" in prompt
-        return """diff --git a/gameplay/config.yaml b/gameplay/config.yaml
---- a/gameplay/config.yaml
-+++ b/gameplay/config.yaml
-@@ -1,2 +1,2 @@
--drop_rate: 0.10
-+drop_rate: 0.08
-"""
-
-
-def test_improvement_loop_writes_iteration(tmp_path):
-    store = IterationStore(root=tmp_path)
-    loop = ImprovementLoop(
-        telemetry_collector=TelemetryCollector(),
-        objective_evaluator=ObjectiveEvaluator(),
-        patch_generator=PatchGenerator(model_client=FakeModelClient(), prompt_version="v2"),
-        patch_verifier=PatchVerifier(
-            static_checks=["python -c \"print('static ok')\""],
-            simulation_checks=["python -c \"print('sim ok')\""],
-        ),
-        release_manager=ReleaseManager(),
-        iteration_store=store,
-    )
-
+def test_improvement_loop_writes_iteration(improvement_loop, iteration_store):
     events = [
         SessionEvent("s1", day_retained=7, quest_completed=True, death_cause="fall", economy_delta_pct=0.01),
         SessionEvent("s2", day_retained=1, quest_completed=False, death_cause="fall", economy_delta_pct=0.02),
         SessionEvent("s3", day_retained=0, quest_completed=True, death_cause="boss", economy_delta_pct=0.00),
     ]
 
-    record = loop.run_iteration("iter-001", events, previous_stable_version="release-42")
+    record = improvement_loop.run_iteration("iter-001", events, previous_stable_version="release-42")
 
     assert record.iteration_id == "iter-001"
     assert record.prompt_version == "v2"
@@ -54,11 +27,64 @@ def test_improvement_loop_writes_iteration(tmp_path):
     assert record.verification_results.passed is True
     assert record.rollout_decision.rollback_pointer == "release-42"
 
-    saved = store.load("iter-001")
+    saved = iteration_store.load("iter-001")
     assert saved.input_metrics_snapshot.active_sessions == 3
     assert saved.input_metrics_snapshot.top_death_causes["fall"] == 2
 
 
+def test_patch_verifier_mixes_commands_and_in_process_checks():
+    def _crashes():
+        raise RuntimeError("boom")
+
+    verifier = PatchVerifier(
+        static_checks=[_static_ok, "python -c \"print('shell ok')\""],
+        simulation_checks=[_sim_ok, _crashes],
+        parallel_checks=True,
+    )
+    patch = GeneratedPatch(prompt_version="v1", prompt_text="p", diff="", target_files=[])
+
+    result = verifier.verify(patch)
+
+    assert result.static_checks_passed is True
+    assert "$ _static_ok\nstatic ok" in result.static_check_report
+    assert "shell ok" in result.static_check_report
+    assert result.simulation_checks_passed is False
+    assert "RuntimeError: boom" in result.simulation_report
+
+
+def test_patch_verifier_runs_checks_in_order_by_default(tmp_path):
+    marker = tmp_path / "built"
+    verifier = PatchVerifier(
+        static_checks=[f"sleep 0.2 && touch {marker}", f"test -f {marker}"],
+        simulation_checks=[_sim_ok],
+    )
+    patch = GeneratedPatch(prompt_version="v1", prompt_text="p", diff="", target_files=[])
+
+    assert verifier.verify(patch).static_checks_passed is True
+
+
+def test_patch_generator_reuses_cached_response_for_identical_prompt(fake_model_client):
+    prompts = []
+
+    class _CountingClient:
+        def complete(self, prompt):
+            prompts.append(prompt)
+            return fake_model_client.complete(prompt)
+
+    generator = PatchGenerator(model_client=_CountingClient(), cache_responses=True)
+    metrics = TelemetryCollector().collect(
+        [SessionEvent("s1", day_retained=1, quest_completed=True, death_cause="fall", economy_delta_pct=0.0)]
+    )
+    scores = ObjectiveEvaluator().evaluate(metrics)
+
+    first = generator.generate(metrics, scores)
+    second = generator.generate(metrics, scores)
+
+    assert len(prompts) == 1
+    assert second.diff == first.diff
+    assert second.target_files == ("gameplay/config.yaml",)
+
+
 @dataclass
 class _Rollout:
     decision: str
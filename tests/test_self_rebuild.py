@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tools.self_rebuild import AutoRebuildOrchestrator, ChangeSpec, PatchGenerator, RollbackManager, Validators
+from tools.self_rebuild.patch_generator import CandidatePatch, noop_generator
+from tools.self_rebuild.validators import REPORT_OUTPUT_TAIL_CHARS, GateResult, ValidationCache, ValidationReport
+
+
+def _report(passed: bool = True) -> ValidationReport:
+    return ValidationReport(gates=[GateResult(name="replay", passed=passed, command="true", output="ok")])
+
+
+def _key(cache: ValidationCache, repo_root: Path, tree: str = "tree-a") -> str:
+    return cache.key(patch_digest="p", head="h", tree=tree, commands=("true",), repo_root=repo_root)
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "game.py").write_text("speed = 1\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(["git", "add", "game.py"], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "base"],
+        cwd=repo,
+        check=True,
+    )
+    return repo
+
+
+def test_validation_cache_hit_returns_stored_passing_report(tmp_path: Path) -> None:
+    cache = ValidationCache(tmp_path / "cache")
+    key = _key(cache, tmp_path)
+
+    assert cache.get(key) is None
+    cache.put(key, _report())
+    assert cache.get(key).as_dict() == _report().as_dict()
+
+    failed_key = _key(cache, tmp_path, tree="tree-b")
+    cache.put(failed_key, _report(passed=False))
+    assert cache.get(failed_key) is None
+
+
+def test_validation_cache_misses_on_other_worktree_or_tool_version(tmp_path: Path) -> None:
+    cache = ValidationCache(tmp_path / "cache")
+    cache.put(_key(cache, tmp_path), _report())
+
+    assert cache.get(_key(cache, tmp_path, tree="tree-b")) is None
+    upgraded = ValidationCache(tmp_path / "cache", version_commands=("echo lint 2.0",))
+    assert cache.get(_key(upgraded, tmp_path)) is None
+
+
+def test_validation_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ValidationCache(tmp_path / "cache", max_entries=2)
+    keys = [_key(cache, tmp_path, tree=f"tree-{index}") for index in range(3)]
+    cache.put(keys[0], _report())
+    cache.put(keys[1], _report())
+    os.utime(tmp_path / "cache" / f"{keys[0]}.json", ns=(1, 1))
+    os.utime(tmp_path / "cache" / f"{keys[1]}.json", ns=(2, 2))
+
+    assert cache.get(keys[0]) is not None  # refreshes keys[0], leaving keys[1] oldest
+    cache.put(keys[2], _report())
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_worktree_tree_tracks_uncommitted_and_untracked_changes(git_repo: Path) -> None:
+    orchestrator = AutoRebuildOrchestrator(
+        repo_root=git_repo,
+        change_spec=ChangeSpec(allowed_paths=["*"]),
+        patch_generator=PatchGenerator(noop_generator),
+        validators=Validators(git_repo),
+        rollback_manager=RollbackManager(git_repo),
+        model_version="test",
+        signing_key="k",
+    )
+    index_before = (git_repo / ".git" / "index").read_bytes()
+
+    clean = orchestrator._worktree_tree()
+    assert orchestrator._worktree_tree() == clean
+
+    (git_repo / ".self_rebuild").mkdir()
+    (git_repo / ".self_rebuild" / "validation.json").write_text("{}", encoding="utf-8")
+    assert orchestrator._worktree_tree() == clean
+
+    (git_repo / "game.py").write_text("speed = 2\n", encoding="utf-8")
+    modified = orchestrator._worktree_tree()
+    assert modified != clean
+
+    (git_repo / "new_system.py").write_text("enabled = True\n", encoding="utf-8")
+    assert orchestrator._worktree_tree() not in {clean, modified}
+    assert (git_repo / ".git" / "index").read_bytes() == index_before
+
+
+def test_apply_patch_checks_the_worktree_after_applying(git_repo: Path) -> None:
+    orchestrator = AutoRebuildOrchestrator(
+        repo_root=git_repo,
+        change_spec=ChangeSpec(allowed_paths=["game.py"]),
+        patch_generator=PatchGenerator(noop_generator),
+        validators=Validators(git_repo),
+        rollback_manager=RollbackManager(git_repo),
+        model_version="test",
+        signing_key="k",
+    )
+    diff = "--- a/game.py\n+++ b/game.py\n@@ -1 +1 @@\n-speed = 1\n+speed = 2\n"
+    candidate = CandidatePatch(
+        goal_id="g", summary="s", diff=diff, confidence=1.0, generated_at="t", telemetry_digest="d"
+    )
+    (git_repo / ".self_rebuild").mkdir()
+    (git_repo / ".self_rebuild" / "validation.json").write_text("{}", encoding="utf-8")
+
+    orchestrator._apply_patch(candidate)
+    assert (git_repo / "game.py").read_text(encoding="utf-8") == "speed = 2\n"
+
+    subprocess.run(["git", "checkout", "--", "game.py"], cwd=git_repo, check=True)
+    (git_repo / "rogue.py").write_text("import os\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="rogue.py"):
+        orchestrator._apply_patch(candidate)
+
+
+def test_run_all_runs_perf_gate_after_the_others(tmp_path: Path) -> None:
+    log = tmp_path / "order.log"
+    report = Validators(tmp_path).run_all(
+        style_commands=[f"sleep 0.2; echo style >> {log}"],
+        replay_command=f"echo replay >> {log}",
+        save_compat_command=f"echo save >> {log}",
+        crash_perf_command=f"echo perf >> {log}",
+    )
+
+    assert [gate.name for gate in report.gates] == [
+        "style_lint_type",
+        "deterministic_replay",
+        "save_compatibility",
+        "crash_perf_budget",
+    ]
+    assert report.passed
+    assert log.read_text(encoding="utf-8").split()[-1] == "perf"
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_persist_report_writes_one_consistent_document(tmp_path: Path, pretty: bool) -> None:
+    report = ValidationReport(
+        gates=[
+            GateResult(name="replay", passed=True, command="true", output="ok"),
+            GateResult(name="perf", passed=False, command="bench", output="x" * (REPORT_OUTPUT_TAIL_CHARS + 10)),
+        ]
+    )
+    path = tmp_path / "reports" / "validation.json"
+    Validators(tmp_path).persist_report(report, path, pretty=pretty)
+
+    expected = report.as_dict()
+    expected["gates"][1]["output"] = "x" * REPORT_OUTPUT_TAIL_CHARS
+    assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=2 if pretty else None) + "\n"
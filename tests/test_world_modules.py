@@ -1,6 +1,11 @@
+import json
+from hashlib import blake2b
+
+import pytest
+
 from game.world.chunk_streamer import ChunkStreamer
 from game.world.entity_registry import EntityRecord, EntityRegistry, EntityType
-from game.world.terrain_generator import TerrainGenerator
+from game.world.terrain_generator import TerrainGenerator, _chunk_columns
 from game.world.world_state_store import ChunkPatch, WorldStateStore
 
 
@@ -26,11 +31,39 @@ class _Hook:
 
 def test_terrain_generation_is_deterministic():
     a = TerrainGenerator(world_seed="seed-1", generation_epoch=3).generate_chunk(2, 4)
+    cached = TerrainGenerator(world_seed="seed-1", generation_epoch=3).generate_chunk(2, 4)
+    assert cached is not a
+    assert cached.heights is not a.heights
+    assert cached == a
+
+    _chunk_columns.cache_clear()
     b = TerrainGenerator(world_seed="seed-1", generation_epoch=3).generate_chunk(2, 4)
     assert a.height_map == b.height_map
     assert a.biome_map == b.biome_map
 
 
+def test_generated_chunks_do_not_share_mutable_state():
+    generator = TerrainGenerator(world_seed="seed-1", generation_epoch=3)
+    a = generator.generate_chunk(0, 0, size=4)
+    original = a.height_at(0, 0)
+    a.heights[0] = -1.0
+    a.height_map[0][1] = -1.0
+
+    b = generator.generate_chunk(0, 0, size=4)
+    assert b.height_at(0, 0) == original
+    assert b.height_map[0][1] == a.height_at(1, 0)
+
+
+def test_generate_chunks_matches_serial_generation():
+    generator = TerrainGenerator(world_seed="seed-1", generation_epoch=3)
+    coords = [(x, y) for x in range(2) for y in range(2)]
+
+    batched = generator.generate_chunks(coords, size=8, max_workers=2, min_parallel_batch=1)
+
+    assert [(chunk.chunk_x, chunk.chunk_y) for chunk in batched] == coords
+    assert batched == [generator.generate_chunk(x, y, size=8) for x, y in coords]
+
+
 def test_world_state_store_patch_replay(tmp_path):
     store = WorldStateStore(tmp_path)
     v1 = store.append_patch(0, 0, ChunkPatch(patch_id="p1", base_version=0, operations={"ore": 3}))
@@ -41,6 +74,81 @@ def test_world_state_store_patch_replay(tmp_path):
     state = store.materialize_chunk_state(0, 0, base_state={"ore": 1})
     assert state["ore"] == 5
     assert store.verify_chunk_checksum(0, 0)
+    assert store.validate_chain(0, 0)
+
+
+def test_world_state_store_content_addressed_patches(tmp_path):
+    store = WorldStateStore(tmp_path)
+    first = store.create_patch(3, 3, {"tree": "oak"})
+    store.append_patch(3, 3, first)
+    second = store.create_patch(3, 3, {"tree": "pine"})
+    store.append_patch(3, 3, second)
+
+    assert second.parent_patch_id == first.patch_id
+    assert second.patch_id == WorldStateStore.derive_patch_id(first.patch_id, {"tree": "pine"})
+    assert store.validate_chain(3, 3)
+
+
+def test_world_state_store_recovers_from_crash_between_log_and_checkpoint(tmp_path, monkeypatch):
+    store = WorldStateStore(tmp_path)
+    store.append_patch(0, 0, store.create_patch(0, 0, {"ore": 1}))
+    second = store.create_patch(0, 0, {"ore": 2})
+
+    def crash(*args, **kwargs):
+        raise OSError("crashed before the checkpoint was replaced")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(store, "_write_checkpoint", crash)
+        with pytest.raises(OSError):
+            store.append_patch(0, 0, second)
+    with (tmp_path / "chunk_0_0.jsonl").open("ab") as handle:
+        handle.write(b'{"author":"system","base_ver')  # torn write of a later append
+
+    third = store.create_patch(0, 0, {"ore": 3})
+    assert (third.base_version, third.parent_patch_id) == (2, second.patch_id)
+    assert store.append_patch(0, 0, third) == 3
+    assert [patch.patch_id for patch in store.get_patch_history(0, 0)][1:] == [second.patch_id, third.patch_id]
+    assert store.verify_chunk_checksum(0, 0)
+    assert store.validate_chain(0, 0)
+
+
+def test_world_state_store_does_not_adopt_rewritten_log(tmp_path):
+    store = WorldStateStore(tmp_path)
+    store.append_patch(0, 0, store.create_patch(0, 0, {"ore": 1}))
+    log = tmp_path / "chunk_0_0.jsonl"
+    log.write_bytes(log.read_bytes().replace(b'"ore":1', b'"ore":100'))
+
+    assert not store.verify_chunk_checksum(0, 0)
+
+
+def _legacy_payload(history):
+    canonical = json.dumps(history, sort_keys=True, separators=(",", ":"))
+    checksum = blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    return {"chunk": "1,2", "patch_history": history, "checksum": checksum}
+
+
+def test_world_state_store_compacts_legacy_payload(tmp_path):
+    history = [{"patch_id": "p1", "base_version": 0, "operations": {"ore": 3}, "author": "system"}]
+    (tmp_path / "chunk_1_2.json").write_text(json.dumps(_legacy_payload(history)), encoding="utf-8")
+
+    store = WorldStateStore(tmp_path)
+    assert store.append_patch(1, 2, ChunkPatch(patch_id="p2", base_version=1, operations={"ore": 4})) == 2
+    assert not (tmp_path / "chunk_1_2.json").exists()
+    assert [patch.patch_id for patch in store.get_patch_history(1, 2)] == ["p1", "p2"]
+    assert store.verify_chunk_checksum(1, 2)
+    assert store.validate_chain(1, 2)
+
+
+def test_world_state_store_refuses_tampered_legacy_payload(tmp_path):
+    legacy = _legacy_payload([{"patch_id": "p1", "base_version": 0, "operations": {"ore": 3}, "author": "system"}])
+    legacy["patch_history"][0]["operations"]["ore"] = 300
+    (tmp_path / "chunk_1_2.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    store = WorldStateStore(tmp_path)
+    with pytest.raises(ValueError, match="checksum"):
+        store.materialize_chunk_state(1, 2)
+    assert (tmp_path / "chunk_1_2.json").exists()
+    assert not (tmp_path / "chunk_1_2.jsonl").exists()
 
 
 def test_entity_registry_tracks_types_and_chunks():
@@ -52,6 +160,28 @@ def test_entity_registry_tracks_types_and_chunks():
     assert len(registry.entities_in_chunk(0, 0)) == 2
     assert len(registry.list_by_type(EntityType.FAUNA)) == 1
 
+    registry.upsert(EntityRecord("fauna-1", EntityType.NPC, 1, 0))
+    registry.remove("res-1")
+    assert [record.entity_id for record in registry.entities_in_chunk(1, 0)] == ["fauna-1"]
+    assert [record.entity_id for record in registry.list_by_type(EntityType.NPC)] == ["npc-1", "fauna-1"]
+    assert registry.list_by_type(EntityType.FAUNA) == []
+
+
+def test_entity_registry_removes_records_mutated_after_upsert():
+    registry = EntityRegistry()
+    record = EntityRecord("npc-1", EntityType.NPC, 0, 0)
+    registry.upsert(record)
+
+    record.chunk_x = 5
+    record.entity_type = EntityType.FAUNA
+    registry.upsert(EntityRecord("npc-1", EntityType.NPC, 2, 2))
+
+    assert registry.entities_in_chunk(0, 0) == []
+    assert [entity.chunk_x for entity in registry.list_by_type(EntityType.NPC)] == [2]
+    registry.remove("npc-1")
+    assert registry.entities_in_chunk(2, 2) == []
+    assert registry.list_by_type(EntityType.NPC) == []
+
 
 def test_chunk_streamer_load_unload_and_hooks():
     hook = _Hook()
@@ -64,6 +194,10 @@ def test_chunk_streamer_load_unload_and_hooks():
     assert (2, 0) in streamer.loaded_chunks
     assert (0, 0) not in streamer.loaded_chunks
 
+    calls = len(hook.calls)
+    streamer.update_player_position(40, 8, chunk_size=16)
+    assert len(hook.calls) == calls
+
     event_types = [event[0] for event in hook.calls]
     assert "loaded" in event_types
     assert "spawn" in event_types
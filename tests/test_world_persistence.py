@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
 import json
 from pathlib import Path
 
+import pytest
+
 from game.world.migrations import migrate_world_state
+from game.world.persistence import WorldPersistenceManager, apply_diff
 from game.world.rebuild import rebuild_world
-from game.world.state_schema import WorldState
-from game.world.storage import WorldStore
+from game.world.state_schema import WorldState, normalize_world_state
+from game.world.storage import IntegrityError, WorldStore
 
 
 def test_periodic_snapshot_and_diffs(tmp_path: Path) -> None:
@@ -40,6 +45,25 @@ def test_rebuild_world_is_deterministic(tmp_path: Path) -> None:
     assert rebuilt_a.tick == rebuilt_b.tick
     assert rebuilt_a.entities == rebuilt_b.entities
     assert rebuilt_a.entities["unit"] == {"x": 3, "y": 2}
+    assert rebuilt_a.fingerprint() == rebuilt_b.fingerprint()
+
+    rebuilt_a.entities["unit"]["x"] = 0
+    assert rebuild_world(snapshot_id, store=store).entities["unit"] == {"x": 3, "y": 2}
+
+    store.persist_update(state, [{"op": "delete", "entity_id": "unit"}])
+    assert "unit" not in rebuild_world(snapshot_id, store=store).entities
+
+
+def test_rebuild_reverifies_records_rewritten_in_place(tmp_path: Path) -> None:
+    store = WorldStore(root_dir=tmp_path / "data", snapshot_interval=10, signature_key="secret")
+    state = WorldState(seed=5)
+    snapshot_id = store.write_snapshot(state)
+    store.persist_update(state, [{"op": "set", "entity_id": "unit", "value": {"x": 1}}])
+    assert store.rebuild(snapshot_id).entities["unit"] == {"x": 1}
+
+    store.list_diffs()[-1].write_bytes(b"tampered")
+    with pytest.raises(IntegrityError):
+        store.rebuild(snapshot_id)
 
 
 def test_migration_v1_to_v2() -> None:
@@ -56,6 +80,8 @@ def test_migration_v1_to_v2() -> None:
     migrated = migrate_world_state(legacy, target_version=2)
     assert migrated["schema_version"] == 2
     assert migrated["metadata"] == {}
+    assert legacy["schema_version"] == 1
+    assert migrate_world_state(migrated, target_version=2) is migrated
 
 
 def test_startup_recovery_uses_latest_valid_snapshot(tmp_path: Path) -> None:
@@ -75,3 +101,62 @@ def test_startup_recovery_uses_latest_valid_snapshot(tmp_path: Path) -> None:
     recovered = store.recover_startup_state()
     assert recovered.world_version == 1
     assert recovered.entities["boss"]["hp"] == 100
+
+
+def test_store_still_reads_legacy_hmac_records(tmp_path: Path) -> None:
+    store = WorldStore(root_dir=tmp_path / "data", signature_key="secret")
+    snapshot_id = store.write_snapshot(WorldState(seed=5))
+    path = tmp_path / "data" / "snapshots" / f"{snapshot_id}.json"
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    assert raw["integrity"]["mac"] == "blake2b16"
+
+    encoded = json.dumps(raw["payload"], sort_keys=True, separators=(",", ":")).encode("utf-8")
+    legacy = {
+        "payload": raw["payload"],
+        "integrity": {
+            "sha256": hashlib.sha256(encoded).hexdigest(),
+            "signature": hmac.new(b"secret", encoded, hashlib.sha256).hexdigest(),
+        },
+    }
+    path.write_text(json.dumps(legacy), encoding="utf-8")
+    assert store.load_snapshot(snapshot_id).seed == 5
+
+
+def test_normalize_world_state_is_canonical_and_fresh() -> None:
+    state = {
+        "world_id": "w",
+        "tick": 3,
+        "entities": [{"entity_id": "b", "hp": 1}, {"entity_id": "a", "attributes": {"z": 1, "y": 2}}],
+        "metadata": {"zone": "b", "biome": "a"},
+    }
+
+    first = normalize_world_state(state)
+    assert [entity["entity_id"] for entity in first["entities"]] == ["a", "b"]
+    assert list(first["entities"][0]["attributes"]) == ["y", "z"]
+    assert list(first["metadata"]) == ["biome", "zone"]
+
+    second = normalize_world_state(state)
+    assert second == first
+    assert second["entities"] is not first["entities"]
+
+    # In-place edits at the same tick are picked up, and earlier results are unaffected.
+    state["entities"][0]["hp"] = 7
+    assert normalize_world_state(state)["entities"][1]["hp"] == 7
+    assert first["entities"][1]["hp"] == 1
+
+
+def test_persistence_manager_recovers_snapshot_plus_diffs(tmp_path: Path) -> None:
+    manager = WorldPersistenceManager(str(tmp_path / "data"), snapshot_interval_ticks=3, signing_key="k")
+    entities = [{"entity_id": "npc_1", "hp": 10}]
+    for tick in range(5):
+        entities = entities + [{"entity_id": f"tree_{tick}"}]
+        manager.persist_tick({"world_id": "w", "tick": tick, "entities": entities, "metadata": {"zone": "a"}})
+
+    restarted = WorldPersistenceManager(str(tmp_path / "data"), snapshot_interval_ticks=3, signing_key="k")
+    state = restarted.load_latest_valid_snapshot()
+    assert state["tick"] == 3
+    for raw in restarted.iter_valid_diffs(min_tick_exclusive=state["tick"]):
+        state = apply_diff(state, raw["changes"])
+
+    assert state["tick"] == 4
+    assert len(state["entities"]) == 6
@@ -3,22 +3,34 @@
 
 import argparse
 import json
-from collections import Counter
+from collections import Counter, deque
 from pathlib import Path
 from typing import Iterable
 
+_decode_json = json.JSONDecoder().decode
+_encode_pretty = json.JSONEncoder(indent=2).encode
 
-def load_entries(log_path: Path) -> list[dict]:
+
+def load_entries(log_path: Path, limit: int | None = None) -> list[dict]:
+    """Parse the audit log, keeping only the last ``limit`` non-blank lines when given.
+
+    The file is streamed line by line into a bounded deque, so memory stays
+    proportional to ``limit`` and only the retained lines are decoded.
+    """
     if not log_path.exists():
         return []
 
+    tail: deque[str] = deque(maxlen=limit if limit and limit > 0 else None)
+    with log_path.open(encoding="utf-8") as handle:
+        for raw_line in handle:
+            if not raw_line.isspace():
+                tail.append(raw_line)
+
     entries: list[dict] = []
-    for raw_line in log_path.read_text(encoding="utf-8").splitlines():
+    for raw_line in tail:
         line = raw_line.strip()
-        if not line:
-            continue
         try:
-            entries.append(json.loads(line))
+            entries.append(_decode_json(line))
         except json.JSONDecodeError:
             entries.append({"action": "invalid", "raw": line})
     return entries
@@ -27,21 +39,15 @@ def load_entries(log_path: Path) -> list[dict]:
 def render_table(entries: Iterable[dict]) -> str:
     rows = ["timestamp\taction\tchange_id\toutcome\tsummary"]
     for item in entries:
+        action = item.get("action", "")
         outcome = ""
-        if item.get("action") == "applied":
+        if action == "applied":
             outcome = "success" if item.get("success") == "true" else "failed"
-        if item.get("action") == "reverted":
+        elif action == "reverted":
             outcome = f"reverted:{item.get('reason', '')}"
         rows.append(
-            "\t".join(
-                [
-                    str(item.get("timestamp", "")),
-                    str(item.get("action", "")),
-                    str(item.get("change_id", "")),
-                    outcome,
-                    str(item.get("summary", "")),
-                ]
-            )
+            f"{item.get('timestamp', '')}\t{action}\t"
+            f"{item.get('change_id', '')}\t{outcome}\t{item.get('summary', '')}"
         )
     return "\n".join(rows)
 
@@ -64,14 +70,19 @@ def main() -> int:
     )
 
     args = parser.parse_args()
-    entries = load_entries(Path(args.log))
-    recent = entries[-args.limit :]
+    recent = load_entries(Path(args.log), args.limit)
 
     if args.summary:
-        actions = Counter(entry.get("action", "unknown") for entry in recent)
-        applied = [e for e in recent if e.get("action") == "applied"]
-        successes = sum(1 for e in applied if e.get("success") == "true")
-        failures = len(applied) - successes
+        actions: Counter[str] = Counter()
+        applied = successes = 0
+        for entry in recent:
+            action = entry.get("action", "unknown")
+            actions[action] += 1
+            if action == "applied":
+                applied += 1
+                if entry.get("success") == "true":
+                    successes += 1
+        failures = applied - successes
         print("summary")
         print(f"  total: {len(recent)}")
         print(f"  actions: {dict(actions)}")
@@ -80,7 +91,7 @@ def main() -> int:
         return 0
 
     if args.json:
-        print(json.dumps(recent, indent=2))
+        print(_encode_pretty(recent))
         return 0
 
     print(render_table(recent))
@@ -4,7 +4,7 @@ from .change_spec import ChangeSpec
 from .orchestrator import AutoRebuildOrchestrator, DeploymentConfig, OrchestrationResult
 from .patch_generator import ImprovementGoal, PatchGenerator, TelemetrySnapshot
 from .rollback import RollbackManager
-from .validators import Validators
+from .validators import ValidationCache, Validators
 
 __all__ = [
     "AutoRebuildOrchestrator",
@@ -15,5 +15,6 @@ __all__ = [
     "PatchGenerator",
     "RollbackManager",
     "TelemetrySnapshot",
+    "ValidationCache",
     "Validators",
 ]
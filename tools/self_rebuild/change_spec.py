@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
 from typing import Iterable, Sequence
 
 
+_NEVER_MATCH = re.compile(r"(?!)")
+# New-side headers, plus old-side ones so deleted (and renamed-away) files count too.
+_CHANGED_PATH_RE = re.compile(r"^(?:\+\+\+ b/|--- a/)(.*)$", re.MULTILINE)
+
+
+def utf8_size(text: str) -> int:
+    """Encoded UTF-8 length of ``text``; ASCII text (the common diff case) needs no encode."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _compile_globs(patterns: Iterable[str]) -> re.Pattern[str]:
+    """Union of ``fnmatch`` globs as one regex; matches nothing when there are no patterns."""
+    translated = [translate(os.path.normcase(pattern)) for pattern in patterns]
+    return re.compile("|".join(translated)) if translated else _NEVER_MATCH
+
+
 @dataclass(frozen=True)
 class ChangeSpec:
     """Defines what automated rebuilds are allowed to change."""
@@ -17,12 +35,18 @@ class ChangeSpec:
     forbidden_files: Sequence[str] = field(default_factory=tuple)
     max_diff_bytes: int = 200_000
     max_changed_files: int = 25
+    _allowed_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    _forbidden_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_allowed_re", _compile_globs(self.allowed_paths))
+        object.__setattr__(self, "_forbidden_re", _compile_globs(self.forbidden_files))
 
     def is_path_allowed(self, path: str) -> bool:
-        normalized = path.strip()
-        if any(fnmatch(normalized, pattern) for pattern in self.forbidden_files):
+        normalized = os.path.normcase(path.strip())
+        if self._forbidden_re.match(normalized):
             return False
-        return any(fnmatch(normalized, pattern) for pattern in self.allowed_paths)
+        return self._allowed_re.match(normalized) is not None
 
     def validate_changed_paths(self, changed_paths: Iterable[str]) -> list[str]:
         violations: list[str] = []
@@ -42,7 +66,7 @@ class ChangeSpec:
     def validate_diff(self, diff_text: str) -> list[str]:
         violations: list[str] = []
 
-        if len(diff_text.encode("utf-8")) > self.max_diff_bytes:
+        if utf8_size(diff_text) > self.max_diff_bytes:
             violations.append(
                 f"Diff size exceeds max_diff_bytes={self.max_diff_bytes}."
             )
@@ -58,26 +82,43 @@ class ApiChangeGuard:
     """Simple API guardrail based on protected tokens/signatures."""
 
     protected_tokens: Sequence[str] = field(default_factory=tuple)
+    _token_re: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    _prefix_tokens: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Longest first, probed at every offset via a lookahead: one scan finds every token
+        # except those that are a prefix of a longer one, which are checked directly.
+        tokens = sorted({token for token in self.protected_tokens if token}, key=len, reverse=True)
+        token_re = re.compile(f"(?=({'|'.join(map(re.escape, tokens))}))") if tokens else _NEVER_MATCH
+        prefix_tokens = tuple(
+            token for token in tokens if any(other != token and other.startswith(token) for other in tokens)
+        )
+        object.__setattr__(self, "_token_re", token_re)
+        object.__setattr__(self, "_prefix_tokens", prefix_tokens)
+
+    def _present_tokens(self, source: str) -> set[str]:
+        present = set(self._token_re.findall(source))
+        present.update(token for token in self._prefix_tokens if token not in present and token in source)
+        return present
 
     def check_source(self, before: str, after: str) -> list[str]:
-        violations: list[str] = []
-        for token in self.protected_tokens:
-            if token in before and token not in after:
-                violations.append(f"Protected API token removed: {token}")
-        return violations
+        present_before = self._present_tokens(before)
+        if not present_before:
+            return []
+        present_after = self._present_tokens(after)
+        return [
+            f"Protected API token removed: {token}"
+            for token in self.protected_tokens
+            if token in present_before and token not in present_after
+        ]
 
 
 def extract_changed_paths(diff_text: str) -> list[str]:
-    """Extract changed paths from a unified diff."""
-
-    changed: list[str] = []
-    for line in diff_text.splitlines():
-        if line.startswith("+++ b/"):
-            path = line.removeprefix("+++ b/").strip()
-            if path and path != "/dev/null":
-                changed.append(path)
+    """Extract changed paths (added, modified, deleted or renamed) from a unified diff."""
+
+    changed = (path.strip() for path in _CHANGED_PATH_RE.findall(diff_text))
     # preserve order and remove duplicates
-    return list(dict.fromkeys(changed))
+    return [path for path in dict.fromkeys(changed) if path and path != "/dev/null"]
 
 
 def ensure_paths_exist(repo_root: Path, paths: Iterable[str]) -> list[str]:
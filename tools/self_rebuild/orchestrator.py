@@ -7,7 +7,9 @@ from datetime import datetime, timezone
 import hashlib
 import hmac
 import json
+import os
 from pathlib import Path
+import shutil
 import subprocess
 import tempfile
 from typing import Callable, Sequence
@@ -15,7 +17,7 @@ from typing import Callable, Sequence
 from .change_spec import ChangeSpec
 from .patch_generator import CandidatePatch, ImprovementGoal, PatchGenerator, TelemetrySnapshot
 from .rollback import RollbackManager
-from .validators import ValidationReport, Validators
+from .validators import ValidationCache, ValidationReport, Validators, run_shell
 
 
 @dataclass(frozen=True)
@@ -58,6 +60,7 @@ class AutoRebuildOrchestrator:
         rollback_manager: RollbackManager,
         model_version: str,
         signing_key: str,
+        validation_cache: ValidationCache | None = None,
     ):
         self.repo_root = repo_root
         self.change_spec = change_spec
@@ -66,6 +69,9 @@ class AutoRebuildOrchestrator:
         self.rollback_manager = rollback_manager
         self.model_version = model_version
         self.signing_key = signing_key.encode("utf-8")
+        # Keyed once; each signature copies this instead of redoing the HMAC key setup.
+        self._hmac_template = hmac.new(self.signing_key, digestmod=hashlib.sha256)
+        self.validation_cache = validation_cache
 
     def run_cycle(
         self,
@@ -92,12 +98,7 @@ class AutoRebuildOrchestrator:
 
         try:
             self._apply_patch(selected)
-            report = self.validators.run_all(
-                style_commands=deploy.style_commands,
-                replay_command=deploy.replay_command,
-                save_compat_command=deploy.save_compat_command,
-                crash_perf_command=deploy.crash_perf_command,
-            )
+            report = self._validate(selected, last_good.commit, deploy)
             report_path = self.repo_root / ".self_rebuild" / "reports" / "validation.json"
             self.validators.persist_report(report, report_path)
 
@@ -123,12 +124,14 @@ class AutoRebuildOrchestrator:
                     validation_report_path=str(report_path),
                 )
 
-            provenance = self._build_provenance(
+            signed_at = datetime.now(timezone.utc)
+            _provenance, provenance_record = self._build_provenance(
                 selected=selected,
                 prompt=operator_prompt,
                 report=report,
+                signed_at=signed_at,
             )
-            provenance_path = self._persist_provenance(provenance)
+            provenance_path = self._persist_provenance(provenance_record, signed_at)
             self.rollback_manager.mark_last_known_good()
 
             return OrchestrationResult(
@@ -147,25 +150,56 @@ class AutoRebuildOrchestrator:
             )
 
     def _apply_patch(self, candidate: CandidatePatch) -> None:
-        with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as temp_patch:
-            temp_patch.write(candidate.diff)
-            patch_path = Path(temp_patch.name)
+        # The diff is piped on stdin; no temp file is written, re-read and unlinked. Without
+        # --reject, git apply is all-or-nothing, so a separate --check pass adds nothing.
+        self._git("apply", "-", stdin=candidate.diff)
 
-        try:
-            self._run(f"git apply --check {patch_path}")
-            self._run(f"git apply {patch_path}")
-        finally:
-            patch_path.unlink(missing_ok=True)
-
-        # defensive verify against policy drift after application
-        changed = self._changed_paths()
-        violations = self.change_spec.validate_changed_paths(changed)
+        # defensive verify against policy drift after application: check what the worktree
+        # actually holds now, not the path list validate_diff already saw
+        violations = self.change_spec.validate_changed_paths(self._changed_paths())
         if violations:
             raise RuntimeError("; ".join(violations))
 
     def _changed_paths(self) -> list[str]:
-        output = self._run("git diff --name-only")
-        return [line.strip() for line in output.splitlines() if line.strip()]
+        """Modified tracked files plus untracked files, excluding this tool's own state."""
+        modified = self._git("diff", "--name-only")
+        untracked = self._git("ls-files", "--others", "--exclude-standard", "--", ".", ":(exclude).self_rebuild")
+        return [line.strip() for line in (modified + "\n" + untracked).splitlines() if line.strip()]
+
+    def _validate(
+        self,
+        selected: CandidatePatch,
+        base_commit: str,
+        deploy: DeploymentConfig,
+    ) -> ValidationReport:
+        """Run the pre-deploy gates, reusing a passing report for the same patch and worktree."""
+        cache_key = None
+        if self.validation_cache is not None:
+            cache_key = self.validation_cache.key(
+                patch_digest=hashlib.sha256(selected.diff.encode("utf-8")).hexdigest(),
+                head=base_commit,
+                tree=self._worktree_tree(),
+                commands=(
+                    *deploy.style_commands,
+                    deploy.replay_command,
+                    deploy.save_compat_command,
+                    deploy.crash_perf_command,
+                ),
+                repo_root=self.repo_root,
+            )
+            cached = self.validation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        report = self.validators.run_all(
+            style_commands=deploy.style_commands,
+            replay_command=deploy.replay_command,
+            save_compat_command=deploy.save_compat_command,
+            crash_perf_command=deploy.crash_perf_command,
+        )
+        if cache_key is not None:
+            self.validation_cache.put(cache_key, report)
+        return report
 
     def _build_provenance(
         self,
@@ -173,11 +207,18 @@ class AutoRebuildOrchestrator:
         selected: CandidatePatch,
         prompt: str,
         report: ValidationReport,
-    ) -> ProvenanceMetadata:
+        signed_at: datetime,
+    ) -> tuple[ProvenanceMetadata, bytes]:
+        """Signed provenance plus its on-disk record, sharing a single serialization.
+
+        With ``sort_keys`` the ``signature`` key sorts after every signed field, so the
+        record is the signed bytes with the signature spliced in before the closing brace,
+        i.e. exactly ``json.dumps(provenance.__dict__, sort_keys=True)``.
+        """
         prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
         patch_digest = hashlib.sha256(selected.diff.encode("utf-8")).hexdigest()
         evaluation_report = report.as_dict()
-        created_at = datetime.now(timezone.utc).isoformat()
+        created_at = signed_at.isoformat()
 
         signed_payload = json.dumps(
             {
@@ -190,9 +231,12 @@ class AutoRebuildOrchestrator:
             sort_keys=True,
         ).encode("utf-8")
 
-        signature = hmac.new(self.signing_key, signed_payload, hashlib.sha256).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(signed_payload)
+        signature = mac.hexdigest()
+        record = signed_payload[:-1] + f', "signature": "{signature}"}}'.encode("ascii")
 
-        return ProvenanceMetadata(
+        provenance = ProvenanceMetadata(
             model_version=self.model_version,
             prompt_hash=prompt_hash,
             patch_digest=patch_digest,
@@ -200,24 +244,71 @@ class AutoRebuildOrchestrator:
             created_at=created_at,
             signature=signature,
         )
+        return provenance, record
 
-    def _persist_provenance(self, provenance: ProvenanceMetadata) -> Path:
+    def _persist_provenance(self, record: bytes, signed_at: datetime) -> Path:
         out_dir = self.repo_root / ".self_rebuild" / "provenance"
         out_dir.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        # Named after the same instant as created_at; %Y%m%dT%H%M%SZ without strftime.
+        ts = (
+            f"{signed_at.year:04d}{signed_at.month:02d}{signed_at.day:02d}"
+            f"T{signed_at.hour:02d}{signed_at.minute:02d}{signed_at.second:02d}Z"
+        )
         path = out_dir / f"{ts}.json"
-        path.write_text(json.dumps(provenance.__dict__, indent=2), encoding="utf-8")
+        # Write-then-rename so a crash never leaves a truncated provenance record behind.
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(record)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+        dir_fd = os.open(out_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
         return path
 
-    def _run(self, command: str) -> str:
+    def _worktree_tree(self) -> str:
+        """Tree id of the current worktree, untracked files included.
+
+        Deployed patches are applied without committing, so HEAD alone does not say what
+        the gates ran against. The tree is written through a scratch copy of the index
+        (reusing its stat cache), leaving the real index untouched.
+        """
+        index_path = Path(self._git("rev-parse", "--git-path", "index"))
+        if not index_path.is_absolute():
+            index_path = self.repo_root / index_path
+        with tempfile.TemporaryDirectory() as scratch:
+            scratch_index = Path(scratch) / "index"
+            if index_path.exists():
+                # copy2 keeps the index mtime, which git compares file mtimes against to
+                # re-hash "racily clean" entries; a fresh mtime would hide same-size edits.
+                shutil.copy2(index_path, scratch_index)
+            env = {**os.environ, "GIT_INDEX_FILE": str(scratch_index)}
+            # .self_rebuild holds this tool's own reports and caches, not gate inputs.
+            self._git("add", "-A", "--", ".", ":(exclude).self_rebuild", env=env)
+            return self._git("write-tree", env=env)
+
+    def _git(self, *args: str, stdin: str | None = None, env: dict[str, str] | None = None) -> str:
+        # argv form: no shell parse, and patch paths never need quoting.
+        command = ["git", *args]
         proc = subprocess.run(
             command,
-            shell=True,
+            input=stdin,
             cwd=self.repo_root,
+            env=env,
             text=True,
             capture_output=True,
             check=False,
         )
         if proc.returncode != 0:
-            raise RuntimeError(f"Command failed: {command}\n{proc.stdout}\n{proc.stderr}")
+            raise RuntimeError(f"Command failed: {' '.join(command)}\n{proc.stdout}\n{proc.stderr}")
         return ((proc.stdout or "") + (proc.stderr or "")).strip()
+
+    def _run(self, command: str) -> str:
+        # Deploy commands come from DeploymentConfig as shell strings.
+        returncode, output = run_shell(command, self.repo_root)
+        if returncode != 0:
+            raise RuntimeError(f"Command failed: {command}\n{output}")
+        return output
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 import hashlib
 from typing import Callable, Iterable, Sequence
 
+from .change_spec import utf8_size
+
 
 @dataclass(frozen=True)
 class ImprovementGoal:
@@ -35,12 +37,22 @@ class CandidatePatch:
 
 GeneratorFn = Callable[[ImprovementGoal, Sequence[TelemetrySnapshot]], str]
 
+DIFF_CACHE_SIZE = 128
+
 
 class PatchGenerator:
-    """Generates candidate diffs from goals and telemetry."""
+    """Generates candidate diffs from goals and telemetry.
 
-    def __init__(self, generator_fn: GeneratorFn):
+    With ``cache_diffs`` the generated diff is kept per (goal, telemetry digest), so a
+    later cycle with the same goal and unchanged telemetry reuses it instead of calling
+    the generator again. Off by default, since a sampling generator may legitimately
+    return a different diff for the same inputs.
+    """
+
+    def __init__(self, generator_fn: GeneratorFn, cache_diffs: bool = False):
         self._generator_fn = generator_fn
+        self.cache_diffs = cache_diffs
+        self._diffs: dict[tuple[ImprovementGoal, str], str] = {}
 
     def generate_candidates(
         self,
@@ -50,9 +62,12 @@ class PatchGenerator:
     ) -> list[CandidatePatch]:
         ranked_goals = sorted(goals, key=lambda g: g.priority, reverse=True)
         candidates: list[CandidatePatch] = []
+        telemetry_digest = _telemetry_digest(telemetry)
+        # One generation batch, one timestamp.
+        generated_at = datetime.now(timezone.utc).isoformat()
 
         for goal in ranked_goals[:max_candidates]:
-            diff = self._generator_fn(goal, telemetry).strip()
+            diff = self._generate(goal, telemetry, telemetry_digest)
             if not diff:
                 continue
             candidates.append(
@@ -61,13 +76,30 @@ class PatchGenerator:
                     summary=goal.description,
                     diff=diff,
                     confidence=self._estimate_confidence(goal, telemetry, diff),
-                    generated_at=datetime.now(timezone.utc).isoformat(),
-                    telemetry_digest=_telemetry_digest(telemetry),
+                    generated_at=generated_at,
+                    telemetry_digest=telemetry_digest,
                 )
             )
 
         return sorted(candidates, key=lambda c: c.confidence, reverse=True)
 
+    def _generate(
+        self,
+        goal: ImprovementGoal,
+        telemetry: Sequence[TelemetrySnapshot],
+        telemetry_digest: str,
+    ) -> str:
+        if not self.cache_diffs:
+            return self._generator_fn(goal, telemetry).strip()
+
+        key = (goal, telemetry_digest)
+        diff = self._diffs.get(key)
+        if diff is None:
+            if len(self._diffs) >= DIFF_CACHE_SIZE:
+                self._diffs.clear()
+            diff = self._diffs[key] = self._generator_fn(goal, telemetry).strip()
+        return diff
+
     @staticmethod
     def _estimate_confidence(
         goal: ImprovementGoal,
@@ -77,15 +109,19 @@ class PatchGenerator:
         # Deterministic, bounded confidence scoring.
         priority_boost = min(max(goal.priority / 10.0, 0.0), 0.3)
         telemetry_factor = min(len(telemetry) * 0.03, 0.3)
-        size_penalty = min(len(diff_text.encode("utf-8")) / 200_000.0, 0.4)
+        size_penalty = min(utf8_size(diff_text) / 200_000.0, 0.4)
         return round(max(0.05, 0.6 + priority_boost + telemetry_factor - size_penalty), 4)
 
 
 def _telemetry_digest(telemetry: Sequence[TelemetrySnapshot]) -> str:
-    payload = "|".join(
-        f"{item.metric_name}:{item.value}:{item.baseline}:{item.notes}" for item in telemetry
-    )
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    # Same digest as hashing the "|"-joined records, fed one record at a time.
+    digest = hashlib.sha256()
+    separator = b""
+    for item in telemetry:
+        digest.update(separator)
+        digest.update(f"{item.metric_name}:{item.value}:{item.baseline}:{item.notes}".encode("utf-8"))
+        separator = b"|"
+    return digest.hexdigest()
 
 
 def noop_generator(goal: ImprovementGoal, telemetry: Sequence[TelemetrySnapshot]) -> str:
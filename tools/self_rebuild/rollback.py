@@ -20,35 +20,44 @@ class RollbackManager:
         self.policy_path = policy_path
 
     def capture_last_known_good(self) -> RollbackSnapshot:
-        commit = self._git("rev-parse HEAD")
+        commit = self._git("rev-parse", "HEAD")
         backup_path: Path | None = None
 
         if self.policy_path and self.policy_path.exists():
             backup_path = self.repo_root / ".self_rebuild" / "policy.last_known_good"
-            backup_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(self.policy_path, backup_path)
+            if not _same_file_stat(self.policy_path, backup_path):
+                backup_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(self.policy_path, backup_path)
 
         return RollbackSnapshot(commit=commit, policy_backup_path=backup_path)
 
     def rollback(self, snapshot: RollbackSnapshot) -> None:
-        self._git(f"reset --hard {snapshot.commit}")
+        self._git("reset", "--hard", snapshot.commit)
 
         if self.policy_path and snapshot.policy_backup_path and snapshot.policy_backup_path.exists():
             shutil.copy2(snapshot.policy_backup_path, self.policy_path)
 
     def mark_last_known_good(self) -> str:
-        return self._git("rev-parse HEAD")
+        return self._git("rev-parse", "HEAD")
 
-    def _git(self, args: str) -> str:
-        cmd = f"git {args}"
+    def _git(self, *args: str) -> str:
+        cmd = ["git", *args]
         proc = subprocess.run(
             cmd,
-            shell=True,
             cwd=self.repo_root,
             text=True,
             capture_output=True,
             check=False,
         )
         if proc.returncode != 0:
-            raise RuntimeError(f"Command failed: {cmd}\n{proc.stderr}")
+            raise RuntimeError(f"Command failed: {' '.join(cmd)}\n{proc.stderr}")
         return (proc.stdout or "").strip()
+
+
+def _same_file_stat(source: Path, backup: Path) -> bool:
+    """True when ``backup`` is still the copy2 of ``source`` (copy2 keeps the mtime)."""
+    try:
+        source_stat, backup_stat = source.stat(), backup.stat()
+    except FileNotFoundError:
+        return False
+    return source_stat.st_size == backup_stat.st_size and source_stat.st_mtime_ns == backup_stat.st_mtime_ns
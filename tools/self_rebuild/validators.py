@@ -2,13 +2,85 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+import hashlib
 import json
+import os
+import shlex
+import signal
 import subprocess
+import sys
+import threading
 from pathlib import Path
 from typing import Iterable, Sequence
 
 
+VALIDATION_CACHE_SIZE = 128
+# Shell commands keep only this many trailing bytes of their combined stdout/stderr.
+OUTPUT_TAIL_BYTES = 64 * 1024
+# Persisted reports keep only the tail of each gate's output; failures print last.
+REPORT_OUTPUT_TAIL_CHARS = 64 * 1024
+
+
+def run_shell(
+    command: str,
+    cwd: Path,
+    tail_bytes: int = OUTPUT_TAIL_BYTES,
+    timeout: float | None = None,
+) -> tuple[int, str]:
+    """Run ``command`` through the shell; return its exit status and the tail of its output.
+
+    stderr is merged into stdout and read as raw bytes into a buffer trimmed to
+    ``tail_bytes``, so a noisy command cannot grow memory without bound. The kept
+    tail is decoded once at the end.
+
+    The command runs in its own session. Past ``timeout`` seconds the whole process
+    group is killed, so a wedged linter and anything it spawned cannot hang a cycle.
+    """
+    buffer = bytearray()
+    expired = threading.Event()
+    with subprocess.Popen(
+        command,
+        shell=True,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=True,
+    ) as proc:
+        watchdog = None
+        if timeout is not None:
+            watchdog = threading.Timer(timeout, _expire, (proc, expired))
+            watchdog.start()
+        try:
+            stdout = proc.stdout
+            assert stdout is not None
+            for chunk in iter(lambda: stdout.read(1 << 16), b""):
+                buffer += chunk
+                if len(buffer) > tail_bytes:
+                    del buffer[:-tail_bytes]
+            returncode = proc.wait()
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+    output = buffer.decode("utf-8", errors="replace").strip()
+    if expired.is_set():
+        output = f"{output}\n[timed out after {timeout}s]".lstrip()
+    return returncode, output
+
+
+def _expire(proc: subprocess.Popen, expired: threading.Event) -> None:
+    expired.set()
+    if os.name == "nt":
+        proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
 @dataclass(frozen=True)
 class GateResult:
     name: str
@@ -42,16 +114,101 @@ class ValidationReport:
             ],
         }
 
+    @classmethod
+    def from_dict(cls, payload: dict) -> "ValidationReport":
+        return cls(gates=[GateResult(**gate) for gate in payload.get("gates", [])])
+
 
 class ValidationError(RuntimeError):
     pass
 
 
+class ValidationCache:
+    """On-disk passing reports keyed by patch, worktree state and gate inputs.
+
+    Only passing reports are stored, so a failed (possibly flaky) gate run is always
+    repeated. Hits refresh the entry's mtime; past ``max_entries`` the least recently
+    used reports are evicted. ``version_commands`` (e.g. ``"ruff --version"``) are run
+    for every key so a tool upgrade invalidates reports produced by the old tool.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = VALIDATION_CACHE_SIZE,
+        version_commands: Sequence[str] = (),
+    ):
+        self.cache_dir = cache_dir
+        self.max_entries = max(1, max_entries)
+        self.version_commands = tuple(version_commands)
+
+    def key(
+        self,
+        *,
+        patch_digest: str,
+        head: str,
+        tree: str,
+        commands: Sequence[str],
+        repo_root: Path,
+    ) -> str:
+        """Digest of the patch, the commit and worktree tree it was applied to, and the gates.
+
+        ``tree`` identifies the whole worktree after the patch was applied, so the same
+        patch on top of other uncommitted (e.g. earlier deployed) changes gets a new key.
+        Command tokens naming a file under ``repo_root`` (gate scripts) contribute their
+        mtime, and the interpreter and ``version_commands`` output are folded in too.
+        """
+        digest = hashlib.sha256()
+        versions = [sys.version, sys.executable]
+        for command in self.version_commands:
+            returncode, output = run_shell(command, repo_root)
+            versions.append(f"{command}={returncode}:{output}")
+        for part in (patch_digest, head, tree, *commands, *versions):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        for command in commands:
+            try:
+                tokens = shlex.split(command)
+            except ValueError:
+                tokens = command.split()
+            for token in tokens:
+                path = repo_root / token
+                if path.is_file():
+                    digest.update(f"{token}:{path.stat().st_mtime_ns}\0".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> ValidationReport | None:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            report = ValidationReport.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        os.utime(path)
+        return report
+
+    def put(self, key: str, report: ValidationReport) -> None:
+        if not report.passed:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / f"{key}.json").write_text(json.dumps(report.as_dict()), encoding="utf-8")
+
+        entries = sorted(self.cache_dir.glob("*.json"), key=lambda entry: entry.stat().st_mtime_ns)
+        for stale in entries[: max(0, len(entries) - self.max_entries)]:
+            stale.unlink(missing_ok=True)
+
+
 class Validators:
-    """Mandatory gates for safe autonomous patch application."""
+    """Mandatory gates for safe autonomous patch application.
 
-    def __init__(self, repo_root: Path):
+    ``run_all`` runs the style, replay and save-compatibility gates concurrently on up to
+    ``cpu_count - 2`` threads (each just waits on its subprocess), then runs the
+    crash/perf budget gate alone so it measures an uncontended machine. Gates are
+    reported in the declared order.
+    """
+
+    def __init__(self, repo_root: Path, command_timeout: float | None = None):
         self.repo_root = repo_root
+        self.command_timeout = command_timeout
 
     def run_all(
         self,
@@ -63,9 +220,15 @@ class Validators:
     ) -> ValidationReport:
         report = ValidationReport()
 
-        report.add(self.run_style_lint_type(style_commands))
-        report.add(self.run_deterministic_replay(replay_command))
-        report.add(self.run_save_compatibility(save_compat_command))
+        workers = max(1, min(3, (os.cpu_count() or 1) - 2))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            gates = [
+                pool.submit(self.run_style_lint_type, style_commands),
+                pool.submit(self.run_deterministic_replay, replay_command),
+                pool.submit(self.run_save_compatibility, save_compat_command),
+            ]
+        for gate in gates:
+            report.add(gate.result())
         report.add(self.run_crash_perf_budget(crash_perf_command))
 
         return report
@@ -116,18 +279,18 @@ class Validators:
             output=out,
         )
 
-    def persist_report(self, report: ValidationReport, output_path: Path) -> None:
+    def persist_report(self, report: ValidationReport, output_path: Path, *, pretty: bool = False) -> None:
+        """Write ``report`` as JSON; ``pretty`` indents the file for humans.
+
+        Each gate's output is cut to its last ``REPORT_OUTPUT_TAIL_CHARS`` characters.
+        """
+        payload = report.as_dict()
+        for gate in payload["gates"]:
+            gate["output"] = gate["output"][-REPORT_OUTPUT_TAIL_CHARS:]
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(report.as_dict(), indent=2), encoding="utf-8")
+        with output_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2 if pretty else None)
+            handle.write("\n")
 
     def _run(self, command: str) -> tuple[int, str]:
-        proc = subprocess.run(
-            command,
-            shell=True,
-            cwd=self.repo_root,
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        output = (proc.stdout or "") + (proc.stderr or "")
-        return proc.returncode, output.strip()
+        return run_shell(command, self.repo_root, timeout=self.command_timeout)